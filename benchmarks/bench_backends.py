@@ -0,0 +1,76 @@
+"""
+Compares the classic WebDriver backend with the CDP websocket backend (utils.cdp_driver) on the
+page-object operations of bench_pages, side by side.
+
+Both backends drive the same kind of browser (same launch profile and page-load strategy) against
+the local stand-in; each case runs --iterations times per backend.
+
+Usage (from the project root):
+    python -m benchmarks.bench_backends
+    python -m benchmarks.bench_backends -k cart --iterations 50
+"""
+import argparse
+import json
+import sys
+from benchmarks.bench_pages import CASES, PORT, RESULTS_DIR, USER, run_case
+from pages.login_page import LoginPage
+from utils.browser_setup import launch_chrome, prepare_driver
+from utils.cdp_driver import BACKENDS, wrap_backend
+from utils.config import BASE_URL
+from utils.local_app import LocalApp
+
+
+def run_backend(backend: str, cases, iterations: int, warmup: int, page_load_strategy: str):
+    """
+    Runs the given cases in one browser driven through the given backend.
+
+    Returns:
+        dict: Case name -> run_case() result.
+    """
+    driver = prepare_driver(wrap_backend(launch_chrome(page_load_strategy=page_load_strategy), backend))
+    results = {}
+    try:
+        driver.get(BASE_URL)
+        LoginPage(driver).login_via_session(**USER)
+        for name in cases:
+            setup, operation = CASES[name]
+            results[name] = run_case(driver, setup, operation, iterations, warmup)
+    finally:
+        driver.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("-k", dest="keyword", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--page-load-strategy", choices=("normal", "eager", "none"), default="eager")
+    args = parser.parse_args()
+
+    cases = [name for name in CASES if args.keyword in name]
+    app = LocalApp("127.0.0.1", PORT).start()
+    try:
+        results = {
+            backend: run_backend(backend, cases, args.iterations, args.warmup, args.page_load_strategy)
+            for backend in BACKENDS
+        }
+    finally:
+        app.stop()
+
+    classic, cdp = results["classic"], results["cdp"]
+    print(f"{'case':<28}{'classic p50':>12}{'cdp p50':>10}{'speedup':>9}{'classic p95':>13}{'cdp p95':>10}{'cmds':>6}")
+    for name in cases:
+        speedup = classic[name]["p50_ms"] / cdp[name]["p50_ms"] if cdp[name]["p50_ms"] else 0.0
+        print(
+            f"{name:<28}{classic[name]['p50_ms']:>12.2f}{cdp[name]['p50_ms']:>10.2f}{speedup:>8.2f}x"
+            f"{classic[name]['p95_ms']:>13.2f}{cdp[name]['p95_ms']:>10.2f}{classic[name]['commands_per_op']:>6}"
+        )
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    (RESULTS_DIR / "backends-latest.json").write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Compares per-test login setup time: LoginPage.login (form) vs LoginPage.login_via_session (cookie).
+
+Usage (from the project root):
+    python -m benchmarks.bench_login --iterations 20
+"""
+import argparse
+import statistics
+import time
+from pages.login_page import LoginPage
+from utils.browser_setup import create_driver
+from utils.config import BASE_URL, TestUsers
+
+
+def time_setup(driver, login_method, iterations):
+    """
+    Measures the fixture-equivalent setup: clean session, open BASE_URL, log in, land on inventory.
+
+    Args:
+        driver (WebDriver): Browser reused for every iteration.
+        login_method (str): Name of the LoginPage method to be measured.
+        iterations (int): Number of measured logins.
+
+    Returns:
+        list[float]: Setup durations in seconds.
+    """
+    durations = []
+    for _ in range(iterations):
+        driver.delete_all_cookies()
+        start = time.perf_counter()
+        driver.get(BASE_URL)
+        getattr(LoginPage(driver), login_method)(**TestUsers.standard)
+        assert driver.current_url == f"{BASE_URL}inventory.html", f"{login_method} did not reach inventory"
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    driver = create_driver()
+    try:
+        results = {method: time_setup(driver, method, args.iterations) for method in ("login", "login_via_session")}
+    finally:
+        driver.quit()
+
+    print(f"{'setup':<20}{'mean ms':>10}{'median ms':>12}{'max ms':>10}")
+    for method, durations in results.items():
+        print(
+            f"{method:<20}{statistics.mean(durations) * 1000:>10.1f}"
+            f"{statistics.median(durations) * 1000:>12.1f}{max(durations) * 1000:>10.1f}"
+        )
+    speedup = statistics.mean(results["login"]) / statistics.mean(results["login_via_session"])
+    print(f"login_via_session is {speedup:.1f}x faster per test setup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Benchmarks page-object operations against the bundled local stand-in (offline, headless Chrome).
+
+Every operation runs --iterations times in one browser; the report lists ops/sec, latency
+percentiles and WebDriver commands per operation. Results are written to benchmarks/results/
+and compared with benchmarks/baseline.json when it exists.
+
+Usage (from the project root):
+    python -m benchmarks.bench_pages                      # run and compare with the baseline
+    python -m benchmarks.bench_pages --save-baseline      # run and store the result as the new baseline
+    python -m benchmarks.bench_pages -k cart --iterations 50
+    python -m benchmarks.bench_pages --page-load-strategy eager   # navigation cost per strategy
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def _reserve_local_base_url():
+    # BASE_URL is read at import time, so the stand-in address has to be in the environment first
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    os.environ["SAUCEDEMO_BASE_URL"] = f"http://127.0.0.1:{port}/"
+    return port
+
+
+PORT = _reserve_local_base_url()
+
+from pages.cart_page import Cart  # noqa: E402
+from pages.login_page import LoginPage  # noqa: E402
+from pages.product_details_page import ProductDetails  # noqa: E402
+from pages.products_page import ProductsPage  # noqa: E402
+from utils.browser_setup import create_driver  # noqa: E402
+from utils.config import BASE_URL  # noqa: E402
+from utils.cart_state import seed_cart  # noqa: E402
+from utils.local_app import LocalApp  # noqa: E402
+from utils.product_data import PRODUCT_IDS  # noqa: E402
+from utils.webdriver_commands import count_commands  # noqa: E402
+
+BENCH_DIR = Path(__file__).parent
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+USER = {"username": "standard_user", "password": "secret_sauce"}
+PRODUCT = PRODUCT_IDS[0]
+
+
+def _fresh_login_page(driver):
+    driver.delete_all_cookies()
+    driver.get(BASE_URL)
+    LoginPage(driver).wait_until_ready()
+
+
+def _inventory(driver):
+    ProductsPage(driver).open()
+
+
+def _empty_cart_inventory(driver):
+    driver.execute_script("window.localStorage.clear();")
+    _inventory(driver)
+
+
+def _product_in_cart(driver):
+    _empty_cart_inventory(driver)
+    ProductsPage(driver).add_to_cart(PRODUCT)
+
+
+# name -> (setup run before every iteration, untimed; measured operation)
+CASES = {
+    "login_form": (_fresh_login_page, lambda driver: LoginPage(driver).login(**USER)),
+    "login_via_session": (_fresh_login_page, lambda driver: LoginPage(driver).login_via_session(**USER)),
+    "add_to_cart": (_empty_cart_inventory, lambda driver: ProductsPage(driver).add_to_cart(PRODUCT)),
+    "fill_cart_clicks": (
+        _empty_cart_inventory,
+        lambda driver: [ProductsPage(driver).add_to_cart(product_id) for product_id in PRODUCT_IDS],
+    ),
+    "fill_cart_seeded": (_empty_cart_inventory, lambda driver: seed_cart(driver, PRODUCT_IDS)),
+    "remove_from_cart": (_product_in_cart, lambda driver: ProductsPage(driver).remove_from_cart(PRODUCT)),
+    "is_in_cart_absent": (_empty_cart_inventory, lambda driver: ProductsPage(driver).is_in_cart(PRODUCT)),
+    "sort_za": (_inventory, lambda driver: ProductsPage(driver).sort_za()),
+    "capture_names": (_inventory, lambda driver: ProductsPage(driver).capture_all_products_name()),
+    "capture_prices": (_inventory, lambda driver: ProductsPage(driver).capture_all_products_price()),
+    "open_product_details": (_inventory, lambda driver: ProductsPage(driver).open_product_details(PRODUCT)),
+    "open_product_details_direct": (_inventory, lambda driver: ProductDetails(driver).open(PRODUCT)),
+    "open_cart": (_inventory, lambda driver: ProductsPage(driver).open_cart()),
+    "open_cart_direct": (_inventory, lambda driver: Cart(driver).open()),
+    "back_to_products": (
+        lambda driver: ProductDetails(driver).open(PRODUCT),
+        lambda driver: ProductDetails(driver).click_back_to_products(),
+    ),
+    "capture_product_img": (_inventory, lambda driver: ProductsPage(driver).capture_product_img(PRODUCT)),
+    "details_capture_name": (
+        lambda driver: ProductDetails(driver).open(PRODUCT),
+        lambda driver: ProductDetails(driver).capture_product_name(),
+    ),
+}
+
+
+def percentile(sorted_values, fraction):
+    """
+    Returns the value at the given fraction (0-1) of an already sorted list (nearest rank).
+    """
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_case(driver, setup, operation, iterations, warmup):
+    """
+    Runs one benchmark case.
+
+    Returns:
+        dict: ops_per_sec, mean/p50/p95/p99 latency in milliseconds and commands per operation.
+    """
+    durations = []
+    commands = 0
+    for iteration in range(warmup + iterations):
+        setup(driver)
+        with count_commands(driver) as counter:
+            start = time.perf_counter()
+            operation(driver)
+            duration = time.perf_counter() - start
+        if iteration >= warmup:
+            durations.append(duration)
+            commands += counter.count
+
+    durations.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(len(durations) / sum(durations), 2),
+        "mean_ms": round(statistics.mean(durations) * 1000, 3),
+        "p50_ms": round(percentile(durations, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(durations, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(durations, 0.99) * 1000, 3),
+        "commands_per_op": round(commands / iterations, 2),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints each case next to the baseline and returns the names of regressed cases.
+
+    A case regresses when its p50 latency grows by more than threshold percent
+    or it needs more WebDriver commands per operation.
+    """
+    regressions = []
+    print(f"\n{'case':<24}{'p50 ms':>10}{'base':>10}{'delta':>9}{'cmds':>7}{'base':>7}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<24}{result['p50_ms']:>10.2f}{'-':>10}{'new':>9}{result['commands_per_op']:>7}{'-':>7}")
+            continue
+        delta = (result["p50_ms"] - base["p50_ms"]) / base["p50_ms"] * 100 if base["p50_ms"] else 0.0
+        regressed = delta > threshold or result["commands_per_op"] > base["commands_per_op"]
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<24}{result['p50_ms']:>10.2f}{base['p50_ms']:>10.2f}{delta:>+8.1f}%"
+            f"{result['commands_per_op']:>7}{base['commands_per_op']:>7}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("-k", dest="keyword", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--threshold", type=float, default=15.0, help="allowed p50 slowdown in percent")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--page-load-strategy", choices=("normal", "eager", "none"), default="normal")
+    args = parser.parse_args()
+
+    app = LocalApp("127.0.0.1", PORT).start()
+    driver = create_driver(page_load_strategy=args.page_load_strategy)
+    results = {}
+    try:
+        driver.get(BASE_URL)
+        LoginPage(driver).login_via_session(**USER)
+        for name, (setup, operation) in CASES.items():
+            if args.keyword not in name:
+                continue
+            # login cases clear cookies in setup but end logged in, so later cases keep a session
+            result = results[name] = run_case(driver, setup, operation, args.iterations, args.warmup)
+            print(
+                f"{name:<24}{result['ops_per_sec']:>9.1f} ops/s  p50 {result['p50_ms']:>8.2f} ms  "
+                f"p95 {result['p95_ms']:>8.2f} ms  {result['commands_per_op']:>5} cmds/op"
+            )
+    finally:
+        driver.quit()
+        app.stop()
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    for path in (RESULTS_DIR / f"{stamp}.json", RESULTS_DIR / "latest.json"):
+        path.write_text(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(results, indent=2))
+        print(f"\nbaseline saved to {BASELINE_FILE}")
+        return 0
+    if not BASELINE_FILE.exists():
+        print(f"\nno baseline yet, run with --save-baseline to create {BASELINE_FILE}")
+        return 0
+    regressions = compare(results, json.loads(BASELINE_FILE.read_text()), args.threshold)
+    if regressions:
+        print(f"\nregressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Measures cold browser start per launch profile: chromedriver + Chrome launch, then the first page
+(login form of the local stand-in) ready for interaction.
+
+Every launch is a fresh process pair, run in a round-robin over the selected profiles so that
+disk cache and CPU frequency effects are spread evenly.
+
+Usage (from the project root):
+    python -m benchmarks.bench_startup                       # all headless profiles, 10 launches each
+    python -m benchmarks.bench_startup --profiles fast-ci faithful --launches 20
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from benchmarks.bench_pages import PORT, RESULTS_DIR, percentile
+from pages.login_page import LoginPage
+from utils.browser_setup import create_driver
+from utils.config import BASE_URL
+from utils.launch_profiles import PROFILES
+from utils.local_app import LocalApp
+
+
+def cold_start(profile: str):
+    """
+    Launches one browser with the given profile, opens BASE_URL and waits for the login form.
+
+    Returns:
+        tuple[float, float]: (launch seconds, first page seconds).
+    """
+    start = time.perf_counter()
+    driver = create_driver(profile=profile)
+    launched = time.perf_counter()
+    try:
+        driver.get(BASE_URL)
+        LoginPage(driver).wait_until_ready()
+        ready = time.perf_counter()
+    finally:
+        driver.quit()
+    return launched - start, ready - launched
+
+
+def main():
+    headless = sorted(name for name, profile in PROFILES.items() if profile.headless)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=headless)
+    parser.add_argument("--launches", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1, help="untimed launches per profile (fills the OS file cache)")
+    args = parser.parse_args()
+
+    app = LocalApp("127.0.0.1", PORT).start()
+    samples = {profile: [] for profile in args.profiles}
+    try:
+        for round_number in range(args.warmup + args.launches):
+            for profile in args.profiles:
+                launch, first_page = cold_start(profile)
+                if round_number >= args.warmup:
+                    samples[profile].append((launch, first_page))
+    finally:
+        app.stop()
+
+    results = {}
+    print(f"{'profile':<12}{'launch p50':>12}{'page p50':>10}{'total p50':>11}{'total p95':>11}{'total mean':>12}")
+    for profile, pairs in samples.items():
+        totals = sorted(launch + page for launch, page in pairs)
+        result = results[profile] = {
+            "launches": len(pairs),
+            "launch_p50_ms": round(statistics.median(launch for launch, _ in pairs) * 1000, 1),
+            "first_page_p50_ms": round(statistics.median(page for _, page in pairs) * 1000, 1),
+            "total_p50_ms": round(statistics.median(totals) * 1000, 1),
+            "total_p95_ms": round(percentile(totals, 0.95) * 1000, 1),
+            "total_mean_ms": round(statistics.mean(totals) * 1000, 1),
+        }
+        print(
+            f"{profile:<12}{result['launch_p50_ms']:>12.0f}{result['first_page_p50_ms']:>10.0f}"
+            f"{result['total_p50_ms']:>11.0f}{result['total_p95_ms']:>11.0f}{result['total_mean_ms']:>12.0f}"
+        )
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    (RESULTS_DIR / "startup-latest.json").write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+from contextlib import contextmanager
+from utils.page_driver import PageDriver   # classic WebDriver or CdpDriver, import to have intellisense inside methods
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from utils.config import DEFAULT_TIMEOUT
+
+
+class BasePage:
+    """
+    Common element lookups for all page objects, built on explicit waits.
+
+    Positive lookups (find, click) poll until the element shows up or the per-call timeout expires.
+    Negative checks (is_present, is_displayed) look once and return immediately, so asking
+    "is it gone?" does not burn the driver's implicit wait.
+
+    Each page declares READY_LOCATOR, the element that shows it finished rendering. Navigation
+    methods wait on the target page's readiness instead of relying on the browser's load event,
+    which makes them safe with the 'eager' and 'none' page-load strategies.
+    """
+    # how often explicit waits re-check the DOM (seconds)
+    POLL_FREQUENCY = 0.05
+    # element present once the page is usable (None: no readiness condition)
+    READY_LOCATOR = None
+
+    def __init__(self, driver: PageDriver):
+        """
+        Initializes the page object.
+
+        :param driver: Selenium WebDriver or CdpDriver instance (utils.page_driver.PageDriver)
+        """
+        self.driver = driver
+
+    @contextmanager
+    def _implicit_wait_suspended(self):
+        """
+        Sets the implicit wait to zero for the duration of the block and restores DEFAULT_TIMEOUT afterwards.
+        """
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(DEFAULT_TIMEOUT)
+
+    def find(self, locator, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Waits for an element to be present in the DOM and returns it.
+
+        :param locator: Tuple of By and value
+        :param timeout: Maximum time to wait in seconds
+        :return: WebElement
+        :raises NoSuchElementException: If the element did not appear within the timeout
+        """
+        with self._implicit_wait_suspended():
+            try:
+                return WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY).until(
+                    EC.presence_of_element_located(locator)
+                )
+            except TimeoutException:
+                raise NoSuchElementException(f"Element {locator} not found within {timeout}s")
+
+    def find_all(self, locator):
+        """
+        Returns all elements currently matching the locator, without waiting.
+
+        :param locator: Tuple of By and value
+        :return: List of WebElements (empty if none match)
+        """
+        with self._implicit_wait_suspended():
+            return self.driver.find_elements(*locator)
+
+    def click(self, locator, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Waits for an element to be clickable and clicks it.
+
+        :param locator: Tuple of By and value
+        :param timeout: Maximum time to wait in seconds
+        :raises NoSuchElementException: If the element was not clickable within the timeout
+        """
+        with self._implicit_wait_suspended():
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY).until(
+                    EC.element_to_be_clickable(locator)
+                ).click()
+            except TimeoutException:
+                raise NoSuchElementException(f"Element {locator} not clickable within {timeout}s")
+
+    def is_present(self, locator):
+        """
+        Checks once whether an element exists in the DOM.
+
+        :param locator: Tuple of By and value
+        :return: True if at least one element matches, False otherwise
+        """
+        return bool(self.find_all(locator))
+
+    def is_displayed(self, locator):
+        """
+        Checks once whether an element exists and is visible.
+
+        :param locator: Tuple of By and value
+        :return: True if the first matching element is displayed, False otherwise
+        """
+        elements = self.find_all(locator)
+        try:
+            return bool(elements) and elements[0].is_displayed()
+        except StaleElementReferenceException:
+            return False
+
+    def open_url(self, url: str, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Loads the URL directly (no click path) and waits for this page to be ready.
+
+        :param url: Absolute URL of this page
+        :param timeout: Maximum time to wait for readiness in seconds
+        :raises TimeoutException: If the page did not become ready within the timeout
+        """
+        self.driver.get(url)
+        self.wait_until_ready(timeout)
+
+    def wait_until_ready(self, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Waits until the page's READY_LOCATOR is present.
+
+        Raising here makes a page that never renders fail at the navigation, instead of stalling
+        silently and failing later with an unrelated lookup error.
+
+        :param timeout: Maximum time to wait in seconds
+        :raises TimeoutException: If the page did not become ready within the timeout
+        """
+        if self.READY_LOCATOR is None:
+            return
+        try:
+            self.find(self.READY_LOCATOR, timeout)
+        except NoSuchElementException:
+            raise TimeoutException(
+                f"{type(self).__name__} not ready within {timeout}s: {self.READY_LOCATOR} not found "
+                f"(at {self.driver.current_url})"
+            )
+
+    def wait_until_absent(self, locator, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Waits until no element matches the locator.
+
+        :param locator: Tuple of By and value
+        :param timeout: Maximum time to wait in seconds
+        :return: True if the element disappeared within the timeout, False otherwise
+        """
+        with self._implicit_wait_suspended():
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY).until_not(
+                    lambda driver: driver.find_elements(*locator)
+                )
+                return True
+            except TimeoutException:
+                return False
@@ -1,8 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver   # import to have intellisense inside methods
+from utils.page_driver import PageDriver   # classic WebDriver or CdpDriver, import to have intellisense inside methods
 from selenium.common.exceptions import NoSuchElementException
+from pages import products_page
+from pages.base_page import BasePage
+from utils.navigation import CART_URL
 
-class Cart:
+class Cart(BasePage):
     """
     Represents the shopping cart page of an e-commerce website.
 
@@ -12,20 +15,31 @@ class Cart:
     # Locators:
     CONTINUE_SHOPPING_BTN = (By.ID, "continue-shopping")
     CHECKOUT_BTN = (By.ID, "checkout")
+    READY_LOCATOR = CHECKOUT_BTN
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: PageDriver):
         """
         Initializes the Cart object.
 
-        :param driver: Selenium WebDriver instance
+        :param driver: Selenium WebDriver or CdpDriver instance (utils.page_driver.PageDriver)
         """
         self.driver = driver
 
+    def open(self):
+        """
+        Opens the cart page directly by URL.
+
+        :raises TimeoutException: If the cart page does not render
+        """
+        self.open_url(CART_URL)
+
     def return_to_products_page(self):
         """
-        Clicks on the 'Continue Shopping' button to navigate back to the products page.
+        Clicks on the 'Continue Shopping' button to navigate back to the products page
+        and waits for the products to be rendered.
         """
-        self.driver.find_element(*self.CONTINUE_SHOPPING_BTN).click()
+        self.click(self.CONTINUE_SHOPPING_BTN)
+        products_page.ProductsPage(self.driver).wait_until_ready()
 
     # helper method to dynamically get the locators
     def _remove_from_cart_locator(self, product_id: str):
@@ -44,11 +58,8 @@ class Cart:
         :param product_id: Unique identifier for the product
         :return: True if the product is in the cart, False otherwise
         """
-        try:
-            # returning if remove button is displayed
-            return self.driver.find_element(*self._remove_from_cart_locator(product_id)).is_displayed()
-        except NoSuchElementException:
-            return False
+        # returning if remove button is displayed, without waiting for it
+        return self.is_displayed(self._remove_from_cart_locator(product_id))
 
     def remove_from_cart(self, product_id: str):
         """
@@ -58,7 +69,7 @@ class Cart:
         :return: True if successful, False if the product is not found
         """
         try:
-            self.driver.find_element(*self._remove_from_cart_locator(product_id)).click()
+            self.click(self._remove_from_cart_locator(product_id))
         except NoSuchElementException:
             return False
 
@@ -66,4 +77,4 @@ class Cart:
         """
         Clicks on the checkout button.
         """
-        self.driver.find_element(*self.CHECKOUT_BTN).click()
\ No newline at end of file
+        self.click(self.CHECKOUT_BTN)
\ No newline at end of file
@@ -1,9 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver   # import to have intellisense inside methods
-from selenium.common.exceptions import NoSuchElementException
+from utils.page_driver import PageDriver   # classic WebDriver or CdpDriver, import to have intellisense inside methods
+from pages.base_page import BasePage
+from pages.products_page import ProductsPage
 
 
-class LoginPage:
+class LoginPage(BasePage):
     """
     A class representing the login page of a web application.
 
@@ -14,12 +15,15 @@ class LoginPage:
     PASSWORD_INPUT = (By.ID, "password")
     LOGIN_BUTTON = (By.ID, "login-button")
     LOGIN_ERROR_MESSAGE = (By.CSS_SELECTOR, "h3[data-test='error']")
+    # cookie the app sets after a successful login, holding the username
+    SESSION_COOKIE = "session-username"
+    READY_LOCATOR = LOGIN_BUTTON
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: PageDriver):
         """
         Initialize the LoginPage object.
 
-        :param driver: The Selenium WebDriver instance used for interacting with the web page.
+        :param driver: The Selenium WebDriver or CdpDriver instance used for interacting with the web page.
         """
         self.driver = driver
 
@@ -30,11 +34,28 @@ class LoginPage:
         :param username: The username to be entered.
         :param password: The password to be entered.
         """
-        self.driver.find_element(*self.USERNAME_INPUT).clear()
-        self.driver.find_element(*self.USERNAME_INPUT).send_keys(username)
-        self.driver.find_element(*self.PASSWORD_INPUT).clear()
-        self.driver.find_element(*self.PASSWORD_INPUT).send_keys(password)
-        self.driver.find_element(*self.LOGIN_BUTTON).click()
+        username_input = self.find(self.USERNAME_INPUT)
+        username_input.clear()
+        username_input.send_keys(username)
+        password_input = self.find(self.PASSWORD_INPUT)
+        password_input.clear()
+        password_input.send_keys(password)
+        self.click(self.LOGIN_BUTTON)
+
+    def login_via_session(self, username, password=None):
+        """
+        Log in without the form by seeding the app's session cookie, then open the inventory page.
+
+        Intended for tests that need a logged-in user but do not test the login itself.
+        The browser has to be on the app origin already (the driver fixture lands on BASE_URL).
+
+        :param username: The username to be stored in the session cookie.
+        :param password: Ignored, accepted so credential dicts from TestUsers can be unpacked.
+        """
+        # with the 'none' page-load strategy the fixture's navigation may still be in flight
+        self.wait_until_ready()
+        self.driver.add_cookie({"name": self.SESSION_COOKIE, "value": username, "path": "/"})
+        ProductsPage(self.driver).open()
 
     def get_login_error_message(self):
         """
@@ -42,7 +63,6 @@ class LoginPage:
 
         :return: The error message text if an error is present, otherwise an empty string.
         """
-        try:
-            return self.driver.find_element(*self.LOGIN_ERROR_MESSAGE).text
-        except NoSuchElementException:
-            return ""
+        # the error is rendered synchronously by the login click, so a single look is enough
+        errors = self.find_all(self.LOGIN_ERROR_MESSAGE)
+        return errors[0].text if errors else ""
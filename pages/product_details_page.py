@@ -1,13 +1,17 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver   # import to have intellisense inside methods
+from utils.page_driver import PageDriver   # classic WebDriver or CdpDriver, import to have intellisense inside methods
 from selenium.common.exceptions import NoSuchElementException
+from pages import products_page
+from pages.base_page import BasePage
+from utils.navigation import product_details_url
+from utils.product_data import CATALOG
 
-class ProductDetails:
+class ProductDetails(BasePage):
     """
     Represents the product details page on the website.
 
     Attributes:
-        driver (WebDriver): The Selenium WebDriver instance.
+        driver (PageDriver): The Selenium WebDriver or CdpDriver instance.
     """
     # Locators:
     PRODUCT_ITEM = (By.CLASS_NAME, "inventory_item_container")
@@ -16,16 +20,29 @@ class ProductDetails:
     BACK_TO_PRODUCTS_BTN = (By.ID, "back-to-products")
     ADD_TO_CART_BTN = (By.ID, "add-to-cart")
     REMOVE_BTN = (By.ID, "remove")
+    READY_LOCATOR = BACK_TO_PRODUCTS_BTN
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: PageDriver):
         """
         Initializes the ProductDetails class with a WebDriver instance.
 
         Args:
-            driver (WebDriver): The WebDriver instance to be used for interactions.
+            driver (PageDriver): The WebDriver or CdpDriver instance to be used for interactions.
         """
         self.driver = driver
 
+    def open(self, product_id: str):
+        """
+        Opens the details page of a product directly by URL.
+
+        Args:
+            product_id (str): The product ID to be opened.
+
+        Raises:
+            TimeoutException: If the details page does not render.
+        """
+        self.open_url(product_details_url(product_id))
+
     def is_on_product_details_page(self):
         """
         Checks if the current page URL indicates that the user is on a product details page.
@@ -42,20 +59,21 @@ class ProductDetails:
         Returns:
             str: The normalized product name.
         """
-        product_name = self.driver.find_element(*self.PRODUCT_DETAILS_NAME).text
-        return product_name.lower().replace(" ", "-")
+        product_name = self.find(self.PRODUCT_DETAILS_NAME).text
+        return CATALOG.product_id_for(product_name)
 
     def click_back_to_products(self):
         """
-        Clicks on the back to products button.
+        Clicks on the back to products button and waits for the products to be rendered.
         """
-        self.driver.find_element(*self.BACK_TO_PRODUCTS_BTN).click()
+        self.click(self.BACK_TO_PRODUCTS_BTN)
+        products_page.ProductsPage(self.driver).wait_until_ready()
 
     def add_to_cart(self):
         """
         Adds an item to the shopping cart.
         """
-        self.driver.find_element(*self.ADD_TO_CART_BTN).click()
+        self.click(self.ADD_TO_CART_BTN)
 
     def is_in_cart(self):
         """
@@ -64,10 +82,7 @@ class ProductDetails:
         Returns:
             bool: True if the item is in the cart, False otherwise.
         """
-        try:
-            return self.driver.find_element(*self.REMOVE_BTN).is_displayed()
-        except NoSuchElementException:
-            return False
+        return self.is_displayed(self.REMOVE_BTN)
 
     def remove_from_cart(self):
         """
@@ -77,7 +92,7 @@ class ProductDetails:
             bool: True if the removal is successful, False if the item is not found.
         """
         try:
-            self.driver.find_element(*self.REMOVE_BTN).click()
+            self.click(self.REMOVE_BTN)
         except NoSuchElementException:
             return False
 
@@ -89,10 +104,11 @@ class ProductDetails:
         :return: A tuple containing the product name and price.
         :raises ValueError: If the product with the specified ID is not found.
         """
-        products = self.driver.find_elements(*self.PRODUCT_ITEM)
+        self.find(self.PRODUCT_ITEM)
+        products = self.find_all(self.PRODUCT_ITEM)
 
         for product in products:
-            name = product.find_element(*self.PRODUCT_DETAILS_NAME).text.lower().replace(" ", "-")
+            name = CATALOG.product_id_for(product.find_element(*self.PRODUCT_DETAILS_NAME).text)
             price = product.find_element(*self.PRODUCT_DETAILS_PRICE).text.replace("$", "")
             if name == product_id:
                 return name, price
@@ -106,15 +122,14 @@ class ProductDetails:
         :param product_id: Unique identifier for the product
         :return: Tuple containing WebElement representing the product image and its src attribute
         """
-        from utils.product_data import PRODUCT_NAMES
-
         # Get the exact display name for this product ID
-        expected_alt_text = PRODUCT_NAMES.get(product_id)
+        product = CATALOG.by_id.get(product_id)
+        expected_alt_text = product.name if product is not None else None
 
         try:
             # XPath to find the img element with matching alt text
             xpath_direct = f"//img[@alt='{expected_alt_text}']"
-            img = self.driver.find_element(By.XPATH, xpath_direct)
+            img = self.find((By.XPATH, xpath_direct))
             return img, img.get_attribute("src")
         except NoSuchElementException:
             raise NoSuchElementException(f"No product image with alt text '{expected_alt_text}' found")
\ No newline at end of file
@@ -1,10 +1,36 @@
+from typing import NamedTuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.remote.webdriver import WebDriver   # import to have intellisense inside methods
+from utils.page_driver import PageDriver   # classic WebDriver or CdpDriver, import to have intellisense inside methods
 from selenium.common.exceptions import NoSuchElementException
+# module imports: cart_page and product_details_page import this module back
+from pages import cart_page, product_details_page
+from pages.base_page import BasePage
+from utils.navigation import INVENTORY_URL
+from utils.product_data import CATALOG, Catalog, Product, normalize_name
 
 
-class ProductsPage:
+class InventoryItem(NamedTuple):
+    """
+    Snapshot of one product card on the products page.
+
+    Attributes:
+        product_id (str): Normalized product name, same format as utils.product_data.PRODUCT_IDS.
+        name (str): Display name as shown on the page.
+        price (str): Price without the currency sign, e.g. "29.99".
+        img_src (str): Absolute URL of the product image.
+        in_cart (bool): True if the card shows the 'Remove' button.
+        item_id (int): Numeric item id from the card's title link, None if the link has no id.
+    """
+    product_id: str
+    name: str
+    price: str
+    img_src: str
+    in_cart: bool
+    item_id: int = None
+
+
+class ProductsPage(BasePage):
     """
     Represents the products page of the website.
 
@@ -21,20 +47,51 @@ class ProductsPage:
     PRODUCT_PRICE_ELEMENTS = (By.CLASS_NAME, "inventory_item_price")
     # keep it resilient that is why partial link text if change to 'Visit our LinkedIn' would be made
     LINKEDIN_LINK = (By.PARTIAL_LINK_TEXT, "LinkedIn")
+    # the grid is rendered in one go, so its first card means the whole inventory is there
+    READY_LOCATOR = (By.CSS_SELECTOR, ".inventory_list .inventory_item")
+
+    # reads every product card in a single WebDriver round trip: [name, price, img src, button id, title link id] per card
+    INVENTORY_SCRIPT = """
+        // bound here: inside the map callback `arguments` is the callback's (item, index, array)
+        var itemClass = arguments[0], nameClass = arguments[1], priceClass = arguments[2];
+        return Array.from(document.getElementsByClassName(itemClass)).map(function (item) {
+            var name = item.getElementsByClassName(nameClass)[0];
+            var price = item.getElementsByClassName(priceClass)[0];
+            var img = item.querySelector("img");
+            var button = item.querySelector("button");
+            var link = item.querySelector("a[id$='_title_link']");
+            return [
+                name ? name.textContent.trim() : "",
+                price ? price.textContent.trim() : "",
+                img ? img.src : "",
+                button ? button.id : "",
+                link ? link.id : ""
+            ];
+        });
+    """
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: PageDriver):
         """
         Initializes the ProductsPage object.
 
-        :param driver: Selenium WebDriver instance
+        :param driver: Selenium WebDriver or CdpDriver instance (utils.page_driver.PageDriver)
         """
         self.driver = driver
 
+    def open(self):
+        """
+        Opens the products page directly by URL.
+
+        :raises TimeoutException: If the products are not rendered
+        """
+        self.open_url(INVENTORY_URL)
+
     def open_cart(self):
         """
-        Clicks on the shopping cart button to open the cart.
+        Clicks on the shopping cart button to open the cart and waits for the cart page.
         """
-        self.driver.find_element(*self.SHOPPING_CART_BTN).click()
+        self.click(self.SHOPPING_CART_BTN)
+        cart_page.Cart(self.driver).wait_until_ready()
 
     def cart_badge_count(self):
         """
@@ -42,12 +99,9 @@ class ProductsPage:
 
         :return: Number of items in the cart, or 0 if the badge is not found
         """
-        try:
-            # needs to be dynamic to fetch fresh DOM each increment
-            badge = self.driver.find_element(*self.SHOPPING_CART_BADGE)
-            return int(badge.text)
-        except NoSuchElementException:
-            return 0
+        # needs to be dynamic to fetch fresh DOM each increment; an empty cart has no badge at all
+        badges = self.find_all(self.SHOPPING_CART_BADGE)
+        return int(badges[0].text) if badges else 0
 
     # helper method to dynamically get the locators
     def _add_to_cart_locator(self, product_id: str):
@@ -59,6 +113,16 @@ class ProductsPage:
         """
         return (By.ID, f"add-to-cart-{product_id}")
 
+    # helper method to dynamically get the locators
+    def _title_link_locator(self, product_id: str):
+        """
+        Returns the locator for the title link of a specific product card.
+
+        :param product_id: Unique identifier for the product
+        :return: Tuple containing By and value for locating the element
+        """
+        return (By.ID, f"item_{CATALOG.by_id[product_id].item_id}_title_link")
+
     # helper method to dynamically get the locators
     def _remove_from_cart_locator(self, product_id: str):
         """
@@ -78,7 +142,7 @@ class ProductsPage:
         """
         try:
             # dynamic locator defined in method to not repeat it in __innit__
-            self.driver.find_element(*self._add_to_cart_locator(product_id)).click()
+            self.click(self._add_to_cart_locator(product_id))
         except NoSuchElementException:
             return False
 
@@ -89,11 +153,8 @@ class ProductsPage:
         :param product_id: Unique identifier for the product
         :return: True if the product is in the cart, False otherwise
         """
-        try:
-            # returning if remove button is displayed
-            return self.driver.find_element(*self._remove_from_cart_locator(product_id)).is_displayed()
-        except NoSuchElementException:
-            return False
+        # returning if remove button is displayed, without waiting for it
+        return self.is_displayed(self._remove_from_cart_locator(product_id))
 
     def remove_from_cart(self, product_id: str):
         """
@@ -103,7 +164,7 @@ class ProductsPage:
         :return: True if successful, False if the product is not found
         """
         try:
-            self.driver.find_element(*self._remove_from_cart_locator(product_id)).click()
+            self.click(self._remove_from_cart_locator(product_id))
         except NoSuchElementException:
             return False
 
@@ -114,10 +175,7 @@ class ProductsPage:
         :param product_id: Unique identifier for the product
         :return: True if the button is visible, False otherwise
         """
-        try:
-            return self.driver.find_element(*self._add_to_cart_locator(product_id)).is_displayed()
-        except NoSuchElementException:
-            return False
+        return self.is_displayed(self._add_to_cart_locator(product_id))
 
     # helper method to open filter menu
     def _open_filter(self):
@@ -126,7 +184,7 @@ class ProductsPage:
 
         :return: Web Element representing the sort funnel button
         """
-        return self.driver.find_element(*self.SORT_FUNNEL_BTN)
+        return self.find(self.SORT_FUNNEL_BTN)
 
     def sort_za(self):
         """
@@ -156,15 +214,47 @@ class ProductsPage:
         select = Select(self._open_filter())
         select.select_by_value("lohi")
 
+    def get_inventory(self):
+        """
+        Captures all product cards on the page with a single execute_script call.
+
+        :return: List of InventoryItem in the order they are displayed
+        """
+        rows = self.driver.execute_script(
+            self.INVENTORY_SCRIPT,
+            self.PRODUCT_ITEM[1],
+            self.PRODUCT_NAME_ELEMENTS[1],
+            self.PRODUCT_PRICE_ELEMENTS[1],
+        )
+        return [
+            InventoryItem(
+                product_id=CATALOG.product_id_for(name),
+                name=name,
+                price=price.replace("$", ""),
+                img_src=img_src,
+                in_cart=button_id.startswith("remove-"),
+                item_id=int(link_id.split("_")[1]) if link_id else None,
+            )
+            for name, price, img_src, button_id, link_id in rows
+        ]
+
+    def capture_catalog(self):
+        """
+        Builds a product catalog from the cards currently rendered (one execute_script call).
+
+        :return: Catalog in display order
+        """
+        return Catalog(
+            Product(item.product_id, item.name, item.price, item.item_id) for item in self.get_inventory()
+        )
+
     def capture_all_products_name(self):
         """
         Captures and returns the names of all products on the page.
 
         :return: List of product names
         """
-        products_order = self.driver.find_elements(*self.PRODUCT_NAME_ELEMENTS)
-        current_products_order = []
-        current_products_order = [product.text.lower().replace(" ", "-") for product in products_order]
+        current_products_order = [item.product_id for item in self.get_inventory()]
 
         print(current_products_order)
         return current_products_order
@@ -175,9 +265,7 @@ class ProductsPage:
 
         :return: List of product prices as floats
         """
-        products_order = self.driver.find_elements(*self.PRODUCT_PRICE_ELEMENTS)
-        current_products_order = []
-        current_products_order = [float(product.text.replace("$", "")) for product in products_order]
+        current_products_order = [float(item.price) for item in self.get_inventory()]
 
         print(current_products_order)
         return current_products_order
@@ -189,15 +277,14 @@ class ProductsPage:
         :param product_id: Unique identifier for the product
         :return: Tuple containing WebElement representing the product image and its src attribute
         """
-        from utils.product_data import PRODUCT_NAMES
-
         # Get the exact display name for this product ID
-        expected_alt_text = PRODUCT_NAMES.get(product_id)
+        product = CATALOG.by_id.get(product_id)
+        expected_alt_text = product.name if product is not None else None
 
         try:
             # XPath to find the img element with matching alt text
             xpath_direct = f"//img[@alt='{expected_alt_text}']"
-            img = self.driver.find_element(By.XPATH, xpath_direct)
+            img = self.find((By.XPATH, xpath_direct))
             return img, img.get_attribute("src")
         except NoSuchElementException:
             raise NoSuchElementException(f"No product image with alt text '{expected_alt_text}' found")
@@ -206,21 +293,29 @@ class ProductsPage:
         """
         Clicks on the LinkedIn link to navigate to the company's LinkedIn page.
         """
-        self.driver.find_element(*self.LINKEDIN_LINK).click()
+        self.click(self.LINKEDIN_LINK)
 
     def open_product_details(self, product_id):
         """
-        Clicks on the product with the given ID.
+        Clicks on the product with the given ID and waits for the product details page.
 
         Args:
             product_id (str): The product ID to be opened.
         """
-        products = self.driver.find_elements(*self.PRODUCT_NAME_ELEMENTS)
+        if product_id in CATALOG:
+            # title links carry the item id, no need to read every product name
+            self.click(self._title_link_locator(product_id))
+            product_details_page.ProductDetails(self.driver).wait_until_ready()
+            return
+
+        self.find(self.PRODUCT_NAME_ELEMENTS)
+        products = self.find_all(self.PRODUCT_NAME_ELEMENTS)
 
         for product in products:
-            normalized_name = product.text.lower().replace(" ", "-")
+            normalized_name = normalize_name(product.text)
             if normalized_name == product_id:
                 product.click()
+                product_details_page.ProductDetails(self.driver).wait_until_ready()
                 return
 
     def get_product_item(self, product_id):
@@ -231,11 +326,7 @@ class ProductsPage:
         :return: A tuple containing the product name and price.
         :raises ValueError: If the product with the specified ID is not found.
         """
-        products = self.driver.find_elements(*self.PRODUCT_ITEM)
-
-        for product in products:
-            name = product.find_element(*self.PRODUCT_NAME_ELEMENTS).text.lower().replace(" ", "-")
-            price = product.find_element(*self.PRODUCT_PRICE_ELEMENTS).text.replace("$", "")
-            if name == product_id:
-                return name, price
+        for item in self.get_inventory():
+            if item.product_id == product_id:
+                return item.product_id, item.price
         raise ValueError(f"Product with ID '{product_id}' not found on the page.")
\ No newline at end of file
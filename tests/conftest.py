@@ -1,24 +1,565 @@
 # shared fixtures for all test files
 import pytest
 from pages.login_page import LoginPage
+from pages.cart_page import Cart
 from pages.products_page import ProductsPage
-from utils.config import TestUsers
+from utils.config import BASE_URL, TestUsers
+from utils.local_app import LocalApp, is_local_url
+from utils.browser_pool import BrowserPool, browser_pool_key
+from utils.browser_setup import driver_factory_key, launch_chrome, prepare_driver
+from utils.browser_broker import BrokerClient, BrowserBroker
+from utils.cdp_driver import BACKENDS, wrap_backend
+from utils.chromedriver_connection import SERVICE_MODES, SERVICES, summarize_http
+from utils.launch_profiles import DEFAULT_PROFILE, PROFILES
+from utils.product_data import IMAGE_REFERENCES_CACHE_KEY, LIVE_CATALOG_CACHE_KEY, LIVE_CATALOG_MAX_AGE, Catalog
+from utils.product_images import HASHES, build_references, references_from_rows
+from utils.remote_endpoints import EndpointBalancer, merge_endpoint_stats
+from utils.product_batch import ProductBatches, batch_key, order_batches, product_batches_key
+from utils.duration_schedule import DurationHistory, LongestFirstScheduling, actual_makespan
+from utils.test_impact import IMPACT_CACHE_KEY, TRACER, instrument_pages, plan_selection, save_impact_map, scan_symbols
+from utils.resource_policy import POLICY_CHOICES, ResourcePolicy, resource_policy_key, summarize_network
+from utils import test_metrics
+from utils.failure_artifacts import ARTIFACTS, ARTIFACTS_DIR, clear_artifacts
+from utils.command_profiler import PROFILER, clear_profiles, format_table, merge_profiles
+from utils import memory
+from utils import test_logging
+import functools
 import logging
+import os
 import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
 
 
+def pytest_addoption(parser):
+    """
+    Registers the suite's command line options.
+    """
+    group = parser.getgroup("saucedemo")
+    group.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="keep warm browsers per worker and reset their state between tests instead of relaunching",
+    )
+    group.addoption(
+        "--browser-pool-size",
+        type=int,
+        default=1,
+        help="number of idle browsers each worker keeps warm (with --reuse-browser)",
+    )
+    group.addoption(
+        "--browser-max-uses",
+        type=int,
+        default=50,
+        help="relaunch a pooled browser after it served this many tests (with --reuse-browser)",
+    )
+    group.addoption(
+        "--metrics-dir",
+        default="reports",
+        help="directory for per-worker test metrics (JSON lines) and the merged summary",
+    )
+    group.addoption(
+        "--profile-webdriver",
+        action="store_true",
+        default=False,
+        help="attribute WebDriver command latency to page-object methods (table + collapsed stacks in --metrics-dir)",
+    )
+    group.addoption(
+        "--group-by-user",
+        action="store_true",
+        default=False,
+        help="keep tests of one module and var_user_logged user on the same xdist worker (switches --dist load to loadgroup)",
+    )
+    group.addoption(
+        "--results-json",
+        default=None,
+        help="also write the merged test log as JSON to this path",
+    )
+    group.addoption(
+        "--resource-policy",
+        choices=POLICY_CHOICES,
+        default="block",
+        help="'block' stops images, fonts and off-origin requests (images stay on for 'img' tests); 'off' loads everything",
+    )
+    group.addoption(
+        "--resource-stats",
+        action="store_true",
+        default=False,
+        help="record bytes transferred and page-load time per test (Chrome performance log)",
+    )
+    group.addoption(
+        "--page-load-strategy",
+        choices=("normal", "eager", "none"),
+        default="eager",
+        help="how long navigation commands block; page objects wait for their own readiness condition",
+    )
+    group.addoption(
+        "--browser-profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help="Chrome launch profile: fast-ci (lean, tmpfs profile), faithful (plain headless, 1920x1080), debug (visible)",
+    )
+    group.addoption(
+        "--chromedriver",
+        choices=SERVICE_MODES,
+        default="shared",
+        help="'shared' keeps one chromedriver per worker and opens a session per browser; 'per-browser' starts one each time",
+    )
+    group.addoption(
+        "--webdriver-endpoints",
+        default=None,
+        help="comma-separated WebDriver URLs (chromedrivers or Grid nodes) to run browsers on instead of a local "
+             "chromedriver, least loaded first; BASE_URL must be reachable from them",
+    )
+    group.addoption(
+        "--endpoint-capacity",
+        type=int,
+        default=None,
+        help="maximum sessions per WebDriver endpoint; launches queue while every endpoint is full (default: no limit)",
+    )
+    group.addoption(
+        "--driver-backend",
+        choices=BACKENDS,
+        default="classic",
+        help="how page objects talk to Chrome: 'classic' (chromedriver HTTP per command) or 'cdp' (one DevTools websocket)",
+    )
+    group.addoption(
+        "--refresh-catalog",
+        action="store_true",
+        default=False,
+        help="scrape the live_catalog snapshot and the reference product images again instead of using the cached ones",
+    )
+    group.addoption(
+        "--browser-broker",
+        action="store_true",
+        default=False,
+        help="launch browsers in the controller ahead of time and lease them warm to workers as remote sessions",
+    )
+    group.addoption(
+        "--broker-size",
+        type=int,
+        default=None,
+        help="number of warm sessions the broker keeps ready (default: one per xdist worker)",
+    )
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        default=False,
+        help="trace which page-object methods and locators each test uses and store the map in the pytest cache",
+    )
+    group.addoption(
+        "--impact-select",
+        action="store_true",
+        default=False,
+        help="run only tests affected by source changes since the map was recorded (full suite if it is stale)",
+    )
+    group.addoption(
+        "--batch-products",
+        action="store_true",
+        default=False,
+        help="run the product cases of a test and var_user_logged user in one logged-in browser "
+             "(same xdist worker, switches --dist load to loadgroup)",
+    )
+    group.addoption(
+        "--longest-first",
+        action="store_true",
+        default=False,
+        help="with --dist load, hand out the longest tests first using durations of earlier runs (pytest cache)",
+    )
+
+def is_xdist_controller(config):
+    """
+    Returns True in the xdist controller process (the one that only distributes tests).
+    """
+    return not hasattr(config, "workerinput") and config.getoption("dist", "no") != "no"
+
 def pytest_configure(config):
     """
     Pytest built-in hook that runs once at the beginning of the test session.
-    Used here to set up global logging configuration.
+    Used here to set up global logging configuration and the optional browser pool.
+    """
+    # every process running tests logs through a queue into its own file (<metrics-dir>/logs);
+    # the controller merges them into test_results.log at session end
+    log_dir = Path(config.getoption("metrics_dir")) / "logs"
+    if not hasattr(config, "workerinput"):
+        test_logging.clear_worker_logs(log_dir)
+    config.log_listener = None
+    if not is_xdist_controller(config):
+        config.log_listener = test_logging.start_worker_logging(log_dir)
+
+    policy = config.stash[resource_policy_key] = ResourcePolicy.from_option(config.getoption("resource_policy"))
+    # --webdriver-endpoints: every process balances its own sessions; workers start at different endpoints
+    config.endpoints = None
+    if config.getoption("webdriver_endpoints"):
+        worker_id = getattr(config, "workerinput", {}).get("workerid", "gw0")
+        config.endpoints = EndpointBalancer(
+            [url.strip() for url in config.getoption("webdriver_endpoints").split(",") if url.strip()],
+            capacity=config.getoption("endpoint_capacity"),
+            offset=int(worker_id.lstrip("gw") or 0),
+        )
+    launch = functools.partial(
+        launch_chrome,
+        policy,
+        config.getoption("resource_stats"),
+        config.getoption("page_load_strategy"),
+        config.getoption("browser_profile"),
+        config.getoption("chromedriver"),
+        config.endpoints,
+    )
+    # --browser-broker: the controller owns the warm browsers, workers learn its address via workerinput
+    config.browser_broker = None
+    broker_address = getattr(config, "workerinput", {}).get("browser_broker")
+    if config.getoption("browser_broker") and not hasattr(config, "workerinput"):
+        size = config.getoption("broker_size") or max(1, config.getoption("numprocesses", 0) or 1)
+        config.browser_broker = BrowserBroker(launch, size=size).start()
+        broker_address = config.browser_broker.address
+    config.broker_client = BrokerClient(broker_address) if broker_address else None
+    backend = config.getoption("driver_backend")
+    if config.broker_client is not None:
+        config.stash[driver_factory_key] = lambda: prepare_driver(wrap_backend(config.broker_client.acquire(), backend))
+    else:
+        config.stash[driver_factory_key] = lambda: prepare_driver(wrap_backend(launch(), backend))
+    if config.getoption("reuse_browser"):
+        config.stash[browser_pool_key] = BrowserPool(
+            config.stash[driver_factory_key],
+            size=config.getoption("browser_pool_size"),
+            max_uses=config.getoption("browser_max_uses"),
+        )
+    # per-process counters (pool, memory): sent by xdist workers, or added locally without xdist
+    config.worker_outputs = []
+    if config.getoption("batch_products") and not is_xdist_controller(config):
+        config.stash[product_batches_key] = ProductBatches()
+    if (config.getoption("group_by_user") or config.getoption("batch_products")) and config.getoption("dist", "no") == "load":
+        config.option.dist = "loadgroup"
+
+    # per-test metrics: the controller clears the previous run, every process running tests writes its own file
+    metrics_dir = Path(config.getoption("metrics_dir"))
+    if not hasattr(config, "workerinput"):
+        test_metrics.clear_metrics(metrics_dir)
+        clear_profiles(metrics_dir)
+        clear_artifacts(metrics_dir / ARTIFACTS_DIR)
+    if not is_xdist_controller(config):
+        test_metrics.RECORDER.open(metrics_dir)
+        ARTIFACTS.open(metrics_dir / ARTIFACTS_DIR)
+    PROFILER.enabled = config.getoption("profile_webdriver")
+
+    # test impact: symbol hashes of pages/, utils/, tests/ compared with the map of the recording run
+    config.impact_map = config.impact_symbols = config.impact_plan = None
+    if config.getoption("impact_record") or config.getoption("impact_select"):
+        config.impact_map = config.cache.get(IMPACT_CACHE_KEY, None)
+        config.impact_symbols = scan_symbols(config.rootpath)
+    if config.getoption("impact_select"):
+        config.impact_plan = plan_selection(config.impact_map, config.impact_symbols)
+    if config.getoption("impact_record") and not is_xdist_controller(config):
+        instrument_pages(config.rootpath)
+
+    # BASE_URL on localhost: serve the bundled stand-in once, from the controller (workers share it)
+    config.local_app = None
+    if is_local_url(BASE_URL) and not hasattr(config, "workerinput"):
+        host, port = urlsplit(BASE_URL).hostname, urlsplit(BASE_URL).port or 80
+        config.local_app = LocalApp(host, port).start()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    xdist hook (controller side) passing the browser broker address to a starting worker.
+    """
+    if node.config.browser_broker is not None:
+        node.workerinput["browser_broker"] = node.config.browser_broker.address
+
+def pytest_unconfigure(config):
+    """
+    Stops the local stand-in server, the browser broker and the shared chromedriver started for this process.
+    """
+    if getattr(config, "broker_client", None) is not None:
+        config.broker_client.close()
+    if getattr(config, "browser_broker", None) is not None:
+        config.browser_broker.stop()
+    SERVICES.stop()
+    if getattr(config, "local_app", None) is not None:
+        config.local_app.stop()
+
+def pytest_sessionfinish(session):
+    """
+    Quits pooled browsers, closes the metrics file and hands per-process counters over to the xdist controller.
+    """
+    config = session.config
+    test_metrics.RECORDER.close()
+    if config.log_listener is not None:
+        test_logging.stop_worker_logging(config.log_listener)
+    if not hasattr(config, "workerinput"):
+        results_json = config.getoption("results_json")
+        test_logging.merge_worker_logs(
+            Path(config.getoption("metrics_dir")) / "logs",
+            Path("test_results.log"),
+            Path(results_json) if results_json else None,
+        )
+    if is_xdist_controller(config):
+        return
+    if PROFILER.enabled:
+        PROFILER.dump(Path(config.getoption("metrics_dir")))
+
+    output = config.workeroutput if hasattr(config, "workeroutput") else {}
+    output["memory"] = memory.SAMPLER.stats()
+    ARTIFACTS.close()
+    output["failure_artifacts"] = ARTIFACTS.stats()
+    batches = config.stash.get(product_batches_key, None)
+    if batches is not None:
+        batches.close()
+        output["product_batches"] = batches.stats()
+    if config.getoption("impact_record"):
+        output["impact"] = TRACER.tests
+    pool = config.stash.get(browser_pool_key, None)
+    if pool is not None:
+        pool.close()
+        output["browser_pool"] = pool.stats()
+    if config.endpoints is not None:
+        output["endpoints"] = config.endpoints.stats()
+    if not hasattr(config, "workeroutput"):
+        config.worker_outputs.append(output)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    xdist hook (controller side) collecting the counters sent by a finished worker.
     """
-    # pytest-xdist-logger will handle file access coordination
-    logging.basicConfig(
-        filename='test_results.log',
-        filemode='a',  # Important: use append mode
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
+    node.config.worker_outputs.append(node.workeroutput)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """
+    xdist hook sizing -n auto by available memory as well as CPUs.
+
+    Uses the browser RSS measured by the previous run (config cache) or a conservative default.
+    PYTEST_XDIST_AUTO_NUM_WORKERS still takes precedence.
+    """
+    available = memory.available_memory()
+    if os.environ.get("PYTEST_XDIST_AUTO_NUM_WORKERS") or available is None:
+        return None
+    browser_rss = memory.cached_browser_rss(config)
+    cpus = memory.cpu_count()
+    workers = memory.memory_worker_count(available, browser_rss, cpus)
+    config.worker_sizing = {"workers": workers, "cpus": cpus, "available": available, "browser_rss": browser_rss}
+    return workers
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    xdist hook replacing the load scheduler with longest-first ordering when --longest-first is given.
+    """
+    if not config.getoption("longest_first") or config.getoption("dist") != "load":
+        return None
+    config.longest_first = LongestFirstScheduling(config, log, DurationHistory.load(config.cache))
+    return config.longest_first
+
+def pytest_collection_modifyitems(config, items):
+    """
+    With --impact-select, deselects tests the recorded impact map shows as unaffected by the changes.
+    With --group-by-user, puts tests sharing a module and var_user_logged user into one xdist group.
+    With --batch-products, runs the product cases of a test and user back to back in one xdist group.
+    """
+    plan = config.impact_plan
+    if plan is not None and not plan.full:
+        deselected = [item for item in items if item.nodeid in plan.unaffected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item.nodeid not in plan.unaffected]
+    if config.getoption("batch_products"):
+        order_batches(items)
+        if not config.getoption("group_by_user"):
+            for item in items:
+                key = batch_key(item)
+                if key is not None:
+                    item.add_marker(pytest.mark.xdist_group(key))
+    if not config.getoption("group_by_user"):
+        return
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "var_user_logged" not in callspec.params:
+            continue
+        current_user, _ = callspec.params["var_user_logged"]
+        item.add_marker(pytest.mark.xdist_group(f"{item.module.__name__}::{current_user}"))
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Prints how many browser launches the pool saved, the merged timing summary and the command profile.
+    Saves the test impact map with --impact-record and the test durations used by --longest-first.
+    """
+    if PROFILER.enabled:
+        profile = merge_profiles(Path(config.getoption("metrics_dir")))
+        if profile is not None:
+            rows, table_path, collapsed_path = profile
+            terminalreporter.write_sep("-", "webdriver profile")
+            for line in format_table(rows[:15]).splitlines():
+                terminalreporter.write_line(line)
+            terminalreporter.write_line(f"full table: {table_path}, collapsed stacks: {collapsed_path}")
+
+    pool_stats = [output["browser_pool"] for output in config.worker_outputs if "browser_pool" in output]
+    if pool_stats:
+        totals = {key: sum(stats[key] for stats in pool_stats) for key in pool_stats[0]}
+        terminalreporter.write_sep("-", "browser pool")
+        terminalreporter.write_line(
+            f"tests served: {totals['served']}, browsers launched: {totals['launches']}, "
+            f"recycled: {totals['recycled']}, launches saved: {totals['saved']}"
+        )
+
+    batch_stats = [
+        output["product_batches"] for output in config.worker_outputs if output.get("product_batches", {}).get("cases")
+    ]
+    if batch_stats:
+        totals = {key: sum(stats[key] for stats in batch_stats) for key in batch_stats[0]}
+        terminalreporter.write_sep("-", "product batches")
+        terminalreporter.write_line(
+            f"product cases: {totals['cases']}, browser sessions: {totals['sessions']}, "
+            f"sessions saved: {totals['saved']}"
+        )
+
+    endpoint_stats = [output["endpoints"] for output in config.worker_outputs if "endpoints" in output]
+    if config.browser_broker is not None and config.endpoints is not None and is_xdist_controller(config):
+        # broker sessions are launched by the controller, which sends no worker output
+        endpoint_stats.append(config.endpoints.stats())
+    if endpoint_stats:
+        terminalreporter.write_sep("-", "webdriver endpoints")
+        for url, stats in merge_endpoint_stats(endpoint_stats).items():
+            terminalreporter.write_line(
+                f"{url}: {stats['sessions']} sessions ({stats['sessions_per_min']:.1f}/min, "
+                f"{stats['concurrency']:.1f} concurrent on average), queue wait mean {stats['mean_queue_wait_ms']:.0f} ms "
+                f"max {stats['max_queue_wait_ms']:.0f} ms, failures: {stats['failures']}"
+            )
+
+    artifact_stats = [
+        output["failure_artifacts"] for output in config.worker_outputs
+        if output.get("failure_artifacts", {}).get("failures")
+    ]
+    if artifact_stats:
+        totals = {key: sum(stats[key] for stats in artifact_stats) for key in artifact_stats[0]}
+        terminalreporter.write_sep("-", "failure artifacts")
+        terminalreporter.write_line(
+            f"failed tests captured: {totals['failures']}, written: {totals['bytes_written'] / 1024:.0f} KiB, "
+            f"duplicate page sources: {totals['duplicate_sources']}, over size caps: {totals['dropped']} "
+            f"({Path(config.getoption('metrics_dir')) / ARTIFACTS_DIR})"
+        )
+
+    if config.browser_broker is not None:
+        stats = config.browser_broker.stats()
+        terminalreporter.write_sep("-", "browser broker")
+        terminalreporter.write_line(
+            f"sessions leased: {stats['served']}, launched: {stats['launches']}, "
+            f"leases that waited for a launch: {stats['waits']} (warm sessions: {stats['warm']})"
+        )
+
+    memory_stats = [output["memory"] for output in config.worker_outputs if output.get("memory", {}).get("samples")]
+    # set by pytest_xdist_auto_num_workers, which runs before pytest_configure and only with -n auto
+    sizing = getattr(config, "worker_sizing", None)
+    if memory_stats or sizing:
+        terminalreporter.write_sep("-", "memory")
+        if sizing:
+            terminalreporter.write_line(
+                f"workers: {sizing['workers']} (cpus: {sizing['cpus']}, available: {sizing['available'] // memory.MIB} MiB, "
+                f"browser estimate: {sizing['browser_rss'] // memory.MIB} MiB)"
+            )
+        if memory_stats:
+            medians = sorted(stats["median"] for stats in memory_stats)
+            browser_rss = medians[len(medians) // 2]
+            # next -n auto run sizes workers from what browsers really used here
+            config.cache.set(memory.BROWSER_RSS_CACHE_KEY, browser_rss)
+            terminalreporter.write_line(
+                f"peak browser memory: {sum(stats['peak'] for stats in memory_stats) // memory.MIB} MiB "
+                f"across {len(memory_stats)} worker(s), typical browser: {browser_rss // memory.MIB} MiB"
+            )
+
+    metrics_dir = Path(config.getoption("metrics_dir"))
+    records = test_metrics.load_metrics(metrics_dir)
+    plan = config.impact_plan
+    if plan is not None or config.getoption("impact_record"):
+        terminalreporter.write_sep("-", "test impact")
+    if plan is not None and plan.full:
+        terminalreporter.write_line(f"full suite: {plan.reason}")
+    elif plan is not None:
+        terminalreporter.write_line(
+            f"{plan.reason}: {len(plan.unaffected)} unaffected tests skipped, "
+            f"estimated time saved {plan.saved:.1f}s (recorded durations)"
+        )
+    if config.getoption("impact_record"):
+        traced = {}
+        for output in config.worker_outputs:
+            traced.update(output.get("impact", {}))
+        mapped = save_impact_map(
+            config.cache,
+            config.impact_map,
+            traced,
+            {record["test"]: record["total"] for record in records},
+            config.impact_symbols,
+        )
+        terminalreporter.write_line(f"impact map: {len(traced)} tests traced, {mapped} tests mapped")
+    if not records:
+        return
+    DurationHistory.load(config.cache).update(config.cache, records)
+    prediction = getattr(getattr(config, "longest_first", None), "prediction", None)
+    if prediction is not None:
+        terminalreporter.write_sep("-", "longest-first schedule")
+        terminalreporter.write_line(
+            f"predicted makespan {prediction['makespan']:.1f}s on {prediction['workers']} workers "
+            f"({prediction['estimated']} of {prediction['tests']} tests without history), "
+            f"actual {actual_makespan(records):.1f}s"
+        )
+    summary = test_metrics.summarize(records)
+    network = summarize_network(records)
+    if network is not None:
+        summary["network"] = network
+    http = summarize_http(records)
+    if http is not None:
+        summary["chromedriver_http"] = http
+    summary_path = test_metrics.write_summary(metrics_dir, summary)
+    totals = summary["totals"]
+    terminalreporter.write_sep("-", "test timing")
+    terminalreporter.write_line(
+        f"{summary['tests']} tests: setup {totals['setup']:.1f}s, call {totals['call']:.1f}s, "
+        f"teardown {totals['teardown']:.1f}s | webdriver {totals['webdriver_s']:.1f}s, "
+        f"python {totals['python_s']:.1f}s | {totals['commands']} commands, {totals['page_loads']} page loads"
     )
+    if network is not None:
+        terminalreporter.write_line(
+            f"network (policy: {' / '.join(network['policies'])}): {network['bytes_transferred'] / 1024:.0f} KiB "
+            f"({network['bytes_per_test'] / 1024:.1f} KiB/test), {network['requests']} requests, "
+            f"{network['blocked_requests']} blocked, mean page load {network['mean_page_load_ms']:.0f} ms"
+        )
+    if http is not None and http["requests"]:
+        terminalreporter.write_line(
+            f"chromedriver http ({config.getoption('chromedriver')} chromedriver): {http['requests']} requests, "
+            f"{http['new_connections']} new connections, {http['reused_ratio']:.0%} on reused connections"
+        )
+    terminalreporter.write_line("slowest tests:")
+    for record in summary["slowest_tests"][:5]:
+        terminalreporter.write_line(
+            f"  {record['total']:7.2f}s  (setup {record['setup']:.2f}s, {record['commands']} cmds)  {record['test']}"
+        )
+    terminalreporter.write_line("slowest fixtures (total setup time):")
+    for stats in summary["slowest_fixtures"][:5]:
+        terminalreporter.write_line(f"  {stats['total']:7.2f}s  x{stats['count']:<4} {stats['fixture']}")
+    terminalreporter.write_line(f"full summary: {summary_path}")
+
+def pytest_runtest_logstart(nodeid, location):
+    """
+    Starts the metrics record of a test, right before its setup phase.
+    """
+    test_metrics.RECORDER.start(nodeid)
+    TRACER.start()
+    PROFILER.flush()
+    PROFILER.test = nodeid
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """
+    Measures how long each fixture takes to set up.
+    """
+    start = time.perf_counter()
+    yield
+    test_metrics.RECORDER.on_fixture(fixturedef.argname, time.perf_counter() - start)
+
+ANSI_ESCAPE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
 
 def remove_ansi(text):
     """
@@ -36,8 +577,7 @@ def remove_ansi(text):
     ANSI escape sequences are used to add color and formatting to terminal output.
     Not needed in 'test_results.log' file.
     """
-    ansi_escape = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
-    return ansi_escape.sub('', text)
+    return ANSI_ESCAPE.sub('', text)
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -46,10 +586,16 @@ def pytest_runtest_makereport(item, call):
 
     Logs the test name and, in case of failure, also logs the exception type and message
     (e.g., AssertionError, Selenium exceptions), with ANSI color codes removed for readability.
+    A failed setup or call also snapshots the test's browser for failure artifacts (utils.failure_artifacts).
     """
     # execute all other hooks to obtain the report object
     outcome = yield
     report = outcome.get_result()
+    test_metrics.RECORDER.on_phase(report.when, report.duration, report.outcome)
+    if item.config.getoption("impact_record"):
+        TRACER.on_report(report.outcome)
+        if report.when == "teardown":
+            TRACER.finish(item.config.rootpath, item)
 
     if report.when == 'call':  # only log actual test call, not setup/teardown
         if report.passed:
@@ -63,11 +609,25 @@ def pytest_runtest_makereport(item, call):
         elif report.skipped:
             logging.warning(f"TEST SKIPPED: {item.name}")
 
+    if report.failed and report.when in ("setup", "call"):
+        # the driver fixture is finalized after this hook, so the browser still shows the failure
+        driver = getattr(item, "funcargs", {}).get("driver")
+        if driver is not None:
+            try:
+                manifest = ARTIFACTS.capture(driver, item.nodeid, report.when)
+            except Exception as exc:
+                # an exception escaping this hook is an INTERNALERROR that ends the run
+                logging.warning(f"Failure artifacts for {item.nodeid} not captured: {type(exc).__name__}: {exc}")
+            else:
+                logging.error(f"Failure artifacts: {manifest}")
+                if test_metrics.RECORDER.current is not None:
+                    test_metrics.RECORDER.current.extra["artifacts"] = str(manifest)
+
 @pytest.fixture
 def default_user_logged(driver):
     """
     Fixture to log in a standard user.
-    This fixture logs in using the credentials of a standard user and returns the driver object.
+    This fixture logs in a standard user through the session cookie (no login form) and returns the driver object.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance to be used for automation.
@@ -76,7 +636,7 @@ def default_user_logged(driver):
         WebDriver: The WebDriver instance after logging in.
     """
     login_page = LoginPage(driver)
-    login_page.login(**TestUsers.standard)
+    login_page.login_via_session(**TestUsers.standard)
     return driver
 
 @pytest.fixture(params=[
@@ -86,7 +646,8 @@ def default_user_logged(driver):
 def var_user_logged(driver, request):
     """
     Fixture to log in a variable user.
-    This fixture logs in using different types of users and returns the username along with the driver object.
+    This fixture logs in different types of users through the session cookie (no login form)
+    and returns the username along with the driver object.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance to be used for automation.
@@ -98,14 +659,19 @@ def var_user_logged(driver, request):
     login_page = LoginPage(driver)
     # unpacking tuple in correct order
     current_user, user_credentials = request.param
-    login_page.login(**user_credentials)
+    batches = request.config.stash.get(product_batches_key, None)
+    if batches is not None and batches.resumed:
+        # --batch-products: the previous case of this batch already logged the user in
+        ProductsPage(driver).open()
+    else:
+        login_page.login_via_session(**user_credentials)
     return current_user, driver
 
 @pytest.fixture
 def open_cart_page(var_user_logged):
     """
     Fixture to open the cart page.
-    This fixture navigates to the cart page after a variable user is logged in and returns the username along with the driver object.
+    This fixture opens the cart page by URL after a variable user is logged in and returns the username along with the driver object.
 
     Args:
         var_user_logged (tuple): A tuple containing the current user's name and the WebDriver instance.
@@ -114,6 +680,85 @@ def open_cart_page(var_user_logged):
         tuple: A tuple containing the current user's name and the WebDriver instance after navigating to the cart page.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
-    products_page.open_cart()
-    return current_user, driver
\ No newline at end of file
+    Cart(driver).open()
+    return current_user, driver
+
+@pytest.fixture(scope="session")
+def live_catalog(request):
+    """
+    Session fixture with the product catalog as the live site shows it to the standard user.
+
+    Scraped with a single inventory read and cached per BASE_URL on disk (pytest cache), so other
+    xdist workers and sessions within LIVE_CATALOG_MAX_AGE skip the browser. Only complete scrapes
+    are cached (Catalog.is_complete), so a broken read is not persisted. --refresh-catalog forces a new scrape.
+
+    Args:
+        request (SubRequest): Provides access to the pytest config.
+
+    Returns:
+        Catalog: Snapshot of the live inventory, indexed like utils.product_data.CATALOG.
+    """
+    config = request.config
+    cache_key = f"{LIVE_CATALOG_CACHE_KEY}/{urlsplit(BASE_URL).netloc.replace(':', '_')}"
+    # cache entry: {"scraped": epoch seconds, "rows": Catalog.as_rows()}
+    cached = None if config.getoption("refresh_catalog") else config.cache.get(cache_key, None)
+    if isinstance(cached, dict) and time.time() - cached.get("scraped", 0) < LIVE_CATALOG_MAX_AGE:
+        try:
+            catalog = Catalog.from_rows(cached["rows"])
+        except (KeyError, TypeError):
+            catalog = None
+        if catalog is not None and catalog.is_complete():
+            return catalog
+
+    driver = config.stash[driver_factory_key]()
+    try:
+        driver.get(BASE_URL)
+        LoginPage(driver).login_via_session(**TestUsers.standard)
+        catalog = ProductsPage(driver).capture_catalog()
+    finally:
+        driver.quit()
+    if catalog.is_complete():
+        config.cache.set(cache_key, {"scraped": time.time(), "rows": catalog.as_rows()})
+    return catalog
+
+@pytest.fixture(scope="session")
+def image_references(request):
+    """
+    Session fixture with the fingerprint of every product's reference picture (utils.product_data.PRODUCT_IMAGES).
+
+    Taken from the products page as the standard user and cached per BASE_URL on disk (pytest cache)
+    like live_catalog: entries older than LIVE_CATALOG_MAX_AGE or not matching PRODUCT_IMAGES
+    (references_from_rows) are taken again. The references also seed the process's image cache,
+    so tests showing the reference pictures fetch nothing. --refresh-catalog takes them again.
+
+    Args:
+        request (SubRequest): Provides access to the pytest config.
+
+    Returns:
+        dict: product_id -> ImageFingerprint.
+    """
+    config = request.config
+    cache_key = f"{IMAGE_REFERENCES_CACHE_KEY}/{urlsplit(BASE_URL).netloc.replace(':', '_')}"
+    # cache entry: {"scraped": epoch seconds, "rows": {product_id: list(ImageFingerprint)}}
+    cached = None if config.getoption("refresh_catalog") else config.cache.get(cache_key, None)
+    references = None
+    if (
+        isinstance(cached, dict)
+        and isinstance(cached.get("scraped"), (int, float))
+        and time.time() - cached["scraped"] < LIVE_CATALOG_MAX_AGE
+    ):
+        references = references_from_rows(cached.get("rows"))
+    if references is None:
+        driver = config.stash[driver_factory_key]()
+        try:
+            driver.get(BASE_URL)
+            LoginPage(driver).login_via_session(**TestUsers.standard)
+            references = build_references(driver, ProductsPage(driver).get_inventory())
+        finally:
+            driver.quit()
+        config.cache.set(cache_key, {
+            "scraped": time.time(),
+            "rows": {product_id: list(reference) for product_id, reference in references.items()},
+        })
+    HASHES.seed(references.values())
+    return references
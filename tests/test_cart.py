@@ -4,6 +4,7 @@ from utils.browser_setup import driver
 from pages.cart_page import Cart
 from pages.products_page import ProductsPage
 from utils.product_data import PRODUCT_IDS
+from utils.cart_state import read_cart_state, seed_cart
 
 
 @pytest.mark.cart
@@ -39,23 +40,22 @@ def test_remove_from_cart_on_cart_page(var_user_logged, product_id):
 
     Args:
         var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user logged in.
-        product_id (str): ID of the product to be added and removed from the cart.
+        product_id (str): ID of the product to be removed from the cart.
 
     Assertions:
-        - Product is present in the cart after adding.
+        - Product seeded into the cart is listed on the cart page.
         - Product is no longer in the cart after removal.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     cart_page = Cart(driver)
 
-    # Step 1: Add product and go to cart
-    products_page.add_to_cart(product_id)
-    products_page.open_cart()
+    # Step 1: Put product into the cart (the add click is covered by test_add_to_cart) and go to cart
+    seed_cart(driver, [product_id])
+    cart_page.open()
 
-    # Step 2: Check if item was added
+    # Step 2: Check if item is listed
     assert cart_page.is_in_cart(product_id), (
-        f"Expected {product_id} to be in cart, but {current_user} could not add it. "
+        f"Expected {product_id} to be in cart, but it is not listed for {current_user}. "
     )
 
     # Step 3: Remove item
@@ -87,7 +87,7 @@ def test_add_and_remove_multiple_items(var_user_logged):
         products_page.add_to_cart(product_id)
 
     # Step 2: Go to cart page
-    products_page.open_cart()
+    cart_page.open()
 
     # Step 3: Confirm all products are in cart
     for product_id in PRODUCT_IDS:
@@ -113,14 +113,67 @@ def test_checkout_btn(var_user_logged):
         - Current URL matches the expected checkout page URL.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     cart_page = Cart(driver)
 
-    products_page.open_cart()
+    cart_page.open()
     cart_page.click_checkout_btn()
     expected_url = f"{BASE_URL}checkout-step-one.html"
 
     assert driver.current_url == expected_url, (
         f"Expected {current_user} to be redirected to: {expected_url} ."
         f"{current_user} actually redirected to {driver.current_url}."
-    )
\ No newline at end of file
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.cart
+def test_navigation_waits_for_rendered_page(open_cart_page):
+    """
+    Verify cart navigation returns only once the target page is usable, whatever the page-load strategy.
+
+    Args:
+        open_cart_page (tuple): (str, WebDriver) - Username and WebDriver instance with cart page opened.
+
+    Assertions:
+        - Checkout button is there as soon as the cart page is opened (single look, no wait).
+        - All products are rendered right after returning to the products page.
+    """
+    current_user, driver = open_cart_page
+    cart_page = Cart(driver)
+    products_page = ProductsPage(driver)
+
+    assert cart_page.is_displayed(Cart.CHECKOUT_BTN), f"Cart page was not rendered when it was opened for {current_user}."
+
+    cart_page.return_to_products_page()
+
+    assert len(products_page.get_inventory()) == len(PRODUCT_IDS), (
+        f"Products page was not fully rendered when return_to_products_page returned for {current_user}."
+    )
+
+@pytest.mark.perf
+@pytest.mark.cart
+def test_seeded_cart_matches_cart_page(var_user_logged):
+    """
+    Verify that a cart filled through seed_cart is what the app shows.
+
+    Args:
+        var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user logged in.
+
+    Assertions:
+        - read_cart_state reports every seeded product and a matching badge in one round trip.
+        - Every seeded product is listed on the cart page.
+    """
+    current_user, driver = var_user_logged
+    cart_page = Cart(driver)
+
+    seed_cart(driver, PRODUCT_IDS)
+    cart_state = read_cart_state(driver)
+
+    assert cart_state.product_ids == tuple(PRODUCT_IDS), f"Stored cart of {current_user} is {cart_state.product_ids}."
+    assert cart_state.badge_count == len(PRODUCT_IDS), (
+        f"Expected cart badge to show {len(PRODUCT_IDS)} for {current_user}, got {cart_state.badge_count}."
+    )
+
+    cart_page.open()
+    for product_id in PRODUCT_IDS:
+        assert cart_page.is_in_cart(product_id), f"Seeded {product_id} missing from cart page for {current_user}. "
@@ -2,9 +2,10 @@ import pytest
 from utils.config import BASE_URL
 from utils.product_data import PRODUCT_IDS
 from utils.product_data import PRODUCT_PRICES
+from utils.product_images import check_image
 from utils.browser_setup import driver
-from pages.products_page import ProductsPage
 from pages.product_details_page import ProductDetails
+from utils.cart_state import seed_cart
 
 @pytest.mark.cart
 @pytest.mark.parametrize("product_id", PRODUCT_IDS)
@@ -22,10 +23,9 @@ def test_add_to_cart(var_user_logged, product_id):
         - Product is successfully added to cart.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     product_details_page = ProductDetails(driver)
 
-    products_page.open_product_details(product_id)
+    product_details_page.open(product_id)
     current_product = product_details_page.capture_product_name()
 
     assert product_details_page.capture_product_name() == product_id, (
@@ -55,22 +55,21 @@ def test_remove_from_cart(var_user_logged, product_id):
 
     Assertions:
         - Redirection to the correct product details page URL.
-        - Product is successfully added to the cart.
+        - Product seeded into the cart is shown as in cart.
         - Product is successfully removed from the cart.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     product_details_page = ProductDetails(driver)
 
-    products_page.add_to_cart(product_id)
-    products_page.open_product_details(product_id)
+    seed_cart(driver, [product_id])
+    product_details_page.open(product_id)
     assert product_details_page.is_on_product_details_page(), (
         f"Expected redirection to product details page. "
         f"{current_user} redirected instead to {driver.current_url}."
     )
 
     assert product_details_page.is_in_cart(), (
-        f"Expected {product_id} to be in cart, but {current_user} could not add it."
+        f"Expected {product_id} to be in cart, but it is not shown as in cart for {current_user}."
     )
 
     product_details_page.remove_from_cart()
@@ -96,10 +95,9 @@ def test_check_item_price(var_user_logged, product_id):
         - Product name and price match with expected values.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     product_details_page = ProductDetails(driver)
 
-    products_page.open_product_details(product_id)
+    product_details_page.open(product_id)
     assert product_details_page.is_on_product_details_page(), (
         f"Expected redirection to product details page. "
         f"{current_user} redirected instead to {driver.current_url}."
@@ -128,10 +126,9 @@ def test_return_to_products_page(var_user_logged, product_id):
         - Correct redirection back to the products page after clicking 'Back to Products'.
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     product_details_page = ProductDetails(driver)
 
-    products_page.open_product_details(product_id)
+    product_details_page.open(product_id)
     assert product_details_page.is_on_product_details_page(), (
         f"Expected redirection to product details page. "
         f"{current_user} redirected instead to {driver.current_url}."
@@ -146,8 +143,7 @@ def test_return_to_products_page(var_user_logged, product_id):
 
 @pytest.mark.img
 @pytest.mark.parametrize("product_id", PRODUCT_IDS)
-def test_check_product_img(var_user_logged, product_id):
-    # for demo purposes I will not be using PIL & hashlib nor visual comparison libraries to validate the img
+def test_check_product_img(var_user_logged, product_id, image_references):
     """
     Verify that product images are correctly displayed on the products page.
 
@@ -155,16 +151,17 @@ def test_check_product_img(var_user_logged, product_id):
         var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user
             logged in.
         product_id (str): ID of the product whose image should be checked.
+        image_references (dict): Fingerprints of the reference product pictures.
 
     Assertions:
         - Product image is displayed in the UI.
         - Product image has a non-empty source attribute.
+        - Product image is the product's reference picture (content or perceptual hash).
     """
     current_user, driver = var_user_logged
-    products_page = ProductsPage(driver)
     product_details_page = ProductDetails(driver)
 
-    products_page.open_product_details(product_id)
+    product_details_page.open(product_id)
     assert product_details_page.is_on_product_details_page(), (
         f"Expected redirection to product details page. "
         f"{current_user} redirected instead to {driver.current_url}."
@@ -178,4 +175,11 @@ def test_check_product_img(var_user_logged, product_id):
 
     assert img_src is not None and img_src != "", (
         f"Expected img source to not be empty. Img source empty for {current_user}."
+    )
+
+    check = check_image(driver, product_id, img_src, image_references)
+    assert check.matches, (
+        f"Expected the {product_id} picture. {current_user} sees "
+        f"{'the ' + check.shown + ' placeholder' if check.placeholder else check.shown} "
+        f"(hash distance {check.distance}, looks like: {check.closest or 'no product'})."
     )
\ No newline at end of file
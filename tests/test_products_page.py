@@ -1,14 +1,20 @@
 import pytest
+import time
 from utils.browser_setup import driver
 from pages.products_page import ProductsPage
 from pages.product_details_page import ProductDetails
 from utils.product_data import PRODUCT_IDS
 from utils.product_data import PRODUCT_NAMES
 from utils.product_data import PRODUCT_PRICES
+from utils.product_data import CATALOG
+from utils.product_images import check_image
 from utils.config import BASE_URL
+from utils.config import DEFAULT_TIMEOUT
 from utils.config import SOCIAL_MEDIA
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
+from utils.webdriver_commands import count_commands
+from utils.cart_state import seed_cart
 
 
 @pytest.mark.smoke
@@ -71,14 +77,14 @@ def test_remove_from_cart(var_user_logged, product_id):
 
     Args:
         var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user logged in.
-        product_id (str): ID of the product to be added and removed from the cart.
+        product_id (str): ID of the product to be removed from the cart.
 
     Assertions:
         - 'Add to cart' button is visible for the removed product.
     """
     current_user, driver = var_user_logged
     products_page = ProductsPage(driver)
-    products_page.add_to_cart(product_id)
+    seed_cart(driver, [product_id])
     products_page.remove_from_cart(product_id)
     assert products_page.is_add_to_cart_button_visible(product_id), (
         f"Expected 'Add to cart' button to be visible for product {product_id} after removal. "
@@ -143,6 +149,90 @@ def test_check_price(var_user_logged, product_id):
         f"Instead {current_user} got incorrect price, or item/price was not found on the page."
     )
 
+@pytest.mark.perf
+def test_catalog_reads_single_round_trip(var_user_logged):
+    """
+    Verify that catalog reads on the products page cost one WebDriver command each.
+
+    Args:
+        var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user logged in.
+
+    Assertions:
+        - Capturing names, prices, a single product item and the full inventory each issue exactly one command.
+        - The batched inventory contains every product.
+    """
+    current_user, driver = var_user_logged
+    products_page = ProductsPage(driver)
+
+    reads = {
+        "get_inventory": products_page.get_inventory,
+        "capture_all_products_name": products_page.capture_all_products_name,
+        "capture_all_products_price": products_page.capture_all_products_price,
+        "get_product_item": lambda: products_page.get_product_item(PRODUCT_IDS[0]),
+    }
+    for method_name, read in reads.items():
+        with count_commands(driver) as counter:
+            read()
+        assert counter.count == 1, (
+            f"Expected {method_name} to use 1 WebDriver command, "
+            f"{current_user} run used {counter.count}: {counter.commands}."
+        )
+
+    assert sorted(item.product_id for item in products_page.get_inventory()) == sorted(PRODUCT_IDS), (
+        f"Expected inventory to list all products for {current_user}."
+    )
+
+@pytest.mark.price
+def test_inventory_reads_names_and_prices(default_user_logged):
+    """
+    Verify that the batched inventory read returns the real name, price and item id of every card.
+
+    Args:
+        default_user_logged (WebDriver): WebDriver instance with a default user logged in.
+
+    Assertions:
+        - Every card's display name, price and item id match the reference catalog.
+        - Every card has an image source.
+    """
+    inventory = ProductsPage(default_user_logged).get_inventory()
+
+    read = {item.product_id: (item.name, item.price, item.item_id) for item in inventory}
+    expected = {product.product_id: (product.name, product.price, product.item_id) for product in CATALOG}
+    assert read == expected, f"Expected inventory read to match the reference catalog. Got: {read}."
+    assert all(item.img_src for item in inventory), "Expected every product card to have an image source."
+
+
+@pytest.mark.perf
+def test_absence_checks_skip_implicit_wait(var_user_logged):
+    """
+    Verify that checking for missing elements returns without waiting for the implicit wait.
+
+    Args:
+        var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user logged in.
+
+    Assertions:
+        - Empty cart reports badge count 0 and no product in cart.
+        - Each check looks up its element once (an implicit wait would keep polling with the CDP backend).
+        - Both checks together take well under one DEFAULT_TIMEOUT (an implicit wait would take 2x).
+    """
+    current_user, driver = var_user_logged
+    products_page = ProductsPage(driver)
+
+    start = time.perf_counter()
+    with count_commands(driver) as counter:
+        badge_count = products_page.cart_badge_count()
+        in_cart = products_page.is_in_cart(PRODUCT_IDS[0])
+    elapsed = time.perf_counter() - start
+
+    assert badge_count == 0 and not in_cart, f"Expected empty cart for new {current_user} shopping session."
+    assert counter.commands.count("findElements") == 2, (
+        f"Expected one element lookup per absence check, {current_user} run sent: {counter.commands}."
+    )
+    assert elapsed < DEFAULT_TIMEOUT / 2, (
+        f"Expected the implicit wait to be suspended for absence checks, "
+        f"{current_user} run took {elapsed:.2f}s (implicit wait {DEFAULT_TIMEOUT}s)."
+    )
+
 def test_check_product_description():
     pass
 
@@ -307,8 +397,7 @@ def test_open_product_details(var_user_logged, product_id):
 
 @pytest.mark.img
 @pytest.mark.parametrize("product_id", PRODUCT_IDS)
-def test_check_product_img(var_user_logged, product_id):
-    # for demo purposes I will not be using PIL & hashlib nor visual comparison libraries to validate the img
+def test_check_product_img(var_user_logged, product_id, image_references):
     """
     Verify that product images are correctly displayed on the products page.
 
@@ -316,10 +405,12 @@ def test_check_product_img(var_user_logged, product_id):
         var_user_logged (tuple): (str, WebDriver) - Username and WebDriver instance with variable user
             logged in.
         product_id (str): ID of the product whose image should be checked.
+        image_references (dict): Fingerprints of the reference product pictures.
 
     Assertions:
         - Product image is displayed in the UI.
         - Product image has a non-empty source attribute.
+        - Product image is the product's reference picture (content or perceptual hash).
     """
     current_user, driver = var_user_logged
     products_page = ProductsPage(driver)
@@ -332,4 +423,28 @@ def test_check_product_img(var_user_logged, product_id):
 
     assert img_src is not None and img_src != "", (
         f"Expected img source to not be empty. Img source empty for {current_user}."
-    )
\ No newline at end of file
+    )
+
+    check = check_image(driver, product_id, img_src, image_references)
+    assert check.matches, (
+        f"Expected the {product_id} picture. {current_user} sees "
+        f"{'the ' + check.shown + ' placeholder' if check.placeholder else check.shown} "
+        f"(hash distance {check.distance}, looks like: {check.closest or 'no product'})."
+    )
+
+
+@pytest.mark.price
+def test_live_catalog_matches_reference(live_catalog):
+    """
+    Verify that the live inventory matches the reference catalog in utils/product_data.py.
+
+    Args:
+        live_catalog (Catalog): Snapshot of the live inventory (complete scrapes cached up to LIVE_CATALOG_MAX_AGE).
+
+    Assertions:
+        - Same products with the same display names, prices and item ids.
+    """
+    assert dict(live_catalog.by_id) == dict(CATALOG.by_id), (
+        f"Live inventory differs from the reference catalog: "
+        f"{sorted(set(live_catalog.products) ^ set(CATALOG.products))}"
+    )
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from selenium.webdriver.chrome.options import Options
+from utils.browser_setup import quit_driver
+from utils.remote_endpoints import EndpointBalancer, EndpointSession
+
+
+class FakeChromedriver(BaseHTTPRequestHandler):
+    """
+    Answers the chromedriver requests a session start, load probe and quit make; no browser behind it.
+    """
+    sessions = set()
+
+    def _reply(self, value):
+        body = json.dumps({"value": value}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/sessions":
+            self._reply([{"id": session_id} for session_id in self.sessions])
+        else:
+            self._reply({"ready": True})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        session_id = f"session-{len(self.sessions) + 1}"
+        self.sessions.add(session_id)
+        self._reply({"sessionId": session_id, "capabilities": {"browserName": "chrome"}})
+
+    def do_DELETE(self):
+        self.sessions.discard(self.path.rsplit("/", 1)[-1])
+        self._reply(None)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_endpoint():
+    """
+    Serves FakeChromedriver on a free local port.
+
+    Yields:
+        str: Base URL of the endpoint.
+    """
+    FakeChromedriver.sessions = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeChromedriver)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_quit_releases_endpoint(fake_endpoint):
+    """
+    Verify that quitting a session the way the driver fixture does frees its endpoint slot
+    and books the session's lifetime.
+
+    Args:
+        fake_endpoint (str): URL of a fake chromedriver.
+    """
+    balancer = EndpointBalancer([fake_endpoint], capacity=1)
+    endpoint = balancer.endpoints[0]
+
+    driver = balancer.launch(Options())
+    assert isinstance(driver, EndpointSession)
+    assert endpoint.active == 1 and FakeChromedriver.sessions, "Expected the session to run on the endpoint"
+    time.sleep(0.01)
+    quit_driver(driver)
+    quit_driver(driver)
+
+    assert not FakeChromedriver.sessions, "Expected quit to delete the session on the endpoint"
+    assert endpoint.active == 0, f"Expected the endpoint slot to be free after quit, {endpoint.active} still held"
+    assert endpoint.sessions == 1
+    assert endpoint.session_time > 0, "Expected the session lifetime to be booked"
+    assert endpoint.last_end is not None, "Expected the session end to be recorded"
+
+    # the freed slot is usable again although the capacity is 1
+    quit_driver(balancer.launch(Options()))
+    assert endpoint.sessions == 2 and endpoint.active == 0
@@ -0,0 +1,268 @@
+import json
+import logging
+import queue
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from utils.chromedriver_connection import ChromedriverConnection
+from utils.config import BASE_URL
+
+# how long a worker waits for a warm session before giving up (cold launch included)
+ACQUIRE_TIMEOUT = 120
+
+
+class BrokeredDriver(webdriver.Remote):
+    """
+    Remote WebDriver attached to a session that the broker already started.
+
+    No new session is created: start_session() adopts the broker's session id and capabilities.
+    quit() hands the session back to the broker, which shuts the browser down off the test's path.
+    """
+
+    def __init__(self, client, lease: dict):
+        """
+        Initializes the driver from a lease returned by the broker.
+
+        Args:
+            client (BrokerClient): Connection the session is returned through.
+            lease (dict): {"token", "executor", "session_id", "capabilities"} sent by the broker.
+        """
+        self._client = client
+        self._lease = lease
+        super().__init__(command_executor=ChromedriverConnection(lease["executor"]), options=Options())
+
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = self._lease["session_id"]
+        self.caps = self._lease["capabilities"]
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        """
+        Executes a Chrome DevTools Protocol command (same as ChromiumDriver.execute_cdp_cmd).
+        """
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self) -> None:
+        self._client.release(self._lease["token"])
+
+
+class BrokerClient:
+    """
+    Worker-side connection to a BrowserBroker (one persistent socket per pytest process).
+    """
+
+    def __init__(self, address: str):
+        """
+        Initializes the client.
+
+        Args:
+            address (str): "host:port" of the broker.
+        """
+        self.address = address
+        self._socket = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _request(self, message: dict):
+        with self._lock:
+            if self._socket is None:
+                host, port = self.address.rsplit(":", 1)
+                self._socket = socket.create_connection((host, int(port)))
+                self._reader = self._socket.makefile("r")
+            self._socket.sendall((json.dumps(message) + "\n").encode())
+            reply = json.loads(self._reader.readline() or "{}")
+        if "error" in reply or not reply:
+            raise WebDriverException(f"Browser broker: {reply.get('error', 'connection closed')}")
+        return reply
+
+    def acquire(self):
+        """
+        Takes a warm browser session from the broker.
+
+        Returns:
+            BrokeredDriver: Driver attached to the session (not instrumented, not navigated by the test yet).
+        """
+        return BrokeredDriver(self, self._request({"op": "acquire"}))
+
+    def release(self, token: str):
+        """
+        Returns a session to the broker, which quits it and launches a replacement.
+        """
+        self._request({"op": "release", "token": token})
+
+    def close(self):
+        """
+        Closes the connection; sessions still leased through it are quit by the broker.
+        """
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = None
+
+
+class _BrokerHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one worker connection: JSON-lines requests {"op": "acquire" | "release", ...}.
+    """
+
+    def handle(self):
+        broker = self.server.broker
+        leased = set()
+        try:
+            for line in self.rfile:
+                request = json.loads(line)
+                try:
+                    if request["op"] == "acquire":
+                        reply = broker.lease()
+                        leased.add(reply["token"])
+                    elif request["op"] == "release":
+                        leased.discard(request["token"])
+                        broker.give_back(request["token"])
+                        reply = {"ok": True}
+                    else:
+                        reply = {"error": f"unknown op {request['op']!r}"}
+                except (queue.Empty, WebDriverException) as exc:
+                    reply = {"error": f"{type(exc).__name__}: {exc}"}
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+        finally:
+            # worker crashed or exited without returning its browser
+            for token in leased:
+                broker.give_back(token)
+
+
+class _BrokerServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class BrowserBroker:
+    """
+    Keeps warm Chrome sessions in the controller process and leases them to xdist workers.
+
+    Sessions are single-use: a returned session is quit in the background and replaced, so every
+    test still gets a fresh browser, but never waits for its launch. Launches run in parallel
+    threads, and the first `size` of them start while xdist is still spawning workers.
+
+    Attributes:
+        size (int): Number of warm sessions kept ready.
+        launches (int): Sessions started by the broker.
+        served (int): Sessions leased to workers.
+        waits (int): Leases that found no warm session and had to wait for a launch.
+    """
+
+    def __init__(self, launcher, size: int = 2, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initializes the broker.
+
+        Args:
+            launcher (Callable[[], WebDriver]): Function launching a local Chrome (uninstrumented).
+            size (int): Number of warm sessions kept ready.
+            host (str): Interface the broker listens on.
+            port (int): Port to listen on, 0 picks a free one.
+        """
+        self.launcher = launcher
+        self.size = size
+        self.launches = 0
+        self.served = 0
+        self.waits = 0
+        self._ready = queue.Queue()
+        self._leased = {}
+        self._lock = threading.Lock()
+        self._launch_pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix="broker-launch")
+        self._server = _BrokerServer((host, port), _BrokerHandler)
+        self._server.broker = self
+        self._thread = None
+        self._stopped = False
+
+    @property
+    def address(self):
+        """
+        Returns "host:port" to be passed to BrokerClient.
+        """
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def _launch(self):
+        if self._stopped:
+            return
+        try:
+            driver = self.launcher()
+            # first navigation warms up the renderer process and the HTTP cache
+            driver.get(BASE_URL)
+        except WebDriverException as exc:
+            logging.warning(f"Browser broker launch failed: {type(exc).__name__}")
+            return
+        with self._lock:
+            self.launches += 1
+        self._ready.put(driver)
+
+    def start(self):
+        """
+        Starts warming `size` sessions and serving workers in background threads.
+
+        Returns:
+            BrowserBroker: self, to allow chaining.
+        """
+        for _ in range(self.size):
+            self._launch_pool.submit(self._launch)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="browser-broker", daemon=True)
+        self._thread.start()
+        return self
+
+    def lease(self):
+        """
+        Hands out a warm session and schedules a replacement launch.
+
+        Returns:
+            dict: {"token", "executor", "session_id", "capabilities"} for BrokeredDriver.
+        """
+        self._launch_pool.submit(self._launch)
+        try:
+            driver = self._ready.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.waits += 1
+            driver = self._ready.get(timeout=ACQUIRE_TIMEOUT)
+        with self._lock:
+            self.served += 1
+            self._leased[driver.session_id] = driver
+        return {
+            "token": driver.session_id,
+            "executor": driver.service.service_url,
+            "session_id": driver.session_id,
+            "capabilities": driver.caps,
+        }
+
+    def give_back(self, token: str):
+        """
+        Quits a returned session in the background.
+        """
+        with self._lock:
+            driver = self._leased.pop(token, None)
+        if driver is not None:
+            threading.Thread(target=driver.quit, name="broker-quit", daemon=True).start()
+
+    def stop(self):
+        """
+        Stops serving and quits every warm and leased session.
+        """
+        self._stopped = True
+        self._server.shutdown()
+        self._server.server_close()
+        self._launch_pool.shutdown(wait=True)
+        with self._lock:
+            drivers = list(self._leased.values())
+            self._leased.clear()
+        while not self._ready.empty():
+            drivers.append(self._ready.get_nowait())
+        for driver in drivers:
+            driver.quit()
+
+    def stats(self):
+        """
+        Returns broker counters as a plain dict.
+        """
+        return {"served": self.served, "launches": self.launches, "waits": self.waits, "warm": self.size}
@@ -0,0 +1,161 @@
+import logging
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.config import BASE_URL, DEFAULT_TIMEOUT
+
+
+def reset_driver_state(driver: WebDriver):
+    """
+    Brings a reused browser back to the state of a freshly launched one.
+
+    Closes any extra tabs (e.g. opened by the LinkedIn link), wipes cookies,
+    localStorage and sessionStorage for the app origin and lands on BASE_URL.
+
+    Args:
+        driver (WebDriver): The browser to be cleaned.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    driver.implicitly_wait(DEFAULT_TIMEOUT)
+    # storage is bound to the origin, so it has to be cleared while on the app
+    if not driver.current_url.startswith(BASE_URL):
+        driver.get(BASE_URL)
+        if driver.caps.get("pageLoadStrategy") == "none":
+            # get() returned before the navigation committed
+            WebDriverWait(driver, DEFAULT_TIMEOUT).until(lambda d: d.current_url.startswith(BASE_URL))
+    driver.delete_all_cookies()
+    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    driver.get(BASE_URL)
+
+
+class BrowserPool:
+    """
+    Keeps warm browsers for a single pytest process (one xdist worker).
+
+    Browsers are handed out one per test, cleaned with reset_driver_state() before reuse,
+    and recycled once they served max_uses tests or stopped responding.
+
+    Attributes:
+        size (int): Maximum number of idle browsers kept warm.
+        max_uses (int): Number of tests a browser may serve before it is relaunched.
+        launches (int): Number of browsers started by the pool.
+        served (int): Number of tests served by the pool.
+        recycled (int): Number of browsers quit because of max_uses or a crash.
+    """
+
+    def __init__(self, factory, size: int = 1, max_uses: int = 50):
+        """
+        Initializes the BrowserPool.
+
+        Args:
+            factory (Callable[[], WebDriver]): Function launching a new browser.
+            size (int): Maximum number of idle browsers kept warm.
+            max_uses (int): Number of tests a browser may serve before it is relaunched.
+        """
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.launches = 0
+        self.served = 0
+        self.recycled = 0
+        self._idle = []
+        self._uses = {}
+
+    def _launch(self):
+        driver = self.factory()
+        self.launches += 1
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _retire(self, driver: WebDriver):
+        self._uses.pop(id(driver), None)
+        self.recycled += 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def acquire(self, prepare=None):
+        """
+        Returns a clean browser, reusing an idle one when possible.
+
+        Args:
+            prepare (Callable[[WebDriver], None]): Optional per-test setup applied before
+                the browser navigates to BASE_URL (e.g. network blocking rules).
+
+        Returns:
+            WebDriver: Browser positioned on BASE_URL with empty cookies and storage.
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            try:
+                if prepare is not None:
+                    prepare(driver)
+                reset_driver_state(driver)
+                self.served += 1
+                return driver
+            except WebDriverException as exc:
+                # browser or chromedriver died between tests - replace it
+                logging.warning(f"Discarding crashed pooled browser: {type(exc).__name__}")
+                self._retire(driver)
+
+        driver = self._launch()
+        if prepare is not None:
+            prepare(driver)
+        driver.get(BASE_URL)
+        self.served += 1
+        return driver
+
+    def release(self, driver: WebDriver):
+        """
+        Returns a browser to the pool after a test.
+        Crashed browsers are detected and replaced on the next acquire().
+
+        Args:
+            driver (WebDriver): Browser previously obtained from acquire().
+        """
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if self._uses[id(driver)] >= self.max_uses or len(self._idle) >= self.size:
+            self._retire(driver)
+        else:
+            self._idle.append(driver)
+
+    def close(self):
+        """
+        Quits all idle browsers.
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            self._uses.pop(id(driver), None)
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    @property
+    def launches_saved(self):
+        """
+        Returns how many browser launches were avoided compared to one browser per test.
+        """
+        return self.served - self.launches
+
+    def stats(self):
+        """
+        Returns pool counters as a plain dict (safe to send from xdist workers to the controller).
+        """
+        return {
+            "served": self.served,
+            "launches": self.launches,
+            "recycled": self.recycled,
+            "saved": self.launches_saved,
+        }
+
+
+# key under which the per-process pool is kept in config.stash
+browser_pool_key = pytest.StashKey[BrowserPool]()
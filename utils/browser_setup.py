@@ -1,32 +1,155 @@
+from typing import Callable
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.browser_pool import browser_pool_key
+from utils.chromedriver_connection import SERVICES, STATS
 from utils.config import BASE_URL, DEFAULT_TIMEOUT
+from utils.launch_profiles import DEFAULT_PROFILE, PROFILES, chrome_options
+from utils.memory import SAMPLER
+from utils.remote_endpoints import EndpointBalancer
+from utils.product_batch import batch_key, product_batches_key
+from utils.command_profiler import PROFILER
+from utils.resource_policy import (
+    ResourcePolicy, apply_policy, collect_network_stats, launch_arguments, resource_policy_key,
+)
+from utils.test_metrics import RECORDER, record_command
+from utils.webdriver_commands import add_listener
+
+
+def launch_chrome(
+    policy: ResourcePolicy = None,
+    network_stats: bool = False,
+    page_load_strategy: str = "normal",
+    profile: str = DEFAULT_PROFILE,
+    service_mode: str = "per-browser",
+    endpoints: EndpointBalancer = None,
+):
+    """
+    Launches a new Chrome WebDriver with the given launch profile (headless unless 'debug'),
+    without the suite's instrumentation (used by the browser broker).
+
+    Args:
+        policy (ResourcePolicy): Resource policy whose launch-time part (off-origin blocking) is applied.
+            Image/font blocking is applied per test with apply_policy(). None loads everything.
+        network_stats (bool): Enable Chrome's performance log, read by collect_network_stats().
+        page_load_strategy (str): 'normal' (wait for the load event), 'eager' (DOMContentLoaded) or 'none';
+            page objects wait for their own readiness condition after navigating.
+        profile (str): Name of a launch profile from utils.launch_profiles.PROFILES.
+        service_mode (str): 'per-browser' starts a chromedriver for this browser only, 'shared' opens
+            a new session on the process's chromedriver (see utils.chromedriver_connection).
+        endpoints (EndpointBalancer): Remote WebDriver endpoints to start the session on instead of a local
+            chromedriver (service_mode is then ignored). None runs chromedriver locally.
+
+    Returns:
+        WebDriver: A fresh browser instance (not navigated yet).
+    """
+    # set options
+    launch_profile = PROFILES[profile]
+    options = chrome_options(launch_profile)
+    for argument in launch_arguments(policy) if policy is not None else []:
+        options.add_argument(argument)
+    if network_stats:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.page_load_strategy = page_load_strategy
+
+    # initialize driver
+    if endpoints is not None:
+        return endpoints.launch(options)
+    return SERVICES.launch(launch_profile, options, service_mode)
+
+
+def prepare_driver(driver):
+    """
+    Attaches the suite's command listeners (metrics recorder, profiler) and sets the implicit wait.
+
+    Returns:
+        WebDriver: The same driver, for chaining.
+    """
+    add_listener(driver, record_command)
+    add_listener(driver, PROFILER.listener_for(driver))
+    driver.implicitly_wait(DEFAULT_TIMEOUT)
+    return driver
+
+
+def create_driver(*args, **kwargs):
+    """
+    Launches a new Chrome WebDriver with the suite's configuration (arguments as in launch_chrome()).
+
+    Returns:
+        WebDriver: A fresh browser instance with implicit wait set (not navigated yet).
+        Its commands are reported to the per-test metrics recorder and the command profiler.
+    """
+    return prepare_driver(launch_chrome(*args, **kwargs))
+
+
+def quit_driver(driver):
+    """
+    Quits a browser through its own quit(), so the subclass's cleanup runs (e.g. BrokeredDriver
+    returns its lease to the broker).
+    """
+    driver.quit()
+
+
+# key under which the session's browser factory (local launch or browser broker) is kept in config.stash
+driver_factory_key = pytest.StashKey[Callable[[], WebDriver]]()
+
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """
     Chrome WebDriver fixture with headless configuration.
     Automatically navigates to BASE_URL and cleans up after tests.
+
+    With --reuse-browser the browser comes from the worker's BrowserPool instead,
+    already reset to a clean state and returned to the pool afterwards.
+    With --browser-broker new browsers are leased warm from the controller's broker.
+    With --batch-products the product cases of one test and user share a browser (see ProductBatches).
+
+    The session's resource policy (--resource-policy) is applied before the first page load;
+    tests marked 'img' get images back. With --resource-stats the test's network traffic
+    is added to its metrics record.
     """
-    # set options
-    options = Options()
-    options.add_argument("--disable-infobars")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--start-maximized")
-    options.add_argument("--headless")
-    options.add_argument("--incognito")
-    # options.add_argument("--disable-gpu")
-    # options.add_argument("--disable-dev-shm-usage")
-    # options.add_argument("--no-sandbox")
+    config = request.config
+    policy = config.stash.get(resource_policy_key, None)
+    network_stats = config.getoption("resource_stats", False)
+    test_policy = policy
+    if policy is not None and request.node.get_closest_marker("img"):
+        test_policy = policy.for_images()
 
+    def prepare(driver):
+        if network_stats:
+            # drop traffic from before this test (e.g. the broker's warm-up page load)
+            collect_network_stats(driver)
+        if test_policy is not None:
+            apply_policy(driver, test_policy)
 
-    # initialize driver
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(DEFAULT_TIMEOUT)
-    driver.get(BASE_URL)
+    pool = config.stash.get(browser_pool_key, None)
+    release = pool.release if pool is not None else quit_driver
+    batches = config.stash.get(product_batches_key, None)
+    key = batch_key(request.node) if batches is not None else None
+    driver = batches.resume(key) if batches is not None else None
+    failures = request.session.testsfailed
+    http_start = STATS.snapshot()
+    if driver is not None:
+        prepare(driver)
+    elif pool is not None:
+        driver = pool.acquire(prepare)
+    else:
+        driver = config.stash.get(driver_factory_key, create_driver)()
+        prepare(driver)
+        driver.get(BASE_URL)
 
     yield driver
 
     # teardown
-    driver.quit()
\ No newline at end of file
+    if RECORDER.current is not None:
+        RECORDER.current.extra.update(STATS.since(http_start))
+    if network_stats and RECORDER.current is not None:
+        RECORDER.current.extra.update(collect_network_stats(driver))
+        RECORDER.current.extra["resource_policy"] = test_policy.label() if test_policy else "off"
+    SAMPLER.sample(driver)
+    if key is not None and request.session.testsfailed == failures:
+        # the next case of the batch continues in this browser; a failed case may have broken its state
+        batches.keep(key, driver, release)
+    else:
+        release(driver)
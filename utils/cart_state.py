@@ -0,0 +1,75 @@
+import json
+from typing import NamedTuple
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.config import DEFAULT_TIMEOUT
+from utils.product_data import CATALOG
+
+# localStorage key where the app keeps the cart as a JSON array of numeric item ids
+CART_STORAGE_KEY = "cart-contents"
+
+SEED_CART_SCRIPT = """
+    window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));
+    window.__cartSeedPending = true;
+"""
+RELOADED_SCRIPT = "return !window.__cartSeedPending && document.readyState === 'complete';"
+# reads stored cart and rendered badge together: [JSON string or null, badge text or null]
+READ_CART_SCRIPT = """
+    var badge = document.getElementsByClassName("shopping_cart_badge")[0];
+    return [window.localStorage.getItem(arguments[0]), badge ? badge.textContent : null];
+"""
+
+
+class CartState(NamedTuple):
+    """
+    Cart contents as stored by the app and as shown in the header.
+
+    Attributes:
+        product_ids (tuple[str, ...]): Products in the cart, in the order they were added.
+            Unknown numeric item ids are kept as strings of the number.
+        badge_count (int): Number shown on the cart badge (0 when there is no badge).
+    """
+    product_ids: tuple
+    badge_count: int
+
+
+def seed_cart(driver: WebDriver, product_ids):
+    """
+    Puts products into the cart by writing the app's cart storage and reloading the current page once.
+
+    Replaces whatever the cart held before. Meant for tests that need a filled cart but do not test
+    the 'Add to cart' click itself. The browser has to be on the app origin (e.g. logged in).
+
+    Args:
+        driver (WebDriver): Browser of the logged-in user.
+        product_ids (Iterable[str]): Product ids from utils.product_data.PRODUCT_IDS.
+    """
+    item_ids = [CATALOG.by_id[product_id].item_id for product_id in product_ids]
+    driver.execute_script(SEED_CART_SCRIPT, CART_STORAGE_KEY, item_ids)
+    driver.refresh()
+    # the header and buttons are rendered from storage when the page's scripts run; the marker
+    # tells the reloaded document from the old one when refresh() does not block ('none' strategy)
+    WebDriverWait(driver, DEFAULT_TIMEOUT, poll_frequency=0.05).until(
+        lambda d: d.execute_script(RELOADED_SCRIPT)
+    )
+
+
+def read_cart_state(driver: WebDriver):
+    """
+    Reads the stored cart and the cart badge in a single WebDriver round trip.
+
+    Args:
+        driver (WebDriver): Browser on any app page.
+
+    Returns:
+        CartState: Stored products and the badge count.
+    """
+    stored, badge = driver.execute_script(READ_CART_SCRIPT, CART_STORAGE_KEY)
+    item_ids = json.loads(stored) if stored else []
+    return CartState(
+        product_ids=tuple(
+            CATALOG.by_item_id[item_id].product_id if item_id in CATALOG.by_item_id else str(item_id)
+            for item_id in item_ids
+        ),
+        badge_count=int(badge) if badge else 0,
+    )
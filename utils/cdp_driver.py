@@ -0,0 +1,527 @@
+import json
+import time
+import websocket
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, InvalidArgumentException,
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.webdriver_commands import instrument
+
+BACKENDS = ("classic", "cdp")
+# how long get()/refresh() wait for the page-load strategy's event
+PAGE_LOAD_TIMEOUT = 30
+# document events that end a navigation for each page-load strategy ('none' does not wait)
+LOAD_EVENTS = {"normal": "Page.loadEventFired", "eager": "Page.domContentEventFired"}
+
+# DevTools method behind each WebDriver command the backend implements (shown by the command profiler)
+CDP_COMMANDS = {
+    Command.GET: ("CDP", "Page.navigate"),
+    Command.REFRESH: ("CDP", "Page.reload"),
+    Command.ADD_COOKIE: ("CDP", "Runtime.evaluate"),
+    **{
+        command: ("CDP", "Runtime.evaluate")
+        for command in (
+            Command.GET_CURRENT_URL, Command.GET_TITLE, Command.W3C_EXECUTE_SCRIPT,
+            Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+            Command.CLICK_ELEMENT, Command.CLEAR_ELEMENT, Command.SEND_KEYS_TO_ELEMENT,
+            Command.GET_ELEMENT_TEXT, Command.GET_ELEMENT_TAG_NAME, Command.GET_ELEMENT_ATTRIBUTE,
+            Command.GET_ELEMENT_PROPERTY, Command.IS_ELEMENT_ENABLED,
+            Command.IS_ELEMENT_SELECTED,
+        )
+    },
+}
+
+# page-side helper shared by every call: element registry (per document), locator strategies,
+# conversion of elements to references and back. Prepended to each evaluated expression.
+HELPER_SCRIPT = r"""
+var pd = window.__pageDriver;
+if (!pd) {
+    pd = window.__pageDriver = {token: Math.random().toString(36).slice(2), elements: []};
+    pd.fail = function (kind, message) { var error = new Error(message); error.kind = kind; return error; };
+    pd.ref = function (element) {
+        var index = pd.elements.indexOf(element);
+        if (index < 0) { index = pd.elements.push(element) - 1; }
+        return {"__element__": [pd.token, index]};
+    };
+    pd.element = function (ref) {
+        var element = ref[0] === pd.token ? pd.elements[ref[1]] : null;
+        if (!element || !element.isConnected) { throw pd.fail("stale", "element is no longer attached to the DOM"); }
+        return element;
+    };
+    pd.input = function (value) {
+        if (Array.isArray(value)) { return value.map(pd.input); }
+        if (value && typeof value === "object") {
+            if (value["__element__"]) { return pd.element(value["__element__"]); }
+            var copy = {};
+            for (var key in value) { copy[key] = pd.input(value[key]); }
+            return copy;
+        }
+        return value;
+    };
+    pd.output = function (value) {
+        if (value instanceof Element) { return pd.ref(value); }
+        if (value instanceof NodeList || value instanceof HTMLCollection || Array.isArray(value)) {
+            return Array.prototype.map.call(value, pd.output);
+        }
+        if (value && typeof value === "object") {
+            var copy = {};
+            for (var key in value) { copy[key] = pd.output(value[key]); }
+            return copy;
+        }
+        return value === undefined ? null : value;
+    };
+    pd.find = function (root, using, value) {
+        var quoted = '"' + String(value).replace(/(["\\])/g, "\\$1") + '"';
+        switch (using) {
+            case "css selector": return root.querySelectorAll(value);
+            case "id": return root.querySelectorAll("[id=" + quoted + "]");
+            case "name": return root.querySelectorAll("[name=" + quoted + "]");
+            case "class name": return root.querySelectorAll("." + CSS.escape(value));
+            case "tag name": return root.getElementsByTagName(value);
+            case "xpath":
+                var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var nodes = [];
+                for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+                return nodes;
+            case "link text":
+            case "partial link text":
+                return Array.prototype.filter.call(root.querySelectorAll("a"), function (link) {
+                    var text = link.innerText.trim();
+                    return using === "link text" ? text === value : text.indexOf(value) >= 0;
+                });
+        }
+        throw pd.fail("argument", "unsupported locator strategy " + using);
+    };
+    pd.displayed = function (element) {
+        if (element.tagName === "OPTION") { element = element.closest("select") || element; }
+        for (var node = element; node instanceof Element; node = node.parentElement) {
+            if (getComputedStyle(node).opacity === "0") { return false; }
+        }
+        return element.getClientRects().length > 0 && getComputedStyle(element).visibility !== "hidden";
+    };
+    pd.setValue = function (element, value) {
+        var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, value);
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+    };
+}
+"""
+
+CALL_TEMPLATE = """(function () {
+%s
+    function failed(error) {
+        return {error: error.kind || "javascript", message: String(error && error.stack || error)};
+    }
+    try {
+        var result = (function () { %s }).apply(null, pd.input(%s));
+        if (result && typeof result.then === "function") {
+            // a returned promise is awaited, as W3C execute_script does
+            return result.then(function (value) { return {value: pd.output(value)}; }, failed);
+        }
+        return {value: pd.output(result)};
+    } catch (error) {
+        return failed(error);
+    }
+})()"""
+
+CLICK_SCRIPT = """
+    var element = arguments[0];
+    if (element.tagName === "OPTION") {
+        var select = element.closest("select");
+        element.selected = true;
+        if (select) {
+            select.dispatchEvent(new Event("input", {bubbles: true}));
+            select.dispatchEvent(new Event("change", {bubbles: true}));
+        }
+        return;
+    }
+    element.scrollIntoView({block: "center", inline: "center"});
+    var rect = element.getBoundingClientRect();
+    if (!rect.width || !rect.height || !pd.displayed(element)) {
+        throw pd.fail("not_interactable", "element not interactable");
+    }
+    var hit = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+    if (hit && hit !== element && !element.contains(hit)) {
+        throw pd.fail("intercepted", "element click intercepted by " + hit.outerHTML.slice(0, 120));
+    }
+    element.click();
+"""
+TEXT_SCRIPT = "var element = arguments[0]; return pd.displayed(element) ? element.innerText.trim() : '';"
+ATTRIBUTE_SCRIPT = """
+    var element = arguments[0], name = arguments[1], property = element[name];
+    if (property !== undefined && property !== null && typeof property !== "object" && typeof property !== "function") {
+        return typeof property === "boolean" ? (property ? "true" : null) : String(property);
+    }
+    return element.getAttribute(name);
+"""
+SEND_KEYS_SCRIPT = """
+    var element = arguments[0];
+    element.focus();
+    pd.setValue(element, element.value + arguments[1]);
+    if (arguments[2] && element.form) { element.form.requestSubmit(); }
+"""
+
+ERRORS = {
+    "stale": StaleElementReferenceException,
+    "not_interactable": ElementNotInteractableException,
+    "intercepted": ElementClickInterceptedException,
+    "argument": InvalidArgumentException,
+    "javascript": JavascriptException,
+}
+
+
+class CdpElement:
+    """
+    Element handle of the CDP backend: a reference into the page-side registry of its document.
+
+    Every method is one Runtime.evaluate round trip. References go stale when the document is
+    replaced or the element is detached (StaleElementReferenceException, as with WebDriver).
+    """
+
+    def __init__(self, parent, ref):
+        """
+        Initializes the element.
+
+        Args:
+            parent (CdpDriver): Driver the element belongs to.
+            ref (list): [document token, registry index] from the page-side helper.
+        """
+        self.parent = parent
+        self.ref = ref
+
+    @property
+    def id(self):
+        return f"{self.ref[0]}:{self.ref[1]}"
+
+    def __eq__(self, other):
+        return isinstance(other, CdpElement) and self.ref == other.ref
+
+    def __hash__(self):
+        return hash(tuple(self.ref))
+
+    def __repr__(self):
+        return f"<CdpElement {self.id}>"
+
+    def _call(self, command, script, *args):
+        return self.parent.call(command, script, self, *args)
+
+    @property
+    def text(self):
+        return self._call(Command.GET_ELEMENT_TEXT, TEXT_SCRIPT)
+
+    @property
+    def tag_name(self):
+        return self._call(Command.GET_ELEMENT_TAG_NAME, "return arguments[0].tagName.toLowerCase();")
+
+    def click(self):
+        self._call(Command.CLICK_ELEMENT, CLICK_SCRIPT)
+
+    def clear(self):
+        self._call(Command.CLEAR_ELEMENT, "pd.setValue(arguments[0], '');")
+
+    def send_keys(self, *value):
+        """
+        Types text into an input; Keys.ENTER/Keys.RETURN at the end submits its form.
+        Other special keys are not supported by this backend.
+        """
+        text = "".join(str(part) for part in value)
+        submit = text.endswith((Keys.ENTER, Keys.RETURN))
+        if submit:
+            text = text[:-1]
+        if any("\ue000" <= char <= "\ue0ff" for char in text):
+            raise InvalidArgumentException("special keys other than a final ENTER are not supported by the CDP backend")
+        self._call(Command.SEND_KEYS_TO_ELEMENT, SEND_KEYS_SCRIPT, text, submit)
+
+    def get_attribute(self, name: str):
+        # selenium implements get_attribute() and is_displayed() as scripts, reported the same way here
+        return self._call(Command.W3C_EXECUTE_SCRIPT, ATTRIBUTE_SCRIPT, name)
+
+    def get_dom_attribute(self, name: str):
+        return self._call(Command.GET_ELEMENT_ATTRIBUTE, "return arguments[0].getAttribute(arguments[1]);", name)
+
+    def get_property(self, name: str):
+        return self._call(Command.GET_ELEMENT_PROPERTY, "return arguments[0][arguments[1]];", name)
+
+    def is_displayed(self):
+        return self._call(Command.W3C_EXECUTE_SCRIPT, "return pd.displayed(arguments[0]);")
+
+    def is_enabled(self):
+        return self._call(Command.IS_ELEMENT_ENABLED, "return !arguments[0].disabled;")
+
+    def is_selected(self):
+        return self._call(Command.IS_ELEMENT_SELECTED, "return !!(arguments[0].selected || arguments[0].checked);")
+
+    def find_element(self, by: str, value: str):
+        return self.parent.find_element(by, value, root=self)
+
+    def find_elements(self, by: str, value: str):
+        return self.parent.find_elements(by, value, root=self)
+
+
+class _SwitchTo:
+    """
+    driver.switch_to of the CDP backend: switching windows also moves the websocket to that tab.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, window_name: str):
+        self._driver.classic.switch_to.window(window_name)
+        self._driver.attach(window_name)
+
+    def __getattr__(self, name):
+        return getattr(self._driver.classic.switch_to, name)
+
+
+class _CommandEndpoints:
+    """
+    Stand-in for command_executor._commands, so the command profiler labels CDP-backed commands.
+    """
+
+    def __init__(self, classic: WebDriver):
+        self._commands = {**getattr(classic.command_executor, "_commands", {}), **CDP_COMMANDS}
+
+    def close(self):
+        # WebDriver.quit() ends with command_executor.close(); the classic driver's own executor
+        # (the HTTP connections) is closed by classic.quit(), there is nothing to release here
+        pass
+
+
+class CdpDriver:
+    """
+    Page-object driver backend speaking the Chrome DevTools Protocol over one persistent websocket.
+
+    The browser is still started (and quit) through chromedriver; the commands page objects issue
+    (navigation, element lookups and interactions, scripts, cookies) go straight to the tab's
+    DevTools socket instead of one chromedriver HTTP request each. Everything else (windows,
+    cookies cleanup, CDP commands of the resource policy, quit) is delegated to the classic driver.
+
+    Commands are reported to the driver's listeners under their WebDriver names, so metrics,
+    the command profiler and count_commands() work the same on both backends.
+    implicitly_wait() is kept client-side and costs no round trip.
+
+    Attributes:
+        classic (WebDriver): The chromedriver session the browser belongs to.
+    """
+
+    def __init__(self, classic: WebDriver):
+        """
+        Attaches to the current tab of a chromedriver session.
+
+        Args:
+            classic (WebDriver): Local or brokered Chrome session (its debuggerAddress must be reachable).
+        """
+        self.classic = classic
+        self._command_listeners = instrument(classic)._command_listeners
+        self._debugger_address = classic.caps["goog:chromeOptions"]["debuggerAddress"]
+        self._load_event = LOAD_EVENTS.get(classic.caps.get("pageLoadStrategy", "normal"))
+        self._implicit_wait = 0.0
+        self._socket = None
+        self._window = None
+        self._message_id = 0
+        self._events = []
+        self.command_executor = _CommandEndpoints(classic)
+        self.attach(classic.current_window_handle)
+
+    def __getattr__(self, name):
+        if name == "classic":
+            raise AttributeError(name)
+        return getattr(self.classic, name)
+
+    def attach(self, window_handle: str):
+        """
+        Connects the websocket to the tab behind a window handle (chromedriver handles are DevTools target ids).
+        """
+        if self._socket is not None and self._socket.connected and window_handle == self._window:
+            return
+        if self._socket is not None:
+            self._socket.close()
+        # Chrome rejects DevTools websockets that send an Origin header unless --remote-allow-origins is set
+        self._socket = websocket.create_connection(
+            f"ws://{self._debugger_address}/devtools/page/{window_handle}", suppress_origin=True
+        )
+        self._window = window_handle
+        self.send("Page.enable")
+
+    def send(self, method: str, params: dict = None, timeout: float = PAGE_LOAD_TIMEOUT):
+        """
+        Sends a DevTools command and waits for its response; events arriving meanwhile are kept.
+
+        Returns:
+            dict: The command's result.
+        """
+        self._message_id += 1
+        message_id = self._message_id
+        self._socket.settimeout(timeout)
+        self._socket.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+            except websocket.WebSocketTimeoutException:
+                raise TimeoutException(f"DevTools command {method} timed out after {timeout}s")
+            if message.get("id") == message_id:
+                if "error" in message:
+                    raise WebDriverException(f"{method}: {message['error'].get('message')}")
+                return message.get("result", {})
+            if message.get("method") in LOAD_EVENTS.values():
+                self._events.append(message["method"])
+
+    def _await_event(self, event: str, timeout: float):
+        # events are only read while waiting for responses, so poll with a cheap command
+        deadline = time.monotonic() + timeout
+        while event not in self._events:
+            if time.monotonic() > deadline:
+                raise TimeoutException(f"{event} not received within {timeout}s")
+            self._socket.settimeout(max(deadline - time.monotonic(), 0.01))
+            try:
+                message = json.loads(self._socket.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            if message.get("method") in LOAD_EVENTS.values():
+                self._events.append(message["method"])
+
+    def _report(self, command, params, start):
+        duration = time.perf_counter() - start
+        for listener in list(self._command_listeners):
+            listener(command, params, duration)
+
+    def call(self, command: str, script: str, *args):
+        """
+        Runs a function body in the page (as execute_script does) in one Runtime.evaluate round trip.
+
+        Args:
+            command (str): WebDriver command name reported to listeners.
+            script (str): Function body; `arguments` holds args, elements are passed as CdpElement.
+            *args: JSON-serializable arguments or CdpElement.
+
+        Returns:
+            The function's return value, elements converted to CdpElement.
+        """
+        start = time.perf_counter()
+        try:
+            expression = CALL_TEMPLATE % (HELPER_SCRIPT, script, json.dumps(self._wrap(list(args))))
+            result = self.send(
+                "Runtime.evaluate", {"expression": expression, "returnByValue": True, "awaitPromise": True}
+            )
+        finally:
+            self._report(command, {"script": script} if command == Command.W3C_EXECUTE_SCRIPT else None, start)
+        if "exceptionDetails" in result:
+            raise JavascriptException(result["exceptionDetails"].get("text", "evaluation failed"))
+        outcome = result["result"].get("value") or {}
+        if "error" in outcome:
+            raise ERRORS.get(outcome["error"], JavascriptException)(outcome["message"])
+        return self._unwrap(outcome.get("value"))
+
+    def _wrap(self, value):
+        if isinstance(value, CdpElement):
+            return {"__element__": value.ref}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            if "__element__" in value:
+                return CdpElement(self, value["__element__"])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+    def _navigate(self, command, method, params):
+        start = time.perf_counter()
+        try:
+            self._events.clear()
+            result = self.send(method, params)
+            if result.get("errorText"):
+                raise WebDriverException(f"navigation failed: {result['errorText']}")
+            # same-document navigations (no new loader) fire no load events
+            if self._load_event is not None and (method == "Page.reload" or result.get("loaderId")):
+                self._await_event(self._load_event, PAGE_LOAD_TIMEOUT)
+        finally:
+            self._report(command, {"url": params.get("url")} if params else None, start)
+
+    def get(self, url: str):
+        self._navigate(Command.GET, "Page.navigate", {"url": url})
+
+    def refresh(self):
+        self._navigate(Command.REFRESH, "Page.reload", {})
+
+    @property
+    def current_url(self):
+        return self.call(Command.GET_CURRENT_URL, "return location.href;")
+
+    @property
+    def title(self):
+        return self.call(Command.GET_TITLE, "return document.title;")
+
+    @property
+    def switch_to(self):
+        return _SwitchTo(self)
+
+    def execute_script(self, script: str, *args):
+        return self.call(Command.W3C_EXECUTE_SCRIPT, script, *args)
+
+    def find_elements(self, by: str, value: str, root: CdpElement = None):
+        command = Command.FIND_ELEMENTS if root is None else Command.FIND_CHILD_ELEMENTS
+        script = "return pd.find(arguments[0] || document, arguments[1], arguments[2]);"
+        deadline = time.monotonic() + self._implicit_wait
+        while True:
+            elements = self.call(command, script, root, by, value)
+            if elements or time.monotonic() >= deadline:
+                return elements
+            time.sleep(0.05)
+
+    def find_element(self, by: str, value: str, root: CdpElement = None):
+        command = Command.FIND_ELEMENT if root is None else Command.FIND_CHILD_ELEMENT
+        script = "return pd.find(arguments[0] || document, arguments[1], arguments[2])[0] || null;"
+        deadline = time.monotonic() + self._implicit_wait
+        while True:
+            element = self.call(command, script, root, by, value)
+            if element is not None:
+                return element
+            if time.monotonic() >= deadline:
+                raise NoSuchElementException(f"no element matches {by}={value}")
+            time.sleep(0.05)
+
+    def add_cookie(self, cookie_dict: dict):
+        """
+        Sets a cookie for the current page through document.cookie (httpOnly cookies go to the classic driver).
+        """
+        if cookie_dict.get("httpOnly"):
+            self.classic.add_cookie(cookie_dict)
+            return
+        parts = [f"{cookie_dict['name']}={cookie_dict['value']}", f"path={cookie_dict.get('path', '/')}"]
+        if "domain" in cookie_dict:
+            parts.append(f"domain={cookie_dict['domain']}")
+        if "expiry" in cookie_dict:
+            parts.append(f"max-age={int(cookie_dict['expiry'] - time.time())}")
+        if cookie_dict.get("secure"):
+            parts.append("secure")
+        if "sameSite" in cookie_dict:
+            parts.append(f"samesite={cookie_dict['sameSite']}")
+        self.call(Command.ADD_COOKIE, "document.cookie = arguments[0];", "; ".join(parts))
+
+    def implicitly_wait(self, time_to_wait: float):
+        self._implicit_wait = time_to_wait
+
+    def quit(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        self.classic.quit()
+
+
+def wrap_backend(driver: WebDriver, backend: str):
+    """
+    Returns the driver page objects should use for the given backend ("classic" or "cdp").
+    """
+    return CdpDriver(driver) if backend == "cdp" else driver
@@ -0,0 +1,219 @@
+import socket
+import threading
+import urllib3
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from urllib3.connection import HTTPConnection
+from utils.launch_profiles import LaunchProfile, chrome_service
+
+SERVICE_MODES = ("shared", "per-browser")
+# idle keep-alive connections kept per chromedriver (a worker issues commands sequentially;
+# extra room covers pool/broker threads talking to the same chromedriver)
+POOL_MAXSIZE = 4
+# chromedriver is local: a connect that takes longer means it is gone
+CONNECT_TIMEOUT = 5
+# longest single command (a page load under the 'normal' strategy on a slow site)
+COMMAND_TIMEOUT = 120
+# retry only failed connects; a command may not be sent twice
+RETRIES = urllib3.Retry(total=2, connect=2, read=0, redirect=0, status=0)
+# no Nagle delay for the small request/response pairs, keep idle connections alive at the TCP level
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+class ConnectionStats:
+    """
+    Counts HTTP requests to chromedriver and the TCP connections opened for them (one per process).
+
+    Attributes:
+        requests (int): Requests sent.
+        new_connections (int): TCP connections opened; every other request reused a kept-alive one.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self._lock = threading.Lock()
+
+    def count(self, requests: int = 0, new_connections: int = 0):
+        with self._lock:
+            self.requests += requests
+            self.new_connections += new_connections
+
+    def snapshot(self):
+        """
+        Returns the current counters, to be passed to since().
+        """
+        return self.requests, self.new_connections
+
+    def since(self, snapshot):
+        """
+        Returns the traffic since a snapshot as metrics fields.
+
+        Returns:
+            dict: {"http_requests", "http_new_connections"}.
+        """
+        requests, new_connections = snapshot
+        return {"http_requests": self.requests - requests, "http_new_connections": self.new_connections - new_connections}
+
+
+STATS = ConnectionStats()
+
+
+class _CountingConnectionPool(urllib3.HTTPConnectionPool):
+    def _new_conn(self):
+        STATS.count(new_connections=1)
+        return super()._new_conn()
+
+
+def _new_pool_manager():
+    manager = urllib3.PoolManager(
+        num_pools=8,
+        maxsize=POOL_MAXSIZE,
+        block=False,
+        timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=COMMAND_TIMEOUT),
+        retries=RETRIES,
+        socket_options=SOCKET_OPTIONS,
+    )
+    manager.pool_classes_by_scheme = {**manager.pool_classes_by_scheme, "http": _CountingConnectionPool}
+    return manager
+
+
+# one keep-alive pool per process, shared by all drivers (connections outlive single sessions)
+POOL_MANAGER = _new_pool_manager()
+
+
+class ChromedriverConnection(ChromiumRemoteConnection):
+    """
+    Command executor for a local chromedriver using the process-wide tuned connection pool.
+
+    Differences to selenium's default: keep-alive connections are shared across sessions instead of
+    one pool per driver, explicit connect/read timeouts and connect-only retries, TCP keep-alive,
+    and proxy environment variables are ignored (chromedriver is always local or on the broker host).
+    """
+
+    def __init__(self, remote_server_addr: str):
+        super().__init__(
+            remote_server_addr, vendor_prefix="goog", browser_name="chrome", keep_alive=True, ignore_proxy=True
+        )
+
+    def _get_connection_manager(self):
+        return POOL_MANAGER
+
+    def _request(self, method, url, body=None):
+        STATS.count(requests=1)
+        return super()._request(method, url, body)
+
+    def close(self):
+        # the pool is shared by every session of this process; keep its connections
+        pass
+
+
+class ChromeSession(webdriver.Chrome):
+    """
+    Chrome WebDriver on an already running chromedriver, talking through ChromedriverConnection.
+
+    Behaves like webdriver.Chrome (CDP commands, logs); quit() also stops the chromedriver
+    only when the session owns it (per-browser mode).
+    """
+
+    def __init__(self, options, service, owns_service: bool):
+        """
+        Starts a browser session.
+
+        Args:
+            options (Options): Chrome options.
+            service (Service): Running chromedriver.
+            owns_service (bool): Stop the chromedriver on quit().
+        """
+        self.vendor_prefix = "goog"
+        self.service = service
+        self._owns_service = owns_service
+        try:
+            RemoteWebDriver.__init__(self, command_executor=ChromedriverConnection(service.service_url), options=options)
+        except Exception:
+            if owns_service:
+                service.stop()
+            raise
+        self._is_remote = False
+
+    def quit(self) -> None:
+        try:
+            RemoteWebDriver.quit(self)
+        finally:
+            if self._owns_service:
+                self.service.stop()
+
+
+class ChromedriverServices:
+    """
+    Chromedriver processes of one pytest process: one per launch profile in 'shared' mode
+    (every browser of the worker is a new session on it), a fresh one per browser in 'per-browser' mode.
+    """
+
+    def __init__(self):
+        self._services = {}
+        self._lock = threading.Lock()
+
+    def _start(self, profile: LaunchProfile, options):
+        service = chrome_service(profile)
+        service.path = DriverFinder.get_path(service, options)
+        service.start()
+        return service
+
+    def _shared(self, profile: LaunchProfile, options):
+        with self._lock:
+            service = self._services.get(profile.name)
+            if service is None or service.process is None or service.process.poll() is not None:
+                # first browser of this profile, or chromedriver died: (re)start it
+                service = self._services[profile.name] = self._start(profile, options)
+            return service
+
+    def launch(self, profile: LaunchProfile, options, mode: str = "shared"):
+        """
+        Starts a Chrome session.
+
+        Args:
+            profile (LaunchProfile): Launch profile (decides the chromedriver environment).
+            options (Options): Chrome options.
+            mode (str): 'shared' or 'per-browser', see SERVICE_MODES.
+
+        Returns:
+            ChromeSession: The new browser.
+        """
+        if mode == "shared":
+            return ChromeSession(options, self._shared(profile, options), owns_service=False)
+        return ChromeSession(options, self._start(profile, options), owns_service=True)
+
+    def stop(self):
+        """
+        Stops the shared chromedriver processes.
+        """
+        with self._lock:
+            services = list(self._services.values())
+            self._services.clear()
+        for service in services:
+            service.stop()
+
+
+SERVICES = ChromedriverServices()
+
+
+def summarize_http(records):
+    """
+    Aggregates the chromedriver HTTP counters of all test records.
+
+    Returns:
+        dict: requests, new_connections and reuse ratio, or None if no record has them.
+    """
+    records = [record for record in records if "http_requests" in record]
+    if not records:
+        return None
+    requests = sum(record["http_requests"] for record in records)
+    new_connections = sum(record["http_new_connections"] for record in records)
+    return {
+        "requests": requests,
+        "new_connections": new_connections,
+        "reused_ratio": round(1 - new_connections / requests, 4) if requests else 0.0,
+    }
@@ -0,0 +1,184 @@
+import json
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+from utils.test_metrics import worker_id
+
+PROFILE_FILE_PATTERN = "profile-*.json"
+TABLE_FILE = "profile-table.txt"
+COLLAPSED_FILE = "profile.collapsed"
+# attribution used for commands sent from tests/fixtures directly (e.g. driver.current_url)
+OUTSIDE_PAGES = "(outside page objects)"
+
+
+def _page_object_chain(frame):
+    """
+    Returns page-object frames on the call stack, outermost first,
+    as (name, frame) pairs, e.g. [("ProductsPage.open_cart", <frame>), ("ProductsPage.click", <frame>)].
+
+    A frame belongs to a page object when its 'self' is an instance of a class from the pages package.
+    Methods inherited from BasePage are reported under the concrete page class.
+    """
+    chain = []
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if owner is not None and type(owner).__module__.startswith("pages."):
+            chain.append((f"{type(owner).__name__}.{frame.f_code.co_name}", frame))
+        frame = frame.f_back
+    chain.reverse()
+    return chain
+
+
+def _endpoint(driver, command):
+    """
+    Returns the HTTP endpoint of a WebDriver command, e.g. "POST /element".
+    """
+    try:
+        method, path = driver.command_executor._commands[command]
+    except (AttributeError, KeyError):
+        return command
+    return f"{method} {path.replace('/session/$sessionId', '') or '/'}"
+
+
+class CommandProfiler:
+    """
+    Attributes every WebDriver command to the page-object method that issued it.
+
+    Consecutive commands issued from the same invocation of the outermost page-object method are
+    summed into one call, giving per-call WebDriver latency for the calls/total/p50/p95 table.
+    Every command also lands in folded stacks "test;PageObject.method;...;endpoint [locator]"
+    weighted in microseconds (input for flamegraph.pl or speedscope).
+
+    Attributes:
+        enabled (bool): Profiling is active (set by --profile-webdriver).
+        test (str): Node id of the running test, used as the root of every stack.
+        samples (dict[str, list[float]]): WebDriver time per call in seconds, by page-object method.
+        commands (dict[str, int]): Number of commands by page-object method.
+        stacks (dict[str, int]): Folded stack -> total microseconds.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.test = "(session)"
+        self.samples = defaultdict(list)
+        self.commands = defaultdict(int)
+        self.stacks = defaultdict(int)
+        # [method, frame of its invocation, accumulated seconds] of the call in progress
+        self._open_call = None
+
+    def _account(self, method, frame, duration):
+        if self._open_call is not None and self._open_call[1] is frame and frame is not None:
+            self._open_call[2] += duration
+            return
+        self.flush()
+        self._open_call = [method, frame, duration]
+
+    def flush(self):
+        """
+        Closes the page-object call in progress (called between tests and before dumping).
+        """
+        if self._open_call is not None:
+            method, _, duration = self._open_call
+            self.samples[method].append(duration)
+            self._open_call = None
+
+    def listener_for(self, driver):
+        """
+        Returns a command listener bound to the given driver (needed to resolve endpoints).
+        """
+        def on_command(command, params, duration):
+            if not self.enabled:
+                return
+            chain = _page_object_chain(sys._getframe(1))
+            method, frame = chain[0] if chain else (OUTSIDE_PAGES, None)
+            self.commands[method] += 1
+            self._account(method, frame, duration)
+
+            leaf = _endpoint(driver, command)
+            if params and "using" in params:
+                leaf += f" [{params['using']}={params.get('value')}]"
+            # ';' separates frames in the collapsed format
+            frames = [self.test, *([name for name, _ in chain] or [OUTSIDE_PAGES]), leaf]
+            self.stacks[";".join(frame.replace(";", ",") for frame in frames)] += int(duration * 1_000_000)
+
+        return on_command
+
+    def dump(self, profile_dir: Path):
+        """
+        Writes this process's raw samples to profile-<worker>.json for the controller to merge.
+        """
+        self.flush()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        with open(profile_dir / f"profile-{worker_id()}.json", "w") as profile_file:
+            json.dump({"samples": self.samples, "commands": self.commands, "stacks": self.stacks}, profile_file)
+
+
+# one profiler per process; create_driver() attaches its listener to every browser
+PROFILER = CommandProfiler()
+
+
+def clear_profiles(profile_dir: Path):
+    """
+    Removes per-worker profile files left by a previous run.
+    """
+    for path in profile_dir.glob(PROFILE_FILE_PATTERN):
+        path.unlink()
+
+
+def merge_profiles(profile_dir: Path):
+    """
+    Merges per-worker profiles and writes the aggregated table and the collapsed-stack file.
+
+    Returns:
+        tuple: (table rows sorted by total time desc, path of the table, path of the collapsed file),
+        or None if nothing was profiled.
+    """
+    samples = defaultdict(list)
+    commands = defaultdict(int)
+    stacks = defaultdict(int)
+    for path in sorted(profile_dir.glob(PROFILE_FILE_PATTERN)):
+        with open(path) as profile_file:
+            profile = json.load(profile_file)
+        for method, durations in profile["samples"].items():
+            samples[method].extend(durations)
+        for method, count in profile["commands"].items():
+            commands[method] += count
+        for stack, micros in profile["stacks"].items():
+            stacks[stack] += micros
+    if not samples:
+        return None
+
+    rows = []
+    for method, durations in samples.items():
+        durations.sort()
+        rows.append({
+            "method": method,
+            "calls": len(durations),
+            "commands": commands[method],
+            "total": sum(durations),
+            "p50": statistics.median(durations),
+            "p95": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        })
+    rows.sort(key=lambda row: row["total"], reverse=True)
+
+    table_path = profile_dir / TABLE_FILE
+    with open(table_path, "w") as table_file:
+        table_file.write(format_table(rows) + "\n")
+    collapsed_path = profile_dir / COLLAPSED_FILE
+    with open(collapsed_path, "w") as collapsed_file:
+        collapsed_file.writelines(f"{stack} {micros}\n" for stack, micros in sorted(stacks.items()))
+    return rows, table_path, collapsed_path
+
+
+def format_table(rows):
+    """
+    Formats profile rows as a fixed-width text table (WebDriver time per call, in milliseconds).
+    """
+    lines = [f"{'page-object method':<48}{'calls':>8}{'cmds':>8}{'total ms':>12}{'p50 ms':>10}{'p95 ms':>10}"]
+    for row in rows:
+        lines.append(
+            f"{row['method']:<48}{row['calls']:>8}{row['commands']:>8}{row['total'] * 1000:>12.1f}"
+            f"{row['p50'] * 1000:>10.2f}{row['p95'] * 1000:>10.2f}"
+        )
+    return "\n".join(lines)
@@ -1,12 +1,13 @@
 from dotenv import load_dotenv
 import os
 
-BASE_URL = "https://www.saucedemo.com/"
+load_dotenv()
+
+# SAUCEDEMO_BASE_URL switches the target, e.g. http://127.0.0.1:8765/ for the bundled local stand-in
+BASE_URL = os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/").rstrip("/") + "/"
 SOCIAL_MEDIA = "https://www.linkedin.com/company/sauce-labs/"
 DEFAULT_TIMEOUT = 10
 
-load_dotenv()
-
 class TestUsers:
     standard: dict[str, str] = {
         "username": os.getenv("TEST_STANDARD_USER", ""),
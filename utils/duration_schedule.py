@@ -0,0 +1,166 @@
+import heapq
+import statistics
+from xdist.scheduler import LoadScheduling
+
+# config.cache key of per-test durations: {nodeid: smoothed seconds}
+DURATIONS_CACHE_KEY = "saucedemo/durations"
+# weight of the latest run in the smoothed duration (the rest is history)
+SMOOTHING = 0.5
+# estimate for a test when nothing similar has ever run
+DEFAULT_ESTIMATE = 2.0
+
+
+def _function_id(nodeid: str):
+    # "tests/test_cart.py::test_add_to_cart[standard_user-backpack]" -> "tests/test_cart.py::test_add_to_cart"
+    return nodeid.split("[", 1)[0]
+
+
+def _module_id(nodeid: str):
+    return nodeid.split("::", 1)[0]
+
+
+class DurationHistory:
+    """
+    Smoothed per-test durations from earlier runs, with estimates for tests that never ran.
+
+    A new test is estimated from the median of its other parametrizations, then of its module,
+    then of the whole suite, and DEFAULT_ESTIMATE when there is no history at all.
+
+    Attributes:
+        durations (dict[str, float]): Node id -> smoothed duration in seconds.
+    """
+
+    def __init__(self, durations=None):
+        self.durations = dict(durations or {})
+        functions = {}
+        modules = {}
+        for nodeid, duration in self.durations.items():
+            functions.setdefault(_function_id(nodeid), []).append(duration)
+            modules.setdefault(_module_id(nodeid), []).append(duration)
+        self._functions = {key: statistics.median(values) for key, values in functions.items()}
+        self._modules = {key: statistics.median(values) for key, values in modules.items()}
+        self._suite = statistics.median(self.durations.values()) if self.durations else DEFAULT_ESTIMATE
+
+    @classmethod
+    def load(cls, cache):
+        """
+        Loads the history stored by update() (empty if there is none).
+        """
+        return cls(cache.get(DURATIONS_CACHE_KEY, None))
+
+    def is_known(self, nodeid: str):
+        return nodeid in self.durations
+
+    def estimate(self, nodeid: str):
+        """
+        Returns the expected duration of a test in seconds.
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if _function_id(nodeid) in self._functions:
+            return self._functions[_function_id(nodeid)]
+        return self._modules.get(_module_id(nodeid), self._suite)
+
+    def update(self, cache, records):
+        """
+        Blends this run's test durations into the history and saves it.
+
+        Args:
+            cache (Cache): config.cache.
+            records (list[dict]): Metrics records of this run (test_metrics.load_metrics()).
+        """
+        for record in records:
+            previous = self.durations.get(record["test"])
+            duration = record["total"]
+            if previous is not None:
+                duration = SMOOTHING * duration + (1 - SMOOTHING) * previous
+            self.durations[record["test"]] = round(duration, 4)
+        cache.set(DURATIONS_CACHE_KEY, self.durations)
+
+
+def predict_makespan(durations, workers: int):
+    """
+    Simulates longest-first list scheduling: each test goes to the worker that becomes free first.
+
+    Args:
+        durations (Iterable[float]): Expected test durations in seconds.
+        workers (int): Number of xdist workers.
+
+    Returns:
+        float: Expected wall time until the last worker finishes, in seconds.
+    """
+    finish_times = [0.0] * max(workers, 1)
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
+
+
+def actual_makespan(records):
+    """
+    Returns the wall time from the first test start to the last test end of a run, in seconds.
+    """
+    if not records:
+        return 0.0
+    return max(record["started"] + record["total"] for record in records) - min(record["started"] for record in records)
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """
+    xdist load scheduling that hands out the longest tests first (LPT) instead of collection order.
+
+    Tests are dispatched one at a time to whichever worker frees up, keeping the two pending items
+    a worker needs to run a test; short tests fill in at the end, so no worker is left with a
+    long straggler while the others idle.
+
+    Attributes:
+        history (DurationHistory): Durations used to order the tests.
+        prediction (dict): Set when scheduling starts: {"makespan", "workers", "tests", "estimated"}.
+    """
+
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+        self.prediction = None
+
+    def schedule(self):
+        """
+        Orders the collection by expected duration (longest first) and sends every worker its first tests.
+        """
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = [self.history.estimate(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: estimates[index], reverse=True)
+        self.prediction = {
+            "makespan": predict_makespan(estimates, len(self.nodes)),
+            "workers": len(self.nodes),
+            "tests": len(self.collection),
+            "estimated": sum(not self.history.is_known(nodeid) for nodeid in self.collection),
+        }
+        if not self.collection:
+            return
+        # round-robin, so the longest tests start on different workers
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0):
+        """
+        Tops a worker up to two pending tests with the longest remaining ones, or shuts it down when none are left.
+        """
+        if node.shutting_down:
+            return
+        if self.pending:
+            self._send_tests(node, 2 - len(self.node2pending[node]))
+        else:
+            node.shutdown()
@@ -0,0 +1,247 @@
+import base64
+import binascii
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import NamedTuple
+from utils.test_metrics import worker_id
+
+ARTIFACTS_DIR = "artifacts"
+# page sources shared by all tests of the run, named by content hash
+DOM_DIR = "dom"
+# larger screenshots are dropped (a full-page PNG of a broken layout can reach several MiB)
+MAX_SCREENSHOT_BYTES = 2 * 1024 * 1024
+# page sources are cut to this many characters before hashing and compressing
+MAX_PAGE_SOURCE_CHARS = 1_000_000
+# newest console entries kept
+MAX_CONSOLE_ENTRIES = 200
+# bytes one process may write; later failures only get their manifest
+MAX_TOTAL_BYTES = 100 * 1024 * 1024
+
+
+class FailureSnapshot(NamedTuple):
+    """
+    Raw browser state taken right after a test failed, before the browser is released.
+
+    Nothing is decoded or compressed yet; that happens on the writer thread.
+
+    Attributes:
+        test (str): pytest node id.
+        phase (str): "setup" or "call".
+        url (str): Current URL, None if it could not be read.
+        screenshot (str): Base64 PNG as returned by WebDriver, None if it could not be taken.
+        page_source (str): Serialized DOM, None if it could not be read.
+        console (list[dict]): Browser console entries, empty if unavailable.
+        errors (list[str]): What could not be captured and why.
+    """
+    test: str
+    phase: str
+    url: str
+    screenshot: str
+    page_source: str
+    console: list
+    errors: list
+
+
+def _artifact_name(nodeid: str):
+    # file-system safe and unique per test: readable prefix plus a short hash of the full node id
+    readable = re.sub(r"[^A-Za-z0-9._-]+", "_", nodeid.rsplit("/", 1)[-1]).strip("_")[:80]
+    return f"{readable}-{hashlib.sha1(nodeid.encode()).hexdigest()[:8]}"
+
+
+def _write_atomic(path: Path, data: bytes):
+    # other workers may write the same content-addressed file; readers never see a partial one
+    temporary = path.with_name(f".{path.name}.{worker_id()}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def take_snapshot(driver, test: str, phase: str):
+    """
+    Reads the failure state from a live browser: URL, screenshot, page source and console log.
+
+    Each part is read independently, so a crashed renderer still yields whatever is left. Any error
+    (WebDriver, connection or websocket) is recorded in errors instead of raised: the snapshot is taken
+    inside pytest's report hook, where an exception would abort the whole run.
+
+    Args:
+        driver (PageDriver): Browser of the failed test.
+        test (str): pytest node id.
+        phase (str): Test phase that failed.
+
+    Returns:
+        FailureSnapshot: The raw state.
+    """
+    errors = []
+
+    def read(name, getter, default=None):
+        try:
+            return getter()
+        except Exception as exc:
+            errors.append(f"{name}: {type(exc).__name__}: {exc}".splitlines()[0])
+            return default
+
+    return FailureSnapshot(
+        test=test,
+        phase=phase,
+        url=read("url", lambda: driver.current_url),
+        screenshot=read("screenshot", driver.get_screenshot_as_base64),
+        page_source=read("page_source", lambda: driver.page_source),
+        console=read("console", lambda: driver.get_log("browser")[-MAX_CONSOLE_ENTRIES:], []),
+        errors=errors,
+    )
+
+
+class FailureArtifacts:
+    """
+    Writes failure artifacts of one pytest process on a background thread.
+
+    The test thread only queues a FailureSnapshot; decoding, compression and disk writes happen on
+    the writer thread, which is started by the first failure (a passing run never starts it).
+    Per failed test: <name>.json (manifest with URL, console log, file names), <name>.png and the
+    page source as dom/<sha256>.html.gz, written once however many failures show the same DOM.
+
+    Attributes:
+        directory (Path): Artifact directory.
+        failures (int): Snapshots queued.
+        bytes_written (int): Bytes written to disk.
+        duplicate_sources (int): Page sources that were already written.
+        dropped (int): Screenshots and page sources left out by the size caps.
+    """
+
+    def __init__(self):
+        self.directory = None
+        self.failures = 0
+        self.bytes_written = 0
+        self.duplicate_sources = 0
+        self.dropped = 0
+        self._queue = None
+        self._thread = None
+        self._written_sources = set()
+
+    def open(self, directory: Path):
+        """
+        Sets the artifact directory; nothing is created until a test fails.
+        """
+        self.directory = directory
+
+    def capture(self, driver, test: str, phase: str):
+        """
+        Snapshots a failed test's browser and queues the snapshot for writing.
+
+        Args:
+            driver (PageDriver): Browser of the failed test, still alive.
+            test (str): pytest node id.
+            phase (str): Test phase that failed.
+
+        Returns:
+            Path: Manifest file the artifacts will be listed in.
+        """
+        snapshot = take_snapshot(driver, test, phase)
+        if self._thread is None:
+            self.directory.joinpath(DOM_DIR).mkdir(parents=True, exist_ok=True)
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(target=self._run, name="failure-artifacts", daemon=True)
+            self._thread.start()
+        self.failures += 1
+        self._queue.put(snapshot)
+        return self.directory / f"{_artifact_name(test)}.json"
+
+    def close(self):
+        """
+        Waits until every queued snapshot is written and stops the writer thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            snapshot = self._queue.get()
+            if snapshot is None:
+                return
+            try:
+                self._write(snapshot)
+            except (OSError, ValueError, binascii.Error) as exc:
+                # losing an artifact must not break the run; the failure itself is already reported
+                logging.warning(f"Failure artifacts for {snapshot.test} not written: {type(exc).__name__}: {exc}")
+
+    def _write_file(self, path: Path, data: bytes, manifest: dict):
+        if self.bytes_written + len(data) > MAX_TOTAL_BYTES:
+            self.dropped += 1
+            manifest["errors"].append(f"{path.name}: over the {MAX_TOTAL_BYTES} byte budget of this worker")
+            return False
+        _write_atomic(path, data)
+        self.bytes_written += len(data)
+        return True
+
+    def _write(self, snapshot: FailureSnapshot):
+        name = _artifact_name(snapshot.test)
+        manifest = {
+            "test": snapshot.test,
+            "phase": snapshot.phase,
+            "worker": worker_id(),
+            "url": snapshot.url,
+            "screenshot": None,
+            "page_source": None,
+            "console": snapshot.console,
+            "errors": list(snapshot.errors),
+        }
+
+        if snapshot.screenshot is not None:
+            png = base64.b64decode(snapshot.screenshot)
+            if len(png) > MAX_SCREENSHOT_BYTES:
+                self.dropped += 1
+                manifest["errors"].append(f"screenshot: {len(png)} bytes over the {MAX_SCREENSHOT_BYTES} byte cap")
+            elif self._write_file(self.directory / f"{name}.png", png, manifest):
+                manifest["screenshot"] = f"{name}.png"
+
+        if snapshot.page_source is not None:
+            source = snapshot.page_source
+            if len(source) > MAX_PAGE_SOURCE_CHARS:
+                manifest["errors"].append(f"page_source: cut to {MAX_PAGE_SOURCE_CHARS} of {len(source)} characters")
+                source = source[:MAX_PAGE_SOURCE_CHARS]
+            data = source.encode("utf-8", "replace")
+            relative = f"{DOM_DIR}/{hashlib.sha256(data).hexdigest()}.html.gz"
+            path = self.directory / relative
+            if relative in self._written_sources or path.exists():
+                self.duplicate_sources += 1
+                manifest["page_source"] = relative
+            elif self._write_file(path, gzip.compress(data, compresslevel=6), manifest):
+                self._written_sources.add(relative)
+                manifest["page_source"] = relative
+
+        # the manifest is small and always written, even over the budget
+        data = json.dumps(manifest, indent=1).encode()
+        _write_atomic(self.directory / f"{name}.json", data)
+        self.bytes_written += len(data)
+
+    def stats(self):
+        """
+        Returns artifact counters as a plain dict (safe to send from xdist workers to the controller).
+        """
+        return {
+            "failures": self.failures,
+            "bytes_written": self.bytes_written,
+            "duplicate_sources": self.duplicate_sources,
+            "dropped": self.dropped,
+        }
+
+
+# one writer per process, used by the makereport hook
+ARTIFACTS = FailureArtifacts()
+
+
+def clear_artifacts(directory: Path):
+    """
+    Removes the artifacts of a previous run.
+    """
+    shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,97 @@
+import os
+from pathlib import Path
+from typing import NamedTuple
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+# switches that stop Chrome's own background work (updates, sync, field trials, translate...)
+QUIET_ARGUMENTS = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-extensions",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+)
+# candidate RAM-backed directories for throwaway browser profiles, first match wins
+TMPFS_CANDIDATES = (os.environ.get("XDG_RUNTIME_DIR", ""), "/dev/shm")
+
+
+class LaunchProfile(NamedTuple):
+    """
+    Named set of Chrome launch settings, selected with --browser-profile.
+
+    Attributes:
+        name (str): Profile name.
+        arguments (tuple[str, ...]): Chrome command line switches.
+        headless (bool): Run with the new headless mode (--headless=new).
+        window_size (tuple[int, int]): Fixed window size, or None to maximize.
+        tmpfs_profile (bool): Keep chromedriver's temporary user-data-dir on a RAM-backed filesystem.
+    """
+    name: str
+    arguments: tuple
+    headless: bool = True
+    window_size: tuple = (1280, 800)
+    tmpfs_profile: bool = False
+
+
+PROFILES = {
+    # cheapest launch: no background services, no GPU, no sandbox, profile in RAM
+    "fast-ci": LaunchProfile(
+        "fast-ci",
+        ("--incognito", "--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox", *QUIET_ARGUMENTS),
+        tmpfs_profile=True,
+    ),
+    # closest to a user's browser: only headless and a desktop-sized window
+    "faithful": LaunchProfile("faithful", ("--incognito",), window_size=(1920, 1080)),
+    # visible browser for stepping through a test locally
+    "debug": LaunchProfile("debug", ("--incognito",), headless=False, window_size=None),
+}
+DEFAULT_PROFILE = "fast-ci"
+
+
+def tmpfs_dir():
+    """
+    Returns the first RAM-backed directory from TMPFS_CANDIDATES, or None if there is none.
+    """
+    try:
+        mounts = {line.split()[1]: line.split()[2] for line in Path("/proc/mounts").read_text().splitlines()}
+    except OSError:
+        return None
+    for candidate in TMPFS_CANDIDATES:
+        if candidate and mounts.get(candidate) == "tmpfs" and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
+def chrome_options(profile: LaunchProfile):
+    """
+    Builds Chrome options for the given profile.
+    """
+    options = Options()
+    if profile.headless:
+        options.add_argument("--headless=new")
+    if profile.window_size is None:
+        options.add_argument("--start-maximized")
+    else:
+        options.add_argument(f"--window-size={profile.window_size[0]},{profile.window_size[1]}")
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    return options
+
+
+def chrome_service(profile: LaunchProfile):
+    """
+    Builds the chromedriver service for the given profile.
+
+    chromedriver creates (and removes on quit) the browser's temporary user-data-dir under TMPDIR,
+    so pointing TMPDIR at tmpfs keeps profile I/O in memory without any cleanup on our side.
+    """
+    directory = tmpfs_dir() if profile.tmpfs_profile else None
+    if directory is None:
+        return Service()
+    return Service(env={**os.environ, "TMPDIR": directory})
@@ -0,0 +1 @@
+from utils.local_app.server import LocalApp, is_local_url
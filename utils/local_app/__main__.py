@@ -0,0 +1,3 @@
+from utils.local_app.server import main
+
+main()
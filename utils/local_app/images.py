@@ -0,0 +1,43 @@
+import struct
+import zlib
+
+IMG_WIDTH = 120
+IMG_HEIGHT = 150
+
+
+def _chunk(kind: bytes, data: bytes):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def product_png(seed: int):
+    """
+    Builds a small deterministic RGB PNG used as a stand-in product photo.
+
+    Every seed gives a visibly different pattern (diagonal gradient plus stripes),
+    so content and perceptual hashes differ between products.
+
+    Args:
+        seed (int): Value selecting colours and stripe layout.
+
+    Returns:
+        bytes: Encoded PNG file.
+    """
+    base = ((seed * 97) % 256, (seed * 57 + 80) % 256, (seed * 181 + 160) % 256)
+    stripe = 6 + seed * 3
+    rows = []
+    for y in range(IMG_HEIGHT):
+        row = bytearray(b"\x00")  # filter type: none
+        for x in range(IMG_WIDTH):
+            shade = (x + y) * 255 // (IMG_WIDTH + IMG_HEIGHT)
+            if ((x + seed * y // 4) // stripe) % 2:
+                shade = 255 - shade
+            row += bytes(((c + shade) // 2 for c in base))
+        rows.append(bytes(row))
+
+    header = struct.pack(">IIBBBBB", IMG_WIDTH, IMG_HEIGHT, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _chunk(b"IHDR", header)
+        + _chunk(b"IDAT", zlib.compress(b"".join(rows), 9))
+        + _chunk(b"IEND", b"")
+    )
@@ -0,0 +1,269 @@
+import html
+import json
+from utils.config import SOCIAL_MEDIA
+from utils.product_data import PRODUCT_IDS, PRODUCT_ITEM_IDS, PRODUCT_NAMES, PRODUCT_PRICES
+
+PASSWORD = "secret_sauce"
+# username -> behaviour profile, same accounts as the public saucedemo.com
+USERS = {
+    "standard_user": "standard",
+    "locked_out_user": "locked",
+    "problem_user": "problem",
+}
+PROBLEM_IMAGE = "sl-404"
+
+# per product: (image file stem, description)
+PRODUCT_EXTRAS = {
+    "sauce-labs-backpack": (
+        "sauce-backpack-1200x1500",
+        "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style "
+        "with unequaled laptop and tablet protection.",
+    ),
+    "sauce-labs-bike-light": (
+        "bike-light-1200x1500",
+        "A red light isn't the desired state in testing but it sure helps when riding your bike at night.",
+    ),
+    "sauce-labs-bolt-t-shirt": (
+        "bolt-shirt-1200x1500",
+        "Get your testing superhero on with the Sauce Labs bolt T-shirt.",
+    ),
+    "sauce-labs-fleece-jacket": (
+        "sauce-pullover-1200x1500",
+        "It's not every day that you come across a midweight quarter-zip fleece jacket capable of "
+        "handling everything from a relaxing day outdoors to a busy day at the office.",
+    ),
+    "sauce-labs-onesie": (
+        "red-onesie-1200x1500",
+        "Rib snap infant onesie for the junior automation engineer in development.",
+    ),
+    "test.allthethings()-t-shirt-(red)": (
+        "red-tatt-1200x1500",
+        "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate "
+        "a few tests.",
+    ),
+}
+
+
+def image_url(product_id: str, variant: str):
+    """
+    Returns the image path a given user variant sees for a product (problem_user gets the wrong image).
+    """
+    stem = PROBLEM_IMAGE if variant == "problem" else PRODUCT_EXTRAS[product_id][0]
+    return f"/static/media/{stem}.png"
+
+
+def _catalog_json():
+    products = {
+        PRODUCT_ITEM_IDS[product_id]: {
+            "slug": product_id,
+            "name": PRODUCT_NAMES[product_id],
+            "price": PRODUCT_PRICES[product_id],
+            "desc": PRODUCT_EXTRAS[product_id][1],
+        }
+        for product_id in PRODUCT_IDS
+    }
+    return json.dumps(products)
+
+
+def _document(title: str, body: str, page: str, variant: str = ""):
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"<title>{title}</title><link rel=\"stylesheet\" href=\"/static/style.css\"></head>"
+        f"<body data-page=\"{page}\" data-variant=\"{variant}\">{body}"
+        f"<script>window.CATALOG = {_catalog_json()};</script>"
+        "<script src=\"/static/app.js\"></script></body></html>"
+    ).encode()
+
+
+def _header(title: str, with_sort: bool = False):
+    sort = ""
+    if with_sort:
+        sort = (
+            "<select class=\"product_sort_container\" data-test=\"product-sort-container\">"
+            "<option value=\"az\">Name (A to Z)</option><option value=\"za\">Name (Z to A)</option>"
+            "<option value=\"lohi\">Price (low to high)</option><option value=\"hilo\">Price (high to low)</option>"
+            "</select>"
+        )
+    return (
+        "<div id=\"header_container\" class=\"header_container\">"
+        "<div class=\"primary_header\">"
+        "<button id=\"react-burger-menu-btn\" type=\"button\">Open Menu</button>"
+        "<nav class=\"bm-menu\" hidden>"
+        "<a id=\"inventory_sidebar_link\" href=\"/inventory.html\">All Items</a>"
+        "<a id=\"logout_sidebar_link\" href=\"#\">Logout</a>"
+        "<a id=\"reset_sidebar_link\" href=\"#\">Reset App State</a></nav>"
+        "<div class=\"app_logo\">Swag Labs</div>"
+        "<div id=\"shopping_cart_container\" class=\"shopping_cart_container\">"
+        "<a class=\"shopping_cart_link\" data-test=\"shopping-cart-link\" href=\"/cart.html\"></a></div></div>"
+        f"<div class=\"header_secondary_container\"><span class=\"title\">{title}</span>{sort}</div></div>"
+    )
+
+
+def _footer():
+    return (
+        "<footer class=\"footer\"><ul class=\"social\">"
+        "<li class=\"social_twitter\"><a href=\"https://twitter.com/saucelabs\" target=\"_blank\" rel=\"noreferrer\">Twitter</a></li>"
+        "<li class=\"social_facebook\"><a href=\"https://www.facebook.com/saucelabs\" target=\"_blank\" rel=\"noreferrer\">Facebook</a></li>"
+        f"<li class=\"social_linkedin\"><a href=\"{SOCIAL_MEDIA}\" target=\"_blank\" rel=\"noreferrer\">LinkedIn</a></li>"
+        "</ul><div class=\"footer_copy\">Local saucedemo stand-in</div></footer>"
+    )
+
+
+def login_page():
+    """
+    Returns the login page (served at /).
+    """
+    users = "<br>".join(USERS)
+    body = (
+        "<div class=\"login_wrapper\"><div class=\"login_logo\">Swag Labs</div>"
+        "<form id=\"login_form\">"
+        "<input class=\"input_error form_input\" placeholder=\"Username\" type=\"text\" data-test=\"username\" id=\"user-name\" name=\"user-name\" autocorrect=\"off\" autocapitalize=\"none\">"
+        "<input class=\"input_error form_input\" placeholder=\"Password\" type=\"password\" data-test=\"password\" id=\"password\" name=\"password\">"
+        "<div class=\"error-message-container\"></div>"
+        "<input type=\"submit\" class=\"submit-button btn_action\" data-test=\"login-button\" id=\"login-button\" name=\"login-button\" value=\"Login\">"
+        "</form>"
+        f"<div class=\"login_credentials\"><h4>Accepted usernames are:</h4>{users}</div>"
+        f"<div class=\"login_password\"><h4>Password for all users:</h4>{PASSWORD}</div></div>"
+    )
+    return _document("Swag Labs", body, "login")
+
+
+def inventory_page(variant: str):
+    """
+    Returns the inventory page for a user variant.
+
+    Products are rendered in A-Z order like on the real site; buttons and badge are synced
+    with the cart storage by app.js.
+    """
+    items = []
+    for product_id in sorted(PRODUCT_IDS, key=PRODUCT_NAMES.get):
+        item_id = PRODUCT_ITEM_IDS[product_id]
+        name = html.escape(PRODUCT_NAMES[product_id])
+        items.append(
+            f"<div class=\"inventory_item\" data-id=\"{item_id}\">"
+            f"<div class=\"inventory_item_img\"><a href=\"#\" id=\"item_{item_id}_img_link\" data-item=\"{item_id}\">"
+            f"<img alt=\"{name}\" class=\"inventory_item_img\" src=\"{image_url(product_id, variant)}\"></a></div>"
+            "<div class=\"inventory_item_description\"><div class=\"inventory_item_label\">"
+            f"<a href=\"#\" id=\"item_{item_id}_title_link\" data-item=\"{item_id}\">"
+            f"<div class=\"inventory_item_name\">{name}</div></a>"
+            f"<div class=\"inventory_item_desc\">{html.escape(PRODUCT_EXTRAS[product_id][1])}</div></div>"
+            f"<div class=\"pricebar\"><div class=\"inventory_item_price\">${PRODUCT_PRICES[product_id]}</div>"
+            f"<button class=\"btn btn_inventory\" data-slug=\"{product_id}\" data-id=\"{item_id}\"></button>"
+            "</div></div></div>"
+        )
+    body = (
+        f"<div id=\"page_wrapper\">{_header('Products', with_sort=True)}"
+        f"<div id=\"inventory_container\"><div class=\"inventory_list\">{''.join(items)}</div></div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "inventory", variant)
+
+
+def item_page(product_id: str, variant: str):
+    """
+    Returns the product details page (inventory-item.html?id=) for a product and user variant.
+    """
+    name = html.escape(PRODUCT_NAMES[product_id])
+    item_id = PRODUCT_ITEM_IDS[product_id]
+    body = (
+        f"<div id=\"page_wrapper\">{_header('')}"
+        "<div class=\"inventory_details\">"
+        "<button class=\"btn inventory_details_back_button\" id=\"back-to-products\" name=\"back-to-products\">Back to products</button>"
+        f"<div class=\"inventory_details_container\"><div class=\"inventory_item_container\" data-id=\"{item_id}\">"
+        f"<div class=\"inventory_details_img_container\"><img alt=\"{name}\" class=\"inventory_details_img\" src=\"{image_url(product_id, variant)}\"></div>"
+        "<div class=\"inventory_details_desc_container\">"
+        f"<div class=\"inventory_details_name large_size\">{name}</div>"
+        f"<div class=\"inventory_details_desc large_size\">{html.escape(PRODUCT_EXTRAS[product_id][1])}</div>"
+        f"<div class=\"inventory_details_price\">${PRODUCT_PRICES[product_id]}</div>"
+        f"<button class=\"btn btn_inventory btn_details\" data-slug=\"{product_id}\" data-id=\"{item_id}\" data-details=\"1\"></button>"
+        "</div></div></div></div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "item", variant)
+
+
+def missing_item_page(variant: str):
+    """
+    Returns the details page shown for an unknown item id.
+    """
+    body = (
+        f"<div id=\"page_wrapper\">{_header('')}"
+        "<div class=\"inventory_details\">"
+        "<button class=\"btn inventory_details_back_button\" id=\"back-to-products\" name=\"back-to-products\">Back to products</button>"
+        "<div class=\"inventory_details_name large_size\">ITEM NOT FOUND</div></div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "item", variant)
+
+
+def cart_page(variant: str):
+    """
+    Returns the cart page; cart rows are rendered from the cart storage by app.js.
+    """
+    body = (
+        f"<div id=\"page_wrapper\">{_header('Your Cart')}"
+        "<div id=\"cart_contents_container\"><div class=\"cart_list\">"
+        "<div class=\"cart_quantity_label\">QTY</div><div class=\"cart_desc_label\">Description</div></div>"
+        "<div class=\"cart_footer\">"
+        "<button class=\"btn btn_secondary back\" id=\"continue-shopping\" name=\"continue-shopping\">Continue Shopping</button>"
+        "<button class=\"btn btn_action checkout_button\" id=\"checkout\" name=\"checkout\">Checkout</button>"
+        "</div></div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "cart", variant)
+
+
+def checkout_step_one_page(variant: str):
+    """
+    Returns the checkout information form.
+    """
+    body = (
+        f"<div id=\"page_wrapper\">{_header('Checkout: Your Information')}"
+        "<div id=\"checkout_info_container\"><form id=\"checkout_form\">"
+        "<input class=\"input_error form_input\" placeholder=\"First Name\" type=\"text\" data-test=\"firstName\" id=\"first-name\" name=\"firstName\">"
+        "<input class=\"input_error form_input\" placeholder=\"Last Name\" type=\"text\" data-test=\"lastName\" id=\"last-name\" name=\"lastName\">"
+        "<input class=\"input_error form_input\" placeholder=\"Zip/Postal Code\" type=\"text\" data-test=\"postalCode\" id=\"postal-code\" name=\"postalCode\">"
+        "<div class=\"error-message-container\"></div>"
+        "<div class=\"checkout_buttons\">"
+        "<button class=\"btn btn_secondary back cart_cancel_link\" id=\"cancel\" name=\"cancel\" type=\"button\">Cancel</button>"
+        "<input type=\"submit\" class=\"submit-button btn btn_primary cart_button btn_action\" data-test=\"continue\" id=\"continue\" name=\"continue\" value=\"Continue\">"
+        "</div></form></div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "checkout-one", variant)
+
+
+def checkout_step_two_page(variant: str):
+    """
+    Returns the checkout overview; rows and totals are rendered from the cart storage by app.js.
+    """
+    body = (
+        f"<div id=\"page_wrapper\">{_header('Checkout: Overview')}"
+        "<div id=\"checkout_summary_container\"><div class=\"cart_list\"></div>"
+        "<div class=\"summary_info\">"
+        "<div class=\"summary_subtotal_label\" data-test=\"subtotal-label\"></div>"
+        "<div class=\"summary_tax_label\" data-test=\"tax-label\"></div>"
+        "<div class=\"summary_total_label\" data-test=\"total-label\"></div>"
+        "<div class=\"cart_footer\">"
+        "<button class=\"btn btn_secondary back cart_cancel_link\" id=\"cancel\" name=\"cancel\">Cancel</button>"
+        "<button class=\"btn btn_action cart_button\" id=\"finish\" name=\"finish\">Finish</button>"
+        "</div></div></div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "checkout-two", variant)
+
+
+def checkout_complete_page(variant: str):
+    """
+    Returns the order confirmation page.
+    """
+    body = (
+        f"<div id=\"page_wrapper\">{_header('Checkout: Complete!')}"
+        "<div id=\"checkout_complete_container\" class=\"checkout_complete_container\">"
+        "<h2 class=\"complete-header\">Thank you for your order!</h2>"
+        "<div class=\"complete-text\">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>"
+        "<button class=\"btn btn_primary btn_small\" id=\"back-to-products\" name=\"back-to-products\">Back Home</button>"
+        "</div>"
+        f"{_footer()}</div>"
+    )
+    return _document("Swag Labs", body, "checkout-complete", variant)
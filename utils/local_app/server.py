@@ -0,0 +1,182 @@
+import argparse
+import mimetypes
+import threading
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from utils.local_app import render
+from utils.local_app.images import product_png
+from utils.product_data import PRODUCT_IDS, PRODUCT_ITEM_IDS
+
+STATIC_DIR = Path(__file__).parent / "static"
+LOCAL_HOSTS = ("127.0.0.1", "localhost")
+# pages that need a logged-in session, mapped to their pre-rendered builder
+PROTECTED_PAGES = {
+    "/inventory.html": render.inventory_page,
+    "/cart.html": render.cart_page,
+    "/checkout-step-one.html": render.checkout_step_one_page,
+    "/checkout-step-two.html": render.checkout_step_two_page,
+    "/checkout-complete.html": render.checkout_complete_page,
+}
+VARIANTS = ("standard", "problem")
+
+
+def is_local_url(url: str):
+    """
+    Checks whether the given base URL points to this machine (i.e. the stand-in should serve it).
+    """
+    return urlsplit(url).hostname in LOCAL_HOSTS
+
+
+def _build_responses():
+    """
+    Renders every page and asset once, so requests are served straight from memory.
+
+    Returns:
+        dict: (path, variant) -> (content type, body bytes); assets use variant None.
+    """
+    responses = {("/", None): ("text/html; charset=utf-8", render.login_page())}
+    for variant in VARIANTS:
+        for path, builder in PROTECTED_PAGES.items():
+            responses[(path, variant)] = ("text/html; charset=utf-8", builder(variant))
+        for product_id in PRODUCT_IDS:
+            page = render.item_page(product_id, variant)
+            responses[(f"/inventory-item.html?id={PRODUCT_ITEM_IDS[product_id]}", variant)] = ("text/html; charset=utf-8", page)
+        responses[("/inventory-item.html", variant)] = ("text/html; charset=utf-8", render.missing_item_page(variant))
+
+    for static_file in STATIC_DIR.iterdir():
+        content_type = mimetypes.guess_type(static_file.name)[0] or "application/octet-stream"
+        responses[(f"/static/{static_file.name}", None)] = (content_type, static_file.read_bytes())
+
+    stems = [render.PRODUCT_EXTRAS[product_id][0] for product_id in PRODUCT_IDS] + [render.PROBLEM_IMAGE]
+    for seed, stem in enumerate(stems):
+        responses[(f"/static/media/{stem}.png", None)] = ("image/png", product_png(seed))
+    return responses
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive lets the browser reuse connections between page loads
+    protocol_version = "HTTP/1.1"
+    # headers and body leave in one segment instead of waiting on delayed ACKs
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    responses = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def _variant(self):
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = jar.get("session-username")
+        profile = render.USERS.get(morsel.value) if morsel else None
+        return profile if profile in VARIANTS else None
+
+    def _send(self, status, content_type=None, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path or "/"
+
+        asset = self.responses.get((path, None))
+        if asset is not None:
+            cache = "no-cache" if path == "/" else "max-age=3600"
+            return self._send(200, *asset, headers=[("Cache-Control", cache)])
+
+        if path in PROTECTED_PAGES or path == "/inventory-item.html":
+            variant = self._variant()
+            if variant is None:
+                return self._send(302, headers=[("Location", "/")])
+            key = path
+            if path == "/inventory-item.html":
+                item_id = parse_qs(url.query).get("id", [""])[0]
+                key = f"{path}?id={item_id}"
+            page = self.responses.get((key, variant)) or self.responses[(path, variant)]
+            return self._send(200, *page, headers=[("Cache-Control", "no-cache")])
+
+        self._send(404, "text/plain; charset=utf-8", b"Not Found")
+
+    do_HEAD = do_GET
+
+
+class LocalApp:
+    """
+    In-process HTTP stand-in for saucedemo.com.
+
+    Serves login, inventory, inventory-item, cart and checkout pages using the same IDs and
+    classes as the real site (and as the page objects), with the standard, locked and problem
+    user behaviours. Pages are pre-rendered in memory and served from a background thread.
+
+    Attributes:
+        host (str): Interface the server listens on.
+        port (int): Port the server listens on (0 picks a free port on start()).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initializes the LocalApp.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 for any free port.
+        """
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """
+        Returns the URL to be used as BASE_URL for this server.
+        """
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """
+        Starts serving in a daemon thread.
+
+        Returns:
+            LocalApp: self, to allow LocalApp().start() chaining.
+        """
+        handler = type("LocalAppHandler", (_Handler,), {"responses": _build_responses()})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-saucedemo", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server and waits for the serving thread to exit.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local saucedemo stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    app = LocalApp(args.host, args.port).start()
+    print(f"Serving saucedemo stand-in at {app.base_url} (Ctrl+C to stop)")
+    try:
+        app._thread.join()
+    except KeyboardInterrupt:
+        app.stop()
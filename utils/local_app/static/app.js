@@ -0,0 +1,239 @@
+// Behaviour of the local saucedemo stand-in. Storage layout matches saucedemo.com:
+// session in the "session-username" cookie, cart as a JSON array of item ids in localStorage "cart-contents".
+(function () {
+  "use strict";
+
+  var CART_KEY = "cart-contents";
+  var SESSION_COOKIE = "session-username";
+  var ACCOUNTS = {standard_user: "standard", locked_out_user: "locked", problem_user: "problem"};
+  var PASSWORD = "secret_sauce";
+  // problem_user cannot add these items from the inventory and cannot remove the others
+  var PROBLEM_BROKEN_ADD = {1: true, 3: true, 5: true};
+
+  var page = document.body.dataset.page;
+  var problem = document.body.dataset.variant === "problem";
+  var catalog = window.CATALOG;
+
+  function readCart() {
+    try {
+      return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function writeCart(cart) {
+    if (cart.length) {
+      window.localStorage.setItem(CART_KEY, JSON.stringify(cart));
+    } else {
+      window.localStorage.removeItem(CART_KEY);
+    }
+    renderBadge();
+  }
+
+  function renderBadge() {
+    var link = document.querySelector(".shopping_cart_link");
+    if (!link) return;
+    var count = readCart().length;
+    var badge = link.querySelector(".shopping_cart_badge");
+    if (!count) {
+      if (badge) badge.remove();
+      return;
+    }
+    if (!badge) {
+      badge = document.createElement("span");
+      badge.className = "shopping_cart_badge";
+      badge.dataset.test = "shopping-cart-badge";
+      link.appendChild(badge);
+    }
+    badge.textContent = String(count);
+  }
+
+  function renderButton(button) {
+    var id = Number(button.dataset.id);
+    var inCart = readCart().indexOf(id) !== -1;
+    var prefix = inCart ? "remove" : "add-to-cart";
+    var suffix = button.dataset.details ? "" : "-" + button.dataset.slug;
+    button.id = prefix + suffix;
+    button.name = prefix + suffix;
+    button.textContent = inCart ? "Remove" : "Add to cart";
+    button.classList.toggle("btn_primary", !inCart);
+    button.classList.toggle("btn_secondary", inCart);
+  }
+
+  function toggleItem(button) {
+    var id = Number(button.dataset.id);
+    var cart = readCart();
+    var index = cart.indexOf(id);
+    var onInventory = !button.dataset.details;
+    if (index === -1) {
+      if (problem && onInventory && PROBLEM_BROKEN_ADD[id]) return;
+      cart.push(id);
+    } else {
+      if (problem && onInventory && !PROBLEM_BROKEN_ADD[id]) return;
+      cart.splice(index, 1);
+    }
+    writeCart(cart);
+    renderButton(button);
+  }
+
+  function money(value) {
+    return "$" + value.toFixed(2);
+  }
+
+  function cartRow(id, removable) {
+    var product = catalog[id];
+    var row = document.createElement("div");
+    row.className = "cart_item";
+    row.innerHTML =
+      '<div class="cart_quantity">1</div><div class="cart_item_label">' +
+      '<a href="/inventory-item.html?id=' + id + '" id="item_' + id + '_title_link">' +
+      '<div class="inventory_item_name"></div></a><div class="inventory_item_desc"></div>' +
+      '<div class="item_pricebar"><div class="inventory_item_price">$' + product.price + "</div></div></div>";
+    row.querySelector(".inventory_item_name").textContent = product.name;
+    row.querySelector(".inventory_item_desc").textContent = product.desc;
+    if (removable) {
+      var button = document.createElement("button");
+      button.className = "btn btn_secondary btn_small cart_button";
+      button.id = "remove-" + product.slug;
+      button.name = button.id;
+      button.textContent = "Remove";
+      button.addEventListener("click", function () {
+        writeCart(readCart().filter(function (item) { return item !== id; }));
+        row.remove();
+      });
+      row.querySelector(".item_pricebar").appendChild(button);
+    }
+    return row;
+  }
+
+  function showError(form, message) {
+    var container = form.querySelector(".error-message-container");
+    container.classList.add("error");
+    container.innerHTML = '<h3 data-test="error"></h3>';
+    container.firstChild.textContent = message;
+  }
+
+  function go(path) {
+    window.location.href = path;
+  }
+
+  function initLogin() {
+    var form = document.getElementById("login_form");
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var username = document.getElementById("user-name").value;
+      var password = document.getElementById("password").value;
+      if (!username) return showError(form, "Epic sadface: Username is required");
+      if (!password) return showError(form, "Epic sadface: Password is required");
+      if (!ACCOUNTS.hasOwnProperty(username) || password !== PASSWORD) {
+        return showError(form, "Epic sadface: Username and password do not match any user in this service");
+      }
+      if (ACCOUNTS[username] === "locked") {
+        return showError(form, "Epic sadface: Sorry, this user has been locked out.");
+      }
+      document.cookie = SESSION_COOKIE + "=" + username + "; path=/";
+      go("/inventory.html");
+    });
+  }
+
+  function initInventory() {
+    var list = document.querySelector(".inventory_list");
+    list.addEventListener("click", function (event) {
+      var link = event.target.closest("a[data-item]");
+      if (link) {
+        event.preventDefault();
+        // problem_user is taken to the neighbouring item
+        var id = Number(link.dataset.item) + (problem ? 1 : 0);
+        go("/inventory-item.html?id=" + id);
+      }
+    });
+    document.querySelector(".product_sort_container").addEventListener("change", function (event) {
+      if (problem) return;
+      var mode = event.target.value;
+      var items = Array.prototype.slice.call(list.children);
+      items.sort(function (a, b) {
+        var pa = catalog[a.dataset.id], pb = catalog[b.dataset.id];
+        if (mode === "lohi") return Number(pa.price) - Number(pb.price);
+        if (mode === "hilo") return Number(pb.price) - Number(pa.price);
+        var order = pa.name < pb.name ? -1 : pa.name > pb.name ? 1 : 0;
+        return mode === "za" ? -order : order;
+      });
+      items.forEach(function (item) { list.appendChild(item); });
+    });
+  }
+
+  function initCart() {
+    var list = document.querySelector(".cart_list");
+    readCart().forEach(function (id) {
+      if (catalog[id]) list.appendChild(cartRow(id, true));
+    });
+    document.getElementById("continue-shopping").addEventListener("click", function () { go("/inventory.html"); });
+    document.getElementById("checkout").addEventListener("click", function () { go("/checkout-step-one.html"); });
+  }
+
+  function initCheckoutOne() {
+    var form = document.getElementById("checkout_form");
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      if (!document.getElementById("first-name").value) return showError(form, "Error: First Name is required");
+      if (!document.getElementById("last-name").value) return showError(form, "Error: Last Name is required");
+      if (!document.getElementById("postal-code").value) return showError(form, "Error: Postal Code is required");
+      go("/checkout-step-two.html");
+    });
+    document.getElementById("cancel").addEventListener("click", function () { go("/cart.html"); });
+  }
+
+  function initCheckoutTwo() {
+    var list = document.querySelector(".cart_list");
+    var subtotal = 0;
+    readCart().forEach(function (id) {
+      if (!catalog[id]) return;
+      list.appendChild(cartRow(id, false));
+      subtotal += Number(catalog[id].price);
+    });
+    var tax = Math.round(subtotal * 8) / 100;
+    document.querySelector(".summary_subtotal_label").textContent = "Item total: " + money(subtotal);
+    document.querySelector(".summary_tax_label").textContent = "Tax: " + money(tax);
+    document.querySelector(".summary_total_label").textContent = "Total: " + money(subtotal + tax);
+    document.getElementById("cancel").addEventListener("click", function () { go("/inventory.html"); });
+    document.getElementById("finish").addEventListener("click", function () {
+      writeCart([]);
+      go("/checkout-complete.html");
+    });
+  }
+
+  function initChrome() {
+    var menuButton = document.getElementById("react-burger-menu-btn");
+    if (!menuButton) return;
+    var menu = document.querySelector(".bm-menu");
+    menuButton.addEventListener("click", function () { menu.hidden = !menu.hidden; });
+    document.getElementById("logout_sidebar_link").addEventListener("click", function (event) {
+      event.preventDefault();
+      document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+      go("/");
+    });
+    document.getElementById("reset_sidebar_link").addEventListener("click", function (event) {
+      event.preventDefault();
+      writeCart([]);
+      document.querySelectorAll("button[data-id]").forEach(renderButton);
+    });
+    var back = document.getElementById("back-to-products");
+    if (back) back.addEventListener("click", function () { go("/inventory.html"); });
+    document.querySelectorAll("button[data-id]").forEach(function (button) {
+      renderButton(button);
+      button.addEventListener("click", function () { toggleItem(button); });
+    });
+    renderBadge();
+  }
+
+  var init = {
+    "login": initLogin,
+    "inventory": initInventory,
+    "cart": initCart,
+    "checkout-one": initCheckoutOne,
+    "checkout-two": initCheckoutTwo
+  }[page];
+  initChrome();
+  if (init) init();
+})();
@@ -0,0 +1,198 @@
+import json
+import os
+from pathlib import Path
+from selenium.webdriver.remote.webdriver import WebDriver
+
+PROC = Path("/proc")
+MIB = 1024 * 1024
+# used until a run has measured real browser memory on this machine
+DEFAULT_BROWSER_RSS = 400 * MIB
+# pytest worker interpreter + chromedriver on top of the browser itself
+WORKER_OVERHEAD = 120 * MIB
+# share of available memory kept free for the OS and the controller
+MEMORY_HEADROOM = 0.2
+# config.cache key holding the median browser RSS measured by the last run
+BROWSER_RSS_CACHE_KEY = "saucedemo/browser_rss"
+
+
+def available_memory():
+    """
+    Returns available system memory in bytes (MemAvailable from /proc/meminfo), or None if unknown.
+    """
+    try:
+        with open(PROC / "meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def cached_browser_rss(config):
+    """
+    Returns the browser RSS stored by the previous run via config.cache.set(BROWSER_RSS_CACHE_KEY, ...).
+
+    Reads the cache file directly because xdist sizes workers before the cache plugin is configured.
+
+    :return: Bytes, or DEFAULT_BROWSER_RSS if nothing was measured yet
+    """
+    cache_dir = config.rootpath / config.getini("cache_dir")
+    try:
+        return int(json.loads((cache_dir / "v" / BROWSER_RSS_CACHE_KEY).read_text()))
+    except (OSError, ValueError, TypeError):
+        return DEFAULT_BROWSER_RSS
+
+
+def cpu_count():
+    """
+    Returns the number of CPUs this process may run on.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _children_map():
+    # parent -> children from every /proc/<pid>/stat, for kernels without the per-task children files
+    children = {}
+    for stat_path in PROC.glob("[0-9]*/stat"):
+        try:
+            stat = stat_path.read_text()
+        except OSError:
+            continue
+        # the command name may contain spaces, fields after ')' are fixed
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(stat_path.parent.name))
+    return children
+
+
+def _rss(pid: int):
+    try:
+        with open(PROC / str(pid) / "status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _task_children(pid: int):
+    # direct children listed by the kernel per thread (CONFIG_PROC_CHILDREN), no scan of every process
+    children = []
+    for path in PROC.glob(f"{pid}/task/*/children"):
+        try:
+            children.extend(int(child) for child in path.read_text().split())
+        except OSError:
+            continue
+    return children
+
+
+def _child_lookup():
+    if (PROC / "self" / "task" / str(os.getpid()) / "children").exists():
+        return _task_children
+    children = _children_map()
+    return lambda pid: children.get(pid, ())
+
+
+def _cmdline(pid: int):
+    try:
+        return (PROC / str(pid) / "cmdline").read_bytes().split(b"\0")
+    except OSError:
+        return []
+
+
+def process_tree_rss(pid: int, children=None):
+    """
+    Returns the resident memory in bytes of a process and all its descendants.
+
+    :param children: Function returning the child PIDs of a PID (default: read from /proc)
+    """
+    children = children or _child_lookup()
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss(current)
+        pending.extend(children(current))
+    return total
+
+
+def browser_rss(driver: WebDriver):
+    """
+    Returns the memory used by the Chrome processes of one locally started browser session.
+
+    A shared chromedriver (--chromedriver shared) runs the browsers of every pooled, batched and
+    session-scoped driver of the worker, so only the Chrome main process started for this session
+    (a chromedriver child launched with the session's --user-data-dir) and its descendants are counted.
+
+    :return: Bytes, or None for browsers without a local chromedriver process (e.g. remote sessions)
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None or not PROC.exists():
+        return None
+    user_data_dir = (driver.capabilities.get("chrome") or {}).get("userDataDir")
+    if not user_data_dir:
+        return None
+    flag = f"--user-data-dir={user_data_dir}".encode()
+    children = _child_lookup()
+    for child in children(process.pid):
+        if flag in _cmdline(child):
+            return process_tree_rss(child, children)
+    return None
+
+
+def memory_worker_count(available: int, browser_rss_estimate: int, cpus: int):
+    """
+    Sizes the xdist worker count so every worker's browser fits into available memory.
+
+    Args:
+        available (int): Available memory in bytes.
+        browser_rss_estimate (int): Expected memory per browser in bytes.
+        cpus (int): Upper bound given by the CPU count.
+
+    Returns:
+        int: Number of workers, at least 1 and at most cpus.
+    """
+    budget = available * (1 - MEMORY_HEADROOM)
+    return max(1, min(cpus, int(budget // (browser_rss_estimate + WORKER_OVERHEAD))))
+
+
+class MemorySampler:
+    """
+    Tracks browser memory seen by one pytest process.
+
+    Attributes:
+        samples (list[int]): Browser RSS in bytes, one sample per finished test.
+        peak (int): Highest browser RSS observed in this process.
+    """
+
+    def __init__(self):
+        self.samples = []
+        self.peak = 0
+
+    def sample(self, driver: WebDriver):
+        """
+        Records the current memory of the given browser (no-op for remote browsers).
+        """
+        rss = browser_rss(driver)
+        if rss:
+            self.samples.append(rss)
+            self.peak = max(self.peak, rss)
+
+    def stats(self):
+        """
+        Returns sampler counters as a plain dict (safe to send from xdist workers to the controller).
+        """
+        ordered = sorted(self.samples)
+        return {
+            "peak": self.peak,
+            "median": ordered[len(ordered) // 2] if ordered else 0,
+            "samples": len(ordered),
+        }
+
+
+# one sampler per process, fed by the driver fixture
+SAMPLER = MemorySampler()
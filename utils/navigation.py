@@ -0,0 +1,23 @@
+from utils.config import BASE_URL
+from utils.product_data import CATALOG
+
+# pages reachable by URL once logged in (the session cookie is all the app checks)
+INVENTORY_URL = f"{BASE_URL}inventory.html"
+CART_URL = f"{BASE_URL}cart.html"
+CHECKOUT_URL = f"{BASE_URL}checkout-step-one.html"
+
+
+def product_details_url(product_id: str):
+    """
+    Returns the details page URL of a product, e.g. ".../inventory-item.html?id=4" for the backpack.
+
+    Args:
+        product_id (str): Product id from utils.product_data.PRODUCT_IDS.
+
+    Returns:
+        str: Absolute URL.
+
+    Raises:
+        KeyError: If the product has no known item id.
+    """
+    return f"{BASE_URL}inventory-item.html?id={CATALOG.by_id[product_id].item_id}"
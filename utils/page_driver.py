@@ -0,0 +1,93 @@
+from typing import Protocol
+
+
+class PageElement(Protocol):
+    """
+    The part of Selenium's WebElement that page objects and tests use.
+
+    Implemented by selenium's WebElement (classic backend) and utils.cdp_driver.CdpElement.
+    """
+
+    @property
+    def text(self) -> str:
+        ...
+
+    @property
+    def tag_name(self) -> str:
+        ...
+
+    def click(self) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def send_keys(self, *value) -> None:
+        ...
+
+    def get_attribute(self, name: str):
+        ...
+
+    def get_dom_attribute(self, name: str):
+        ...
+
+    def is_displayed(self) -> bool:
+        ...
+
+    def is_enabled(self) -> bool:
+        ...
+
+    def is_selected(self) -> bool:
+        ...
+
+    def find_element(self, by: str, value: str) -> "PageElement":
+        ...
+
+    def find_elements(self, by: str, value: str) -> list:
+        ...
+
+
+class PageDriver(Protocol):
+    """
+    The part of Selenium's WebDriver that page objects and tests use.
+
+    Page objects are written against this protocol, so the same tests run on either backend:
+    selenium's WebDriver (classic, one HTTP request to chromedriver per command) or
+    utils.cdp_driver.CdpDriver (commands over one persistent DevTools websocket).
+    """
+
+    @property
+    def current_url(self) -> str:
+        ...
+
+    @property
+    def window_handles(self) -> list:
+        ...
+
+    @property
+    def switch_to(self):
+        ...
+
+    def get(self, url: str) -> None:
+        ...
+
+    def refresh(self) -> None:
+        ...
+
+    def find_element(self, by: str, value: str) -> PageElement:
+        ...
+
+    def find_elements(self, by: str, value: str) -> list:
+        ...
+
+    def execute_script(self, script: str, *args):
+        ...
+
+    def add_cookie(self, cookie_dict: dict) -> None:
+        ...
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        ...
+
+    def quit(self) -> None:
+        ...
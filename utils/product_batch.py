@@ -0,0 +1,151 @@
+import logging
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config import BASE_URL
+
+# parameter that makes a test one case of a product batch
+BATCH_PARAM = "product_id"
+# fixture whose user is shared by all cases of a batch
+BATCH_USER_FIXTURE = "var_user_logged"
+
+
+def batch_key(item):
+    """
+    Returns the batch of a product case: its test function and var_user_logged user.
+
+    Returns:
+        str: e.g. "tests/test_cart.py::test_remove_from_cart_on_cart_page::problem_user",
+        or None for tests that are not product cases of a logged-in user.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None or BATCH_PARAM not in callspec.params or BATCH_USER_FIXTURE not in callspec.params:
+        return None
+    current_user, _ = callspec.params[BATCH_USER_FIXTURE]
+    return f"{item.nodeid.split('[', 1)[0]}::{current_user}"
+
+
+def order_batches(items):
+    """
+    Reorders collected items in place so that the cases of every batch run back to back,
+    at the position of the batch's first case. Other tests keep their place.
+    """
+    batches = {}
+    for item in items:
+        key = batch_key(item)
+        if key is not None:
+            batches.setdefault(key, []).append(item)
+    ordered = []
+    for item in items:
+        key = batch_key(item)
+        if key is None:
+            ordered.append(item)
+        elif key in batches:
+            ordered.extend(batches.pop(key))
+    items[:] = ordered
+
+
+def reset_case_state(driver: WebDriver):
+    """
+    Cleans a batch browser between two product cases while keeping the user logged in.
+
+    Closes extra tabs and clears localStorage (the cart) and sessionStorage; the session cookie stays.
+
+    Returns:
+        bool: False when the browser left the app, so the session cannot be resumed.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    if not driver.current_url.startswith(BASE_URL):
+        return False
+    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    return True
+
+
+class ProductBatches:
+    """
+    Keeps the logged-in browser of the current product batch between its cases (--batch-products).
+
+    Each case is still its own test: the driver fixture resumes the batch browser instead of
+    launching one, and var_user_logged skips the login when `resumed` is set. The browser is
+    released when the next test belongs to another batch, after a failed case, or at session end.
+
+    Attributes:
+        resumed (bool): The current test got the previous case's browser.
+        sessions (int): Browsers started for batches.
+        cases (int): Product cases run in batch mode.
+    """
+
+    def __init__(self):
+        self.resumed = False
+        self.sessions = 0
+        self.cases = 0
+        self._key = None
+        self._driver = None
+        self._release = None
+
+    def resume(self, key):
+        """
+        Returns the batch browser when the test continues the current batch, cleaned for the next case.
+        Otherwise releases the held browser.
+
+        Args:
+            key (str): batch_key() of the test, None for tests outside any batch.
+
+        Returns:
+            WebDriver: The resumed browser, or None when the test needs a new one.
+        """
+        self.resumed = False
+        if key is not None:
+            self.cases += 1
+        if key is not None and key == self._key:
+            driver = self._driver
+            try:
+                if reset_case_state(driver):
+                    self._driver = None
+                    self.resumed = True
+                    return driver
+            except WebDriverException as exc:
+                logging.warning(f"Batch browser unusable, starting a new session: {type(exc).__name__}")
+        self.close()
+        if key is not None:
+            self.sessions += 1
+        return None
+
+    def keep(self, key, driver: WebDriver, release):
+        """
+        Holds a case's browser for the next case of the same batch.
+
+        Args:
+            key (str): batch_key() of the finished case.
+            driver (WebDriver): Its browser.
+            release (Callable[[WebDriver], None]): How to get rid of the browser (quit or pool release).
+        """
+        self._key = key
+        self._driver = driver
+        self._release = release
+
+    def close(self):
+        """
+        Releases the held browser, if any.
+        """
+        driver, release = self._driver, self._release
+        self._key = self._driver = self._release = None
+        if driver is not None:
+            try:
+                release(driver)
+            except WebDriverException:
+                pass
+
+    def stats(self):
+        """
+        Returns batch counters as a plain dict (safe to send from xdist workers to the controller).
+        """
+        return {"cases": self.cases, "sessions": self.sessions, "saved": self.cases - self.sessions}
+
+
+# key under which the per-process batches are kept in config.stash
+product_batches_key = pytest.StashKey[ProductBatches]()
@@ -1,27 +1,150 @@
-PRODUCT_IDS = [
-    "sauce-labs-backpack",
-    "sauce-labs-bike-light",
-    "sauce-labs-bolt-t-shirt",
-    "sauce-labs-fleece-jacket",
-    "sauce-labs-onesie",
-    "test.allthethings()-t-shirt-(red)"
-]
+import re
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+def normalize_name(display_name: str):
+    """
+    Turns a display name into the suite's product id format, e.g. "Sauce Labs Backpack" -> "sauce-labs-backpack".
+    """
+    return display_name.strip().lower().replace(" ", "-")
+
+
+class Product(NamedTuple):
+    """
+    One catalog entry (immutable, tuple-backed).
+
+    Attributes:
+        product_id (str): Normalized display name, used as the product key across the suite.
+        name (str): Exact display name on the website.
+        price (str): Price without the currency sign, e.g. "29.99".
+        item_id (int): Numeric id used by the website in inventory-item.html?id= links and cart storage.
+    """
+    product_id: str
+    name: str
+    price: str
+    item_id: int
+
+
+class Catalog:
+    """
+    Immutable product catalog with precomputed lookups.
+
+    Every index is built once, so page objects and tests resolve display names, ids and prices
+    with a dict lookup instead of normalizing strings per element.
+
+    Attributes:
+        products (tuple[Product, ...]): Products in catalog order.
+        by_id (Mapping[str, Product]): Product by product_id.
+        by_name (Mapping[str, Product]): Product by exact display name.
+        by_normalized_name (Mapping[str, Product]): Product by normalize_name(display name).
+        by_item_id (Mapping[int, Product]): Product by numeric item id.
+        by_price (Mapping[str, tuple[Product, ...]]): Products sharing a price.
+    """
+    __slots__ = ("products", "by_id", "by_name", "by_normalized_name", "by_item_id", "by_price")
+
+    def __init__(self, products):
+        """
+        Builds the catalog and its indexes.
+
+        Args:
+            products (Iterable[Product]): Catalog entries.
+        """
+        self.products = tuple(products)
+        self.by_id = MappingProxyType({product.product_id: product for product in self.products})
+        self.by_name = MappingProxyType({product.name: product for product in self.products})
+        self.by_normalized_name = MappingProxyType({normalize_name(product.name): product for product in self.products})
+        self.by_item_id = MappingProxyType({product.item_id: product for product in self.products})
+        by_price = {}
+        for product in self.products:
+            by_price.setdefault(product.price, []).append(product)
+        self.by_price = MappingProxyType({price: tuple(products) for price, products in by_price.items()})
+
+    def __iter__(self):
+        return iter(self.products)
+
+    def __len__(self):
+        return len(self.products)
+
+    def __contains__(self, product_id):
+        return product_id in self.by_id
+
+    def __eq__(self, other):
+        return isinstance(other, Catalog) and self.products == other.products
+
+    def product_id_for(self, display_name: str):
+        """
+        Returns the product id of a display name: a precomputed lookup for known products,
+        normalize_name() only for names the catalog does not know.
+        """
+        product = self.by_name.get(display_name)
+        return product.product_id if product is not None else normalize_name(display_name)
+
+    def is_complete(self):
+        """
+        Checks that every product was read fully: non-empty id and name, a price like "29.99"
+        and an integer item id. A scraped catalog is only cached when this holds.
+        """
+        return bool(self.products) and all(
+            product.product_id
+            and product.name
+            and isinstance(product.price, str) and re.fullmatch(r"\d+\.\d{2}", product.price)
+            and isinstance(product.item_id, int)
+            for product in self.products
+        )
+
+    def as_rows(self):
+        """
+        Returns the catalog as JSON-serializable rows (see from_rows()).
+        """
+        return [list(product) for product in self.products]
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Rebuilds a catalog from as_rows() output.
+        """
+        return cls(Product(*row) for row in rows)
+
+
+CATALOG = Catalog([
+    Product("sauce-labs-backpack", "Sauce Labs Backpack", "29.99", 4),
+    Product("sauce-labs-bike-light", "Sauce Labs Bike Light", "9.99", 0),
+    Product("sauce-labs-bolt-t-shirt", "Sauce Labs Bolt T-Shirt", "15.99", 1),
+    Product("sauce-labs-fleece-jacket", "Sauce Labs Fleece Jacket", "49.99", 5),
+    Product("sauce-labs-onesie", "Sauce Labs Onesie", "7.99", 2),
+    Product("test.allthethings()-t-shirt-(red)", "Test.allTheThings() T-Shirt (Red)", "15.99", 3),
+])
+
+# config.cache key prefix of the catalog scraped from the live site (see the live_catalog fixture)
+LIVE_CATALOG_CACHE_KEY = "saucedemo/catalog"
+# older cached snapshots (catalog and reference images) are taken again, so the checks keep looking at the site
+LIVE_CATALOG_MAX_AGE = 24 * 60 * 60
+
+# views derived from CATALOG, kept for existing imports
+PRODUCT_IDS = [product.product_id for product in CATALOG]
 
 # Mapping of product IDs to their exact display names on the website
-PRODUCT_NAMES = {
-    "sauce-labs-backpack": "Sauce Labs Backpack",
-    "sauce-labs-bike-light": "Sauce Labs Bike Light",
-    "sauce-labs-bolt-t-shirt": "Sauce Labs Bolt T-Shirt",
-    "sauce-labs-fleece-jacket": "Sauce Labs Fleece Jacket",
-    "sauce-labs-onesie": "Sauce Labs Onesie",
-    "test.allthethings()-t-shirt-(red)": "Test.allTheThings() T-Shirt (Red)"
+PRODUCT_NAMES = {product.product_id: product.name for product in CATALOG}
+
+PRODUCT_PRICES = {product.product_id: product.price for product in CATALOG}
+
+# Numeric item ids used by the website in inventory-item.html?id= links and cart storage
+PRODUCT_ITEM_IDS = {product.product_id: product.item_id for product in CATALOG}
+
+# Reference product images: file stem of the picture each product must show
+# (the live site adds a content hash and extension, e.g. sauce-backpack-1200x1500.0a0b85a3.jpg)
+PRODUCT_IMAGES = {
+    "sauce-labs-backpack": "sauce-backpack-1200x1500",
+    "sauce-labs-bike-light": "bike-light-1200x1500",
+    "sauce-labs-bolt-t-shirt": "bolt-shirt-1200x1500",
+    "sauce-labs-fleece-jacket": "sauce-pullover-1200x1500",
+    "sauce-labs-onesie": "red-onesie-1200x1500",
+    "test.allthethings()-t-shirt-(red)": "red-tatt-1200x1500",
 }
 
-PRODUCT_PRICES = {
-    "sauce-labs-backpack" : "29.99",
-    "sauce-labs-bike-light" : "9.99",
-    "sauce-labs-bolt-t-shirt" : "15.99",
-    "sauce-labs-fleece-jacket" : "49.99",
-    "sauce-labs-onesie" : "7.99",
-    "test.allthethings()-t-shirt-(red)" : "15.99",
-}
\ No newline at end of file
+# placeholder picture problem_user gets for every product
+MISSING_IMAGE = "sl-404"
+
+# config.cache key prefix of the reference image fingerprints (see the image_references fixture)
+IMAGE_REFERENCES_CACHE_KEY = "saucedemo/images"
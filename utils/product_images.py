@@ -0,0 +1,266 @@
+import base64
+import hashlib
+import re
+import threading
+from typing import NamedTuple
+from urllib.parse import urlsplit
+from utils.page_driver import PageDriver
+from utils.product_data import MISSING_IMAGE, PRODUCT_IMAGES
+
+# dHash grid: 9x8 grey samples give 8 left/right comparisons per row, 64 bits
+HASH_WIDTH = 9
+HASH_HEIGHT = 8
+# most dHash bits two fingerprints may differ in and still be the same picture (re-encoded or rescaled)
+MAX_DISTANCE = 6
+
+# fetches the image bytes in the page (same origin and cookies as the <img>, usually served from the
+# browser cache), decodes them and scales the picture down to the dHash grid on a canvas
+FINGERPRINT_SCRIPT = """
+    var src = arguments[0], width = arguments[1], height = arguments[2];
+    return fetch(src, {credentials: "same-origin"}).then(function (response) {
+        if (!response.ok) { throw new Error("image request failed: HTTP " + response.status + " " + src); }
+        return response.blob();
+    }).then(function (blob) {
+        return Promise.all([blob.arrayBuffer(), createImageBitmap(blob)]);
+    }).then(function (parts) {
+        var bytes = new Uint8Array(parts[0]), bitmap = parts[1];
+        var canvas = document.createElement("canvas");
+        canvas.width = width;
+        canvas.height = height;
+        var context = canvas.getContext("2d");
+        context.imageSmoothingQuality = "high";
+        context.drawImage(bitmap, 0, 0, width, height);
+        var rgba = context.getImageData(0, 0, width, height).data;
+        var grey = [];
+        for (var i = 0; i < rgba.length; i += 4) {
+            grey.push(Math.round(0.299 * rgba[i] + 0.587 * rgba[i + 1] + 0.114 * rgba[i + 2]));
+        }
+        var binary = "";
+        for (var j = 0; j < bytes.length; j += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(j, j + 0x8000));
+        }
+        return {content: btoa(binary), grey: grey, width: bitmap.width, height: bitmap.height};
+    });
+"""
+
+
+class ImageFingerprint(NamedTuple):
+    """
+    Content and perceptual hash of one image (immutable, tuple-backed).
+
+    Attributes:
+        src (str): Image URL the fingerprint was taken from.
+        sha256 (str): Hex digest of the image bytes; equal only for byte-identical files.
+        dhash (str): 64-bit difference hash as 16 hex digits; close for pictures that look alike.
+        size (int): Image file size in bytes.
+        width (int): Natural width in pixels.
+        height (int): Natural height in pixels.
+    """
+    src: str
+    sha256: str
+    dhash: str
+    size: int
+    width: int
+    height: int
+
+
+class ImageCheck(NamedTuple):
+    """
+    Result of comparing the picture a product shows with its reference.
+
+    Attributes:
+        product_id (str): Product whose picture was checked.
+        shown (str): File stem of the displayed image, e.g. "sl-404".
+        matches (bool): The picture is the product's reference picture.
+        distance (int): dHash bits that differ from the reference (0 for identical files).
+        closest (str): Product whose reference the picture resembles most, None if it resembles none.
+        placeholder (bool): The page shows the MISSING_IMAGE placeholder.
+    """
+    product_id: str
+    shown: str
+    matches: bool
+    distance: int
+    closest: str
+    placeholder: bool
+
+
+def image_stem(src: str):
+    """
+    Returns the file stem of an image URL without extension and content-hash suffix,
+    e.g. ".../static/media/sauce-backpack-1200x1500.0a0b85a3.jpg" -> "sauce-backpack-1200x1500".
+    """
+    return urlsplit(src).path.rsplit("/", 1)[-1].split(".", 1)[0]
+
+
+def difference_hash(grey):
+    """
+    Computes a dHash from HASH_WIDTH x HASH_HEIGHT grey values (row by row): one bit per
+    horizontally adjacent pair, set when the left sample is brighter.
+
+    Returns:
+        str: 16 hex digits.
+    """
+    bits = 0
+    for y in range(HASH_HEIGHT):
+        row = grey[y * HASH_WIDTH:(y + 1) * HASH_WIDTH]
+        for left, right in zip(row, row[1:]):
+            bits = (bits << 1) | (left > right)
+    return f"{bits:016x}"
+
+
+def hash_distance(first: str, second: str):
+    """
+    Returns the number of differing bits of two dHashes.
+    """
+    return bin(int(first, 16) ^ int(second, 16)).count("1")
+
+
+class ImageHashes:
+    """
+    Image fingerprints of one pytest process, keyed by src: every distinct image is fetched once,
+    however many tests and users show it.
+
+    Attributes:
+        fetches (int): Images fetched through a browser.
+        hits (int): Lookups answered from the cache.
+    """
+
+    def __init__(self):
+        self.fetches = 0
+        self.hits = 0
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def seed(self, fingerprints):
+        """
+        Adds fingerprints taken elsewhere (e.g. the cached references), so their images are not fetched again.
+        """
+        with self._lock:
+            for fingerprint in fingerprints:
+                self._fingerprints.setdefault(fingerprint.src, fingerprint)
+
+    def fingerprint(self, driver: PageDriver, src: str):
+        """
+        Returns the fingerprint of an image, fetching it through the browser on first use.
+
+        Args:
+            driver (PageDriver): Browser on a page of the image's origin (the user's session cookies apply).
+            src (str): Absolute image URL.
+
+        Returns:
+            ImageFingerprint: Hashes of the image.
+        """
+        with self._lock:
+            fingerprint = self._fingerprints.get(src)
+            if fingerprint is not None:
+                self.hits += 1
+                return fingerprint
+        image = driver.execute_script(FINGERPRINT_SCRIPT, src, HASH_WIDTH, HASH_HEIGHT)
+        content = base64.b64decode(image["content"])
+        fingerprint = ImageFingerprint(
+            src=src,
+            sha256=hashlib.sha256(content).hexdigest(),
+            dhash=difference_hash(image["grey"]),
+            size=len(content),
+            width=image["width"],
+            height=image["height"],
+        )
+        with self._lock:
+            self.fetches += 1
+            return self._fingerprints.setdefault(src, fingerprint)
+
+
+HASHES = ImageHashes()
+
+
+def build_references(driver: PageDriver, inventory):
+    """
+    Fingerprints the reference picture of every product from an inventory read as the standard user.
+
+    The inventory must show the file PRODUCT_IMAGES names for each product, and no two
+    reference pictures may be within MAX_DISTANCE of each other (they could not be told apart).
+
+    Args:
+        driver (PageDriver): Browser on the products page.
+        inventory (list[InventoryItem]): ProductsPage.get_inventory() of that page.
+
+    Returns:
+        dict: product_id -> ImageFingerprint.
+
+    Raises:
+        ValueError: If a product shows another file than its reference, or two references look alike.
+    """
+    shown = {item.product_id: item.img_src for item in inventory}
+    references = {}
+    for product_id, expected in PRODUCT_IMAGES.items():
+        src = shown.get(product_id, "")
+        if image_stem(src) != expected:
+            raise ValueError(f"Reference image for '{product_id}' is '{src}', expected '{expected}'")
+        references[product_id] = HASHES.fingerprint(driver, src)
+    for product_id, reference in references.items():
+        for other_id, other in references.items():
+            if product_id < other_id and hash_distance(reference.dhash, other.dhash) <= MAX_DISTANCE:
+                raise ValueError(f"Reference images of '{product_id}' and '{other_id}' are too similar to tell apart")
+    return references
+
+
+def references_from_rows(rows):
+    """
+    Rebuilds build_references() output from its cached rows (product_id -> ImageFingerprint fields).
+
+    Args:
+        rows (dict): Cached product_id -> list of ImageFingerprint fields.
+
+    Returns:
+        dict: product_id -> ImageFingerprint, or None if the rows do not hold a well-formed fingerprint
+        of the expected file for every product in PRODUCT_IMAGES (e.g. an entry of an older shape).
+    """
+    if not isinstance(rows, dict) or set(rows) != set(PRODUCT_IMAGES):
+        return None
+    references = {}
+    for product_id, row in rows.items():
+        if not isinstance(row, list) or len(row) != len(ImageFingerprint._fields):
+            return None
+        fingerprint = ImageFingerprint(*row)
+        valid = (
+            isinstance(fingerprint.src, str)
+            and image_stem(fingerprint.src) == PRODUCT_IMAGES[product_id]
+            and isinstance(fingerprint.sha256, str) and re.fullmatch(r"[0-9a-f]{64}", fingerprint.sha256)
+            and isinstance(fingerprint.dhash, str) and re.fullmatch(r"[0-9a-f]{16}", fingerprint.dhash)
+            and all(type(value) is int and value > 0 for value in fingerprint[3:])
+        )
+        if not valid:
+            return None
+        references[product_id] = fingerprint
+    return references
+
+
+def check_image(driver: PageDriver, product_id: str, src: str, references):
+    """
+    Compares the picture a product shows with its reference: the same file, or a picture whose dHash
+    is within MAX_DISTANCE of the reference and closer to it than to any other product's.
+
+    Args:
+        driver (PageDriver): Browser showing the picture.
+        product_id (str): Product the picture belongs to.
+        src (str): Absolute URL of the displayed image.
+        references (dict): product_id -> ImageFingerprint, see build_references().
+
+    Returns:
+        ImageCheck: The verdict and what the picture looks like instead.
+    """
+    fingerprint = HASHES.fingerprint(driver, src)
+    distances = {
+        other_id: 0 if reference.sha256 == fingerprint.sha256 else hash_distance(reference.dhash, fingerprint.dhash)
+        for other_id, reference in references.items()
+    }
+    closest = min(distances, key=distances.get)
+    distance = distances[product_id]
+    return ImageCheck(
+        product_id=product_id,
+        shown=image_stem(src),
+        matches=distance == 0 or (distance <= MAX_DISTANCE and closest == product_id),
+        distance=distance,
+        closest=closest if distances[closest] <= MAX_DISTANCE else None,
+        placeholder=image_stem(src) == MISSING_IMAGE,
+    )
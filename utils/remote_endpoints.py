@@ -0,0 +1,285 @@
+import argparse
+import json
+import logging
+import threading
+import time
+import urllib3
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.driver_finder import DriverFinder
+from utils.chromedriver_connection import POOL_MANAGER, ChromeSession
+
+# how long an endpoint that failed stays out of rotation before it is probed again
+COOLDOWN = 30
+# how long a health probe may take
+PROBE_TIMEOUT = 2
+# how often a worker re-checks endpoint load while every endpoint is at capacity
+QUEUE_POLL = 0.2
+# how long a worker waits for a free slot before giving up
+QUEUE_TIMEOUT = 300
+
+
+class _EndpointService:
+    # stands in for a chromedriver Service: remote endpoints have no local process to start or stop
+    def __init__(self, url: str):
+        self.service_url = url
+        self.process = None
+
+    def stop(self):
+        pass
+
+
+class Endpoint:
+    """
+    One remote WebDriver endpoint (a chromedriver or a Grid node) and its counters in this process.
+
+    Attributes:
+        url (str): Base URL, e.g. "http://10.0.0.5:9515".
+        active (int): Sessions this process currently holds on it.
+        sessions (int): Sessions started on it.
+        failures (int): Failed health probes and session starts.
+        session_time (float): Seconds of session lifetime served.
+        queue_wait (float): Seconds sessions waited because every endpoint was at capacity.
+        max_queue_wait (float): Longest single wait in seconds.
+        first_start (float): Epoch of the first session start (None before).
+        last_end (float): Epoch of the last session end (None before).
+        down_until (float): Monotonic time before which the endpoint is skipped.
+    """
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.active = 0
+        self.sessions = 0
+        self.failures = 0
+        self.session_time = 0.0
+        self.queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.first_start = None
+        self.last_end = None
+        self.down_until = 0.0
+
+    def probe(self):
+        """
+        Checks the endpoint and returns its current load across all processes.
+
+        Uses chromedriver's GET /sessions (sessions of every client); endpoints without it
+        (e.g. Selenium Grid) are checked with GET /status and this process's own sessions count as load.
+
+        Returns:
+            int: Sessions running on the endpoint, or None if it is down or not ready.
+        """
+        timeout = urllib3.Timeout(total=PROBE_TIMEOUT)
+        try:
+            response = POOL_MANAGER.request("GET", f"{self.url}/sessions", timeout=timeout, retries=False)
+            if response.status == 200:
+                return len(json.loads(response.data)["value"])
+            response = POOL_MANAGER.request("GET", f"{self.url}/status", timeout=timeout, retries=False)
+            ready = response.status == 200 and json.loads(response.data)["value"].get("ready", False)
+            return self.active if ready else None
+        except (urllib3.exceptions.HTTPError, ValueError, KeyError, TypeError):
+            return None
+
+    def stats(self):
+        """
+        Returns the endpoint counters as a plain dict (safe to send from xdist workers to the controller).
+        """
+        return {
+            "sessions": self.sessions,
+            "failures": self.failures,
+            "session_time": round(self.session_time, 3),
+            "queue_wait": round(self.queue_wait, 3),
+            "max_queue_wait": round(self.max_queue_wait, 3),
+            "first_start": self.first_start,
+            "last_end": self.last_end,
+        }
+
+
+class EndpointSession(ChromeSession):
+    """
+    Chrome session on a remote endpoint; quit() reports the end of the session to the balancer.
+    """
+
+    def __init__(self, options, balancer, endpoint: Endpoint):
+        self._balancer = balancer
+        self._endpoint = endpoint
+        self._started = time.monotonic()
+        self._released = False
+        super().__init__(options, _EndpointService(endpoint.url), owns_service=False)
+
+    def quit(self) -> None:
+        try:
+            super().quit()
+        finally:
+            # a second quit() (e.g. a batch and the session end both releasing) must not free the slot twice
+            if not self._released:
+                self._released = True
+                self._balancer.release(self._endpoint, time.monotonic() - self._started)
+
+
+class EndpointBalancer:
+    """
+    Spreads the browser sessions of one pytest process over several WebDriver endpoints.
+
+    Every launch probes the endpoints and starts the session on the least loaded healthy one.
+    An endpoint whose probe or session start fails is taken out of rotation for COOLDOWN seconds
+    and the session is retried on the next one. With a capacity, launches wait (queue) until
+    some endpoint runs fewer sessions than that.
+
+    Attributes:
+        endpoints (list[Endpoint]): Endpoints in the given order.
+        capacity (int): Maximum sessions per endpoint (None: unlimited).
+    """
+
+    def __init__(self, urls, capacity: int = None, offset: int = 0):
+        """
+        Initializes the balancer.
+
+        Args:
+            urls (Iterable[str]): Endpoint base URLs.
+            capacity (int): Maximum sessions per endpoint, None for unlimited.
+            offset (int): Rotates the order used to break ties (e.g. the xdist worker number),
+                so that workers starting at the same moment spread out.
+        """
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.capacity = capacity
+        self._offset = offset
+        self._lock = threading.Lock()
+
+    def _candidates(self):
+        now = time.monotonic()
+        count = len(self.endpoints)
+        ordered = [self.endpoints[(self._offset + index) % count] for index in range(count)]
+        loads = []
+        for endpoint in ordered:
+            if endpoint.down_until > now:
+                continue
+            load = endpoint.probe()
+            if load is None:
+                self._mark_down(endpoint, "health check failed")
+                continue
+            if self.capacity is None or load < self.capacity:
+                loads.append((load, endpoint))
+        # least loaded first; sorted() is stable, so ties keep the rotated order
+        return [endpoint for _, endpoint in sorted(loads, key=lambda pair: pair[0])]
+
+    def _mark_down(self, endpoint: Endpoint, reason: str):
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.down_until = time.monotonic() + COOLDOWN
+        logging.warning(f"WebDriver endpoint {endpoint.url} out of rotation for {COOLDOWN}s: {reason}")
+
+    def launch(self, options):
+        """
+        Starts a session on the least loaded healthy endpoint, retrying on the others if it fails.
+
+        Args:
+            options (Options): Chrome options.
+
+        Returns:
+            EndpointSession: The new browser.
+        """
+        queued = time.monotonic()
+        deadline = queued + QUEUE_TIMEOUT
+        while True:
+            candidates = self._candidates()
+            waited = time.monotonic() - queued
+            for endpoint in candidates:
+                try:
+                    with self._lock:
+                        endpoint.active += 1
+                    driver = EndpointSession(options, self, endpoint)
+                except (WebDriverException, urllib3.exceptions.HTTPError) as exc:
+                    with self._lock:
+                        endpoint.active -= 1
+                    self._mark_down(endpoint, f"session start failed ({type(exc).__name__})")
+                    continue
+                with self._lock:
+                    endpoint.sessions += 1
+                    endpoint.queue_wait += waited
+                    endpoint.max_queue_wait = max(endpoint.max_queue_wait, waited)
+                    if endpoint.first_start is None:
+                        endpoint.first_start = time.time()
+                return driver
+            if time.monotonic() > deadline:
+                raise WebDriverException(f"No WebDriver endpoint accepted a session within {QUEUE_TIMEOUT}s")
+            time.sleep(QUEUE_POLL)
+
+    def release(self, endpoint: Endpoint, duration: float):
+        """
+        Books the end of a session started by launch().
+        """
+        with self._lock:
+            endpoint.active -= 1
+            endpoint.session_time += duration
+            endpoint.last_end = time.time()
+
+    def stats(self):
+        """
+        Returns per-endpoint counters keyed by URL.
+        """
+        return {endpoint.url: endpoint.stats() for endpoint in self.endpoints}
+
+
+def merge_endpoint_stats(per_process):
+    """
+    Merges the stats() of several processes into per-endpoint totals with throughput.
+
+    Args:
+        per_process (list[dict]): EndpointBalancer.stats() of every worker.
+
+    Returns:
+        dict: URL -> sessions, failures, sessions_per_min, mean/max queue wait (ms) and
+        concurrency (mean sessions running between the first start and the last end).
+    """
+    merged = {}
+    for stats in per_process:
+        for url, endpoint in stats.items():
+            total = merged.setdefault(url, {
+                "sessions": 0, "failures": 0, "session_time": 0.0, "queue_wait": 0.0, "max_queue_wait": 0.0,
+                "first_start": None, "last_end": None,
+            })
+            for key in ("sessions", "failures", "session_time", "queue_wait"):
+                total[key] += endpoint[key]
+            total["max_queue_wait"] = max(total["max_queue_wait"], endpoint["max_queue_wait"])
+            if endpoint["first_start"] is not None:
+                total["first_start"] = min(filter(None, (total["first_start"], endpoint["first_start"])))
+            if endpoint["last_end"] is not None:
+                total["last_end"] = max(filter(None, (total["last_end"], endpoint["last_end"])))
+    summary = {}
+    for url, total in merged.items():
+        wall = (total["last_end"] - total["first_start"]) if total["first_start"] and total["last_end"] else 0.0
+        summary[url] = {
+            "sessions": total["sessions"],
+            "failures": total["failures"],
+            "sessions_per_min": round(total["sessions"] * 60 / wall, 2) if wall > 0 else 0.0,
+            "mean_queue_wait_ms": round(total["queue_wait"] * 1000 / total["sessions"], 1) if total["sessions"] else 0.0,
+            "max_queue_wait_ms": round(total["max_queue_wait"] * 1000, 1),
+            "concurrency": round(total["session_time"] / wall, 2) if wall > 0 else 0.0,
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start local chromedriver processes to try --webdriver-endpoints.")
+    parser.add_argument("--count", type=int, default=3)
+    parser.add_argument("--port", type=int, default=9515, help="port of the first chromedriver, the others follow")
+    args = parser.parse_args()
+
+    services = []
+    for index in range(args.count):
+        service = Service(port=args.port + index)
+        service.path = DriverFinder.get_path(service, Options())
+        service.start()
+        services.append(service)
+    print(f"--webdriver-endpoints {','.join(service.service_url for service in services)}  (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        for service in services:
+            service.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import ipaddress
+import json
+from typing import NamedTuple
+from urllib.parse import urlsplit
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config import BASE_URL, SOCIAL_MEDIA
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+POLICY_CHOICES = ("block", "off")
+
+
+def _host_patterns(url: str):
+    host = urlsplit(url).hostname
+    try:
+        ipaddress.ip_address(host)
+        return [host]
+    except ValueError:
+        # the site and its subdomains (e.g. linkedin.com redirects, www.saucedemo.com)
+        domain = host.removeprefix("www.")
+        return [domain, f"*.{domain}"]
+
+
+# hosts the suite legitimately navigates to; everything else is off-origin
+ALLOWED_HOSTS = _host_patterns(BASE_URL) + _host_patterns(SOCIAL_MEDIA)
+
+
+class ResourcePolicy(NamedTuple):
+    """
+    Which resources a test's browser is allowed to load.
+
+    Attributes:
+        block_images (bool): Block image requests.
+        block_fonts (bool): Block web font requests.
+        block_off_origin (bool): Fail DNS resolution for hosts other than ALLOWED_HOSTS.
+    """
+    block_images: bool = True
+    block_fonts: bool = True
+    block_off_origin: bool = True
+
+    @classmethod
+    def from_option(cls, value: str):
+        """
+        Builds a policy from the --resource-policy value ("block" or "off").
+        """
+        return cls() if value == "block" else cls(False, False, False)
+
+    def for_images(self):
+        """
+        Returns the same policy with images allowed (for tests that look at product images).
+        """
+        return self._replace(block_images=False)
+
+    def label(self):
+        """
+        Returns a short description for reports, e.g. "images,fonts,off-origin" or "off".
+        """
+        blocked = [name for name, on in zip(("images", "fonts", "off-origin"), self) if on]
+        return ",".join(blocked) or "off"
+
+    def blocked_url_patterns(self):
+        """
+        Returns the URL patterns for Network.setBlockedURLs.
+        """
+        return (IMAGE_PATTERNS if self.block_images else []) + (FONT_PATTERNS if self.block_fonts else [])
+
+
+def launch_arguments(policy: ResourcePolicy):
+    """
+    Returns Chrome command line switches implementing the launch-time part of the policy.
+
+    Off-origin blocking is done by the host resolver: Network.setBlockedURLs only takes wildcard
+    patterns (no "everything except" rule) and request interception needs an event connection that
+    classic WebDriver does not have.
+    """
+    if not policy.block_off_origin:
+        return []
+    excluded = ", ".join(f"EXCLUDE {host}" for host in ALLOWED_HOSTS)
+    return [f"--host-resolver-rules=MAP * ~NOTFOUND, {excluded}"]
+
+
+def apply_policy(driver: WebDriver, policy: ResourcePolicy):
+    """
+    Applies image/font blocking to the current tab through Chrome DevTools Protocol.
+
+    Can be called again on a reused browser; the new pattern list replaces the previous one.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": policy.blocked_url_patterns()})
+
+
+def collect_network_stats(driver: WebDriver):
+    """
+    Drains Chrome's performance log and sums up network activity since the previous call.
+
+    Requires the browser to be started with the "goog:loggingPrefs" performance capability.
+
+    Returns:
+        dict: bytes_transferred, requests, blocked_requests, page_loads_timed and page_load_ms
+        (sum of document request -> load event times).
+    """
+    stats = {"bytes_transferred": 0, "requests": 0, "blocked_requests": 0, "page_loads_timed": 0, "page_load_ms": 0.0}
+    load_started = None
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        method, params = message["method"], message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            stats["requests"] += 1
+            if params.get("type") == "Document" and params.get("requestId") == params.get("loaderId"):
+                load_started = params["timestamp"]
+        elif method == "Network.loadingFinished":
+            stats["bytes_transferred"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            stats["blocked_requests"] += 1
+        elif method == "Page.loadEventFired" and load_started is not None:
+            stats["page_loads_timed"] += 1
+            stats["page_load_ms"] += (params["timestamp"] - load_started) * 1000
+            load_started = None
+    stats["page_load_ms"] = round(stats["page_load_ms"], 1)
+    return stats
+
+
+def summarize_network(records):
+    """
+    Sums up the network stats stored in metrics records (tests run with --resource-stats).
+
+    Args:
+        records (list[dict]): Records returned by utils.test_metrics.load_metrics().
+
+    Returns:
+        dict: Totals and per-test means, or None if no record has network stats.
+    """
+    measured = [record for record in records if "bytes_transferred" in record]
+    if not measured:
+        return None
+    page_loads = sum(record["page_loads_timed"] for record in measured)
+    total_bytes = sum(record["bytes_transferred"] for record in measured)
+    return {
+        "policies": sorted({record["resource_policy"] for record in measured}),
+        "tests": len(measured),
+        "bytes_transferred": total_bytes,
+        "bytes_per_test": total_bytes // len(measured),
+        "requests": sum(record["requests"] for record in measured),
+        "blocked_requests": sum(record["blocked_requests"] for record in measured),
+        "page_loads_timed": page_loads,
+        "mean_page_load_ms": round(sum(record["page_load_ms"] for record in measured) / page_loads, 1) if page_loads else 0.0,
+    }
+
+
+# key under which the session's base policy is kept in config.stash
+resource_policy_key = pytest.StashKey[ResourcePolicy]()
@@ -0,0 +1,351 @@
+import ast
+import functools
+import hashlib
+import importlib
+import inspect
+import pkgutil
+from pathlib import Path
+from typing import NamedTuple
+from selenium.webdriver.common.by import By
+
+# config.cache key holding the impact map recorded by --impact-record
+IMPACT_CACHE_KEY = "saucedemo/impact"
+IMPACT_MAP_VERSION = 1
+# source trees whose symbols are tracked
+SOURCE_DIRS = ("pages", "utils", "tests")
+# files that affect every test when they change
+GLOBAL_FILES = ("pytest.ini", "requirements.txt")
+CONFTEST = "tests/conftest.py"
+MODULE_SYMBOL = "<module>"
+# dependency on every symbol of a file (used for utils modules, which are not traced at runtime)
+ANY_SYMBOL = "*"
+LOCATOR_STRATEGIES = frozenset(value for name, value in vars(By).items() if name.isupper())
+
+
+def _digest(nodes):
+    dumped = "\n".join(ast.dump(node) for node in nodes)
+    return hashlib.sha1(dumped.encode()).hexdigest()[:16]
+
+
+def _class_symbols(path: str, node: ast.ClassDef):
+    symbols = {}
+    assignments = {}
+    rest = []
+    for member in node.body:
+        if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols[f"{path}:{node.name}.{member.name}"] = _digest([member])
+        elif isinstance(member, ast.Assign) and len(member.targets) == 1 and isinstance(member.targets[0], ast.Name):
+            assignments[member.targets[0].id] = member
+        else:
+            rest.append(member)
+    for name, assignment in assignments.items():
+        # READY_LOCATOR = LOGIN_BUTTON changes together with LOGIN_BUTTON
+        referenced = [
+            assignments[child.id] for child in ast.walk(assignment.value)
+            if isinstance(child, ast.Name) and child.id in assignments and child.id != name
+        ]
+        symbols[f"{path}:{node.name}.{name}"] = _digest([assignment, *referenced])
+    symbols[f"{path}:{node.name}"] = _digest([*node.bases, *node.decorator_list, *rest])
+    return symbols
+
+
+def file_symbols(path: str, source: str):
+    """
+    Splits a Python file into symbols and hashes each one from its AST (formatting and comments do not count).
+
+    Symbols are "<path>:<module>" (imports and module-level statements), "<path>:function",
+    "<path>:Class" (bases, decorators, other statements), "<path>:Class.method" and "<path>:Class.ATTRIBUTE".
+
+    Returns:
+        dict[str, str]: Symbol -> hash.
+    """
+    tree = ast.parse(source)
+    symbols = {}
+    rest = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols[f"{path}:{node.name}"] = _digest([node])
+        elif isinstance(node, ast.ClassDef):
+            symbols.update(_class_symbols(path, node))
+        else:
+            rest.append(node)
+    symbols[f"{path}:{MODULE_SYMBOL}"] = _digest(rest)
+    return symbols
+
+
+def scan_symbols(root: Path):
+    """
+    Hashes every symbol of the tracked source trees plus the GLOBAL_FILES.
+
+    Returns:
+        dict[str, str]: Symbol -> hash, paths relative to root.
+    """
+    symbols = {}
+    for directory in SOURCE_DIRS:
+        for path in sorted((root / directory).rglob("*.py")):
+            relative = path.relative_to(root).as_posix()
+            try:
+                symbols.update(file_symbols(relative, path.read_text()))
+            except SyntaxError:
+                # unparsable file: any change to it is a change to everything in it
+                symbols[f"{relative}:{MODULE_SYMBOL}"] = hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+    for name in GLOBAL_FILES:
+        path = root / name
+        if path.exists():
+            symbols[f"{name}:{MODULE_SYMBOL}"] = hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+    return symbols
+
+
+def _module_file(root: Path, module: str):
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.exists():
+            return candidate.relative_to(root).as_posix()
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def import_closure(root: Path, path: str):
+    """
+    Returns the project files reachable through imports from the given file (itself included).
+    """
+    seen = set()
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            tree = ast.parse((root / current).read_text())
+        except (OSError, SyntaxError):
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                # "from utils import memory" may import a submodule
+                modules = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for module in modules:
+                resolved = _module_file(root, module)
+                if resolved is not None:
+                    pending.append(resolved)
+    return frozenset(seen)
+
+
+def static_dependencies(root: Path, item):
+    """
+    Returns the symbols a collected test depends on without running it.
+
+    - the test function and its module's top level;
+    - conftest fixtures the test uses;
+    - for every imported project file: page modules by module/class level (methods and locators are
+      traced at runtime), other modules as a whole.
+    """
+    path = item.path.relative_to(root).as_posix()
+    name = item.originalname if hasattr(item, "originalname") else item.name
+    qualname = f"{item.cls.__name__}.{name}" if getattr(item, "cls", None) else name
+    dependencies = {f"{path}:{qualname}", f"{path}:{MODULE_SYMBOL}"}
+    dependencies.update(f"{CONFTEST}:{fixture}" for fixture in getattr(item, "fixturenames", ()))
+    for module in import_closure(root, path):
+        if module.startswith("pages/"):
+            dependencies.add(f"{module}:{MODULE_SYMBOL}")
+            classes = {
+                node.name for node in ast.parse((root / module).read_text()).body if isinstance(node, ast.ClassDef)
+            }
+            dependencies.update(f"{module}:{cls}" for cls in classes)
+        elif module != path:
+            dependencies.add(f"{module}:{ANY_SYMBOL}")
+    return dependencies
+
+
+class ImpactTracer:
+    """
+    Records which page-object methods and locator constants each test uses (--impact-record).
+
+    Attributes:
+        tests (dict[str, list[str] | None]): Node id -> sorted symbols used by the test (runtime and static),
+            None for tests that failed (they are dropped from the map so that they always run again).
+    """
+
+    def __init__(self):
+        self.tests = {}
+        self._current = None
+        self._failed = False
+
+    def touch(self, symbol: str):
+        """
+        Marks a symbol as used by the running test.
+        """
+        if self._current is not None:
+            self._current.add(symbol)
+
+    def start(self):
+        """
+        Starts tracing a test (before its setup, so fixtures count too).
+        """
+        self._current = set()
+        self._failed = False
+
+    def on_report(self, outcome: str):
+        """
+        Notes the outcome of a test phase; a failure in any phase keeps the test out of the map.
+        """
+        self._failed = self._failed or outcome == "failed"
+
+    def finish(self, root: Path, item):
+        """
+        Stores the symbols of a finished test together with its static dependencies.
+        """
+        if self._current is None:
+            return
+        self.tests[item.nodeid] = None if self._failed else sorted(self._current | static_dependencies(root, item))
+        self._current = None
+
+
+# one tracer per process, fed by the wrappers installed by instrument_pages()
+TRACER = ImpactTracer()
+
+
+class _TracedLocator:
+    """
+    Class attribute descriptor returning the locator tuple and reporting the access.
+    """
+
+    def __init__(self, symbol: str, locator: tuple):
+        self.symbol = symbol
+        self.locator = locator
+
+    def __get__(self, instance, owner):
+        TRACER.touch(self.symbol)
+        return self.locator
+
+
+def _traced_method(symbol: str, method):
+    @functools.wraps(method)
+    def traced(*args, **kwargs):
+        TRACER.touch(symbol)
+        return method(*args, **kwargs)
+
+    return traced
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and value[0] in LOCATOR_STRATEGIES
+
+
+def instrument_pages(root: Path, package: str = "pages"):
+    """
+    Wraps every method and locator constant defined by page-object classes so that use is traced.
+
+    Only symbols defined in a class are wrapped (inherited BasePage methods report as BasePage.*).
+    """
+    for module_info in pkgutil.iter_modules(importlib.import_module(package).__path__):
+        module = importlib.import_module(f"{package}.{module_info.name}")
+        for cls in vars(module).values():
+            if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                continue
+            path = Path(inspect.getsourcefile(cls)).resolve().relative_to(root.resolve()).as_posix()
+            for name, value in list(vars(cls).items()):
+                symbol = f"{path}:{cls.__name__}.{name}"
+                if inspect.isfunction(value):
+                    setattr(cls, name, _traced_method(symbol, value))
+                elif _is_locator(value):
+                    setattr(cls, name, _TracedLocator(symbol, value))
+
+
+class ImpactPlan(NamedTuple):
+    """
+    Outcome of comparing the current sources with the recorded impact map.
+
+    Attributes:
+        full (bool): Run everything (reason says why).
+        reason (str): Why the full suite runs, or a short description of the selection.
+        changed (frozenset[str]): Symbols added, removed or modified since the map was recorded.
+        unaffected (frozenset[str]): Node ids that can be skipped.
+        saved (float): Recorded duration of the unaffected tests in seconds.
+    """
+    full: bool
+    reason: str
+    changed: frozenset = frozenset()
+    unaffected: frozenset = frozenset()
+    saved: float = 0.0
+
+
+def _is_global(symbol: str, fixtures):
+    path = symbol.split(":", 1)[0]
+    # conftest hooks and helpers apply to every test, fixtures only to tests using them
+    return path in GLOBAL_FILES or (path == CONFTEST and symbol not in fixtures)
+
+
+def plan_selection(impact_map, symbols):
+    """
+    Decides which recorded tests are unaffected by the changes since the map was recorded.
+
+    Tests missing from the map (new or never recorded) always run, since they are not in `unaffected`.
+
+    Args:
+        impact_map (dict): Map stored by save_impact_map(), or None.
+        symbols (dict[str, str]): Current scan_symbols() result.
+
+    Returns:
+        ImpactPlan: Selection, or full=True when the map is missing, outdated or a global file changed.
+    """
+    if not impact_map or impact_map.get("version") != IMPACT_MAP_VERSION:
+        return ImpactPlan(True, "no impact map recorded yet (run with --impact-record)")
+    recorded = impact_map["symbols"]
+    changed = frozenset(
+        symbol for symbol in recorded.keys() | symbols.keys() if recorded.get(symbol) != symbols.get(symbol)
+    )
+    fixtures = {
+        dependency for entry in impact_map["tests"].values() for dependency in entry["deps"]
+        if dependency.startswith(f"{CONFTEST}:")
+    }
+    fixtures.discard(f"{CONFTEST}:{MODULE_SYMBOL}")
+    global_changes = sorted(symbol for symbol in changed if _is_global(symbol, fixtures))
+    if global_changes:
+        return ImpactPlan(True, f"suite-wide change: {', '.join(global_changes[:3])}", changed)
+
+    changed_files = {symbol.split(":", 1)[0] for symbol in changed}
+    unaffected = set()
+    saved = 0.0
+    for nodeid, entry in impact_map["tests"].items():
+        affected = any(
+            dependency in changed
+            or (dependency.endswith(f":{ANY_SYMBOL}") and dependency.split(":", 1)[0] in changed_files)
+            for dependency in entry["deps"]
+        )
+        if not affected:
+            unaffected.add(nodeid)
+            saved += entry.get("duration", 0.0)
+    return ImpactPlan(False, f"{len(changed)} changed symbol(s)", changed, frozenset(unaffected), saved)
+
+
+def save_impact_map(cache, previous, traced, durations, symbols):
+    """
+    Merges freshly traced tests into the stored map and saves it with the current symbol hashes.
+
+    Entries of tests not run this time are kept only while the changes since the previous map do not
+    affect them (e.g. tests deselected with -k stay mapped unless they depend on an edited symbol).
+
+    Args:
+        cache (Cache): config.cache.
+        previous (dict): Map loaded at session start, or None.
+        traced (dict[str, list[str] | None]): Node id -> dependencies traced in this session (None: failed).
+        durations (dict[str, float]): Node id -> test duration in seconds.
+        symbols (dict[str, str]): Current scan_symbols() result.
+
+    Returns:
+        int: Number of tests in the saved map.
+    """
+    carried = plan_selection(previous, symbols)
+    tests = {} if carried.full else {nodeid: previous["tests"][nodeid] for nodeid in carried.unaffected}
+    for nodeid, dependencies in traced.items():
+        if dependencies is None:
+            tests.pop(nodeid, None)
+        else:
+            tests[nodeid] = {"deps": dependencies, "duration": round(durations.get(nodeid, 0.0), 3)}
+    cache.set(IMPACT_CACHE_KEY, {"version": IMPACT_MAP_VERSION, "symbols": symbols, "tests": tests})
+    return len(tests)
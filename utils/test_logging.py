@@ -0,0 +1,114 @@
+import json
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from utils.test_metrics import worker_id
+
+WORKER_LOG_PATTERN = "test_results-*.jsonl"
+TEXT_FORMAT = "{asctime} - {level} - {message}"
+
+
+class JsonLineFormatter(logging.Formatter):
+    """
+    Formats records as compact JSON lines: {"t": epoch seconds, "w": worker, "l": level, "m": message}.
+    """
+
+    def format(self, record):
+        return json.dumps(
+            {"t": record.created, "w": worker_id(), "l": record.levelname, "m": record.getMessage()},
+            separators=(",", ":"),
+        )
+
+
+def start_worker_logging(log_dir: Path, level=logging.INFO):
+    """
+    Routes the root logger through an in-memory queue to this worker's own log file.
+
+    The test thread only enqueues records (QueueHandler); formatting and file writes happen on
+    the QueueListener thread, so logging from hooks adds no I/O to the test.
+
+    Args:
+        log_dir (Path): Directory for test_results-<worker>.jsonl files.
+        level (int): Root logger level.
+
+    Returns:
+        QueueListener: Running listener, to be passed to stop_worker_logging().
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(log_dir / f"test_results-{worker_id()}.jsonl", mode="w")
+    file_handler.setFormatter(JsonLineFormatter())
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
+
+def stop_worker_logging(listener: QueueListener):
+    """
+    Flushes queued records to disk and detaches the queue handler from the root logger.
+    """
+    root = logging.getLogger()
+    for handler in [handler for handler in root.handlers if isinstance(handler, QueueHandler)]:
+        root.removeHandler(handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def clear_worker_logs(log_dir: Path):
+    """
+    Removes per-worker log files left by a previous run.
+    """
+    for path in log_dir.glob(WORKER_LOG_PATTERN):
+        path.unlink()
+
+
+def merge_worker_logs(log_dir: Path, text_log: Path, json_log: Path = None):
+    """
+    Merges per-worker logs into one time-ordered log.
+
+    The text log keeps the historical 'asctime - level - message' format and is appended to,
+    like the previous shared test_results.log. The optional JSON log gets the merged records as a list.
+    Lines that are not complete records (a worker killed mid-write) are skipped and reported as a warning.
+
+    Returns:
+        int: Number of merged records.
+    """
+    records = []
+    for path in log_dir.glob(WORKER_LOG_PATTERN):
+        skipped = 0
+        with open(path, errors="replace") as worker_log:
+            for line in worker_log:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if not isinstance(record, dict) or not {"t", "l", "m"} <= record.keys():
+                    # e.g. the partial last line of a worker killed mid-write
+                    skipped += 1
+                    continue
+                records.append(record)
+        if skipped:
+            records.append({
+                "t": path.stat().st_mtime, "w": path.stem.split("-", 1)[-1], "l": "WARNING",
+                "m": f"{skipped} unreadable line(s) skipped in {path.name}",
+            })
+    records.sort(key=lambda record: record["t"])
+
+    with open(text_log, "a") as merged:
+        for record in records:
+            asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record["t"]))
+            asctime += f",{int(record['t'] % 1 * 1000):03d}"
+            merged.write(TEXT_FORMAT.format(asctime=asctime, level=record["l"], message=record["m"]) + "\n")
+    if json_log is not None:
+        with open(json_log, "w") as merged_json:
+            json.dump(records, merged_json, indent=1)
+    return len(records)
@@ -0,0 +1,219 @@
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from selenium.webdriver.remote.command import Command
+
+# commands that make the browser load a document
+PAGE_LOAD_COMMANDS = {Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD}
+METRICS_FILE_PATTERN = "metrics-*.jsonl"
+SUMMARY_FILE = "metrics-summary.json"
+
+
+def worker_id():
+    """
+    Returns the xdist worker id of this process ("gw0", "gw1", ...) or "master" without xdist.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+class TestRecord:
+    """
+    Accumulates timings of a single test while it runs.
+
+    Attributes:
+        nodeid (str): pytest node id of the test.
+        phases (dict[str, float]): Duration of setup/call/teardown in seconds.
+        outcome (str): "passed", "failed" or "skipped" (first non-passing phase wins).
+        commands (Counter): Number of WebDriver commands by command name.
+        webdriver_time (float): Seconds spent waiting on WebDriver round trips.
+        page_loads (int): Navigations issued through get/refresh/back/forward.
+        fixtures (dict[str, float]): Setup duration of each fixture executed for this test.
+        extra (dict): Additional fields contributed by other plugins.
+    """
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.started = time.time()
+        self.phases = {}
+        self.outcome = "passed"
+        self.commands = Counter()
+        self.webdriver_time = 0.0
+        self.page_loads = 0
+        self.fixtures = {}
+        self.extra = {}
+
+    def as_dict(self):
+        """
+        Returns the record as a JSON-serializable dict.
+        """
+        total = sum(self.phases.values())
+        return {
+            "test": self.nodeid,
+            "worker": worker_id(),
+            "started": round(self.started, 3),
+            "outcome": self.outcome,
+            "setup": round(self.phases.get("setup", 0.0), 4),
+            "call": round(self.phases.get("call", 0.0), 4),
+            "teardown": round(self.phases.get("teardown", 0.0), 4),
+            "total": round(total, 4),
+            "commands": sum(self.commands.values()),
+            "webdriver_s": round(self.webdriver_time, 4),
+            "python_s": round(max(total - self.webdriver_time, 0.0), 4),
+            "page_loads": self.page_loads,
+            "command_counts": dict(self.commands),
+            "fixtures": {name: round(duration, 4) for name, duration in self.fixtures.items()},
+            **self.extra,
+        }
+
+
+class MetricsRecorder:
+    """
+    Collects per-test metrics in one pytest process and writes them as JSON lines.
+
+    Every worker writes to its own file (metrics-<worker>.jsonl), so no locking is needed.
+    """
+
+    def __init__(self):
+        self.current = None
+        self._file = None
+
+    def open(self, metrics_dir: Path):
+        """
+        Opens this process's metrics file for writing.
+        """
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(metrics_dir / f"metrics-{worker_id()}.jsonl", "w", buffering=1)
+
+    def close(self):
+        """
+        Closes the metrics file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def start(self, nodeid: str):
+        """
+        Starts a new record; called before the test's setup phase.
+        """
+        self.current = TestRecord(nodeid)
+
+    def on_command(self, command, params, duration):
+        """
+        WebDriver command listener (see utils.webdriver_commands.add_listener).
+        """
+        record = self.current
+        if record is None:
+            return
+        record.commands[command] += 1
+        record.webdriver_time += duration
+        if command in PAGE_LOAD_COMMANDS:
+            record.page_loads += 1
+
+    def on_fixture(self, name: str, duration: float):
+        """
+        Stores the setup duration of a fixture executed for the current test.
+        """
+        if self.current is not None:
+            self.current.fixtures[name] = self.current.fixtures.get(name, 0.0) + duration
+
+    def on_phase(self, when: str, duration: float, outcome: str):
+        """
+        Stores the duration and outcome of a setup/call/teardown phase.
+        Writes the record once teardown is reported.
+        """
+        record = self.current
+        if record is None:
+            return
+        record.phases[when] = duration
+        if outcome != "passed" and record.outcome == "passed":
+            record.outcome = outcome
+        if when == "teardown":
+            if self._file is not None:
+                self._file.write(json.dumps(record.as_dict(), separators=(",", ":")) + "\n")
+            self.current = None
+
+
+# one recorder per process, shared by the conftest hooks and the driver factory
+RECORDER = MetricsRecorder()
+
+
+def record_command(command, params, duration):
+    """
+    Module-level listener forwarding WebDriver commands to RECORDER.
+    """
+    RECORDER.on_command(command, params, duration)
+
+
+def clear_metrics(metrics_dir: Path):
+    """
+    Removes per-worker metrics files left by a previous run.
+    """
+    for path in metrics_dir.glob(METRICS_FILE_PATTERN):
+        path.unlink()
+
+
+def load_metrics(metrics_dir: Path):
+    """
+    Reads all per-worker metrics files.
+
+    Returns:
+        list[dict]: One record per test.
+    """
+    records = []
+    for path in sorted(metrics_dir.glob(METRICS_FILE_PATTERN)):
+        with open(path) as metrics_file:
+            records.extend(json.loads(line) for line in metrics_file if line.strip())
+    return records
+
+
+def summarize(records, top: int = 10):
+    """
+    Builds the end-of-session summary: totals plus the slowest tests and fixtures.
+
+    Args:
+        records (list[dict]): Records returned by load_metrics().
+        top (int): Number of entries kept in each ranking.
+
+    Returns:
+        dict: JSON-serializable summary.
+    """
+    fixtures = {}
+    for record in records:
+        for name, duration in record["fixtures"].items():
+            stats = fixtures.setdefault(name, {"fixture": name, "count": 0, "total": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+    for stats in fixtures.values():
+        stats["mean"] = round(stats["total"] / stats["count"], 4)
+        stats["total"] = round(stats["total"], 4)
+
+    keys = ("setup", "call", "teardown", "total", "webdriver_s", "python_s")
+    return {
+        "tests": len(records),
+        "workers": sorted({record["worker"] for record in records}),
+        "totals": {key: round(sum(record[key] for record in records), 3) for key in keys}
+        | {
+            "commands": sum(record["commands"] for record in records),
+            "page_loads": sum(record["page_loads"] for record in records),
+        },
+        "slowest_tests": sorted(records, key=lambda record: record["total"], reverse=True)[:top],
+        "slowest_fixtures": sorted(fixtures.values(), key=lambda stats: stats["total"], reverse=True)[:top],
+    }
+
+
+def write_summary(metrics_dir: Path, summary: dict):
+    """
+    Writes the merged summary next to the per-worker files.
+
+    Returns:
+        Path: Location of the summary file.
+    """
+    path = metrics_dir / SUMMARY_FILE
+    with open(path, "w") as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    return path
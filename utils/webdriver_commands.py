@@ -0,0 +1,95 @@
+import time
+from contextlib import contextmanager
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def instrument(driver: WebDriver):
+    """
+    Wraps driver.execute so every WebDriver command (driver and element level) is reported to listeners.
+
+    Safe to call more than once; the wrapper is installed only the first time.
+    Listeners are called as listener(command, params, duration) after each command,
+    where duration is the wall-clock time of the round trip in seconds.
+
+    Args:
+        driver (WebDriver): The driver to be instrumented.
+
+    Returns:
+        WebDriver: The same driver instance.
+    """
+    if hasattr(driver, "_command_listeners"):
+        return driver
+
+    listeners = []
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return original_execute(driver_command, params)
+        finally:
+            duration = time.perf_counter() - start
+            for listener in list(listeners):
+                listener(driver_command, params, duration)
+
+    # instance attribute shadows WebDriver.execute; WebElement calls go through parent.execute too
+    driver.execute = execute
+    driver._command_listeners = listeners
+    return driver
+
+
+def add_listener(driver: WebDriver, listener):
+    """
+    Registers a command listener on the driver (instrumenting it if needed).
+    """
+    instrument(driver)._command_listeners.append(listener)
+
+
+def remove_listener(driver: WebDriver, listener):
+    """
+    Unregisters a command listener previously added with add_listener().
+    """
+    driver._command_listeners.remove(listener)
+
+
+class CommandCounter:
+    """
+    Collects the names of WebDriver commands issued while it is registered.
+
+    Attributes:
+        commands (list[str]): Command names in the order they were sent (e.g. "findElements", "executeScript").
+    """
+
+    def __init__(self):
+        self.commands = []
+
+    def __call__(self, command, params, duration):
+        self.commands.append(command)
+
+    @property
+    def count(self):
+        """
+        Returns the number of commands recorded.
+        """
+        return len(self.commands)
+
+
+@contextmanager
+def count_commands(driver: WebDriver):
+    """
+    Context manager counting WebDriver round trips made inside the block.
+
+    Example:
+        with count_commands(driver) as counter:
+            products_page.capture_all_products_name()
+        assert counter.count == 1
+
+    Yields:
+        CommandCounter: Counter filled while the block runs.
+    """
+    counter = CommandCounter()
+    add_listener(driver, counter)
+    try:
+        yield counter
+    finally:
+        remove_listener(driver, counter)